@@ -1,10 +1,22 @@
 #!/usr/bin/env python3
-''' Custom statusline for Claude Code showing token usage. '''
+''' Custom statusline for Claude Code showing token usage.
 
-from json import loads as _json_loads
-from os import environ as _environ
-from pathlib import Path
-from sys import stdin as _stdin
+    Executed as a fresh interpreter on every status refresh, so startup
+    dominates its cost. Only modules which the interpreter has already
+    loaded at startup (os, sys) are imported eagerly; JSON decoding uses
+    the C scanner directly and the Git metadata cache is encoded by a
+    small renderer, to avoid importing the json package and its regular
+    expression machinery. Run with ``--benchmark`` to report the cost of
+    each phase.
+
+    Run with ``--serve`` to keep this logic warm in a daemon listening on a
+    per-user Unix socket. When the socket is present, the script merely
+    forwards its input to the daemon and prints the response; otherwise,
+    it computes the status line in process.
+'''
+
+import os as _os
+import sys as _sys
 
 
 TOKEN_THRESHOLD_LOW = 50
@@ -16,57 +28,246 @@ TOKEN_THRESHOLD_HIGH = 75
 # so the effective usable fraction equals override / 100.
 _DEFAULT_AUTOCOMPACT_BUFFER_PCT = 16.5
 
+# Git metadata cache, keyed by working directory. Entries are validated by
+# modification times of .git and HEAD, so that steady-state refreshes cost
+# a cache read and two stats rather than a directory walk. Directories
+# outside of repositories are validated by modification times of their
+# ancestors, which change when a .git entry appears in any of them.
+_GIT_CACHE_ENTRIES_MAXIMUM = 64
+_GIT_CACHE_NAME = 'statusline-git.json'
+
+_SOCKET_NAME = 'statusline.sock'
+_SOCKET_TIMEOUT = 0.5
+_RECEPTION_SIZE = 65536
+
+# Git metadata cache held in memory by the daemon, in place of the file.
+_resident_git_cache: dict[ str, dict[ str, object ] ] | None = None
+
+_BENCHMARK_ITERATIONS = 200
+
+
+class _ScannerContext:
+    ''' Decoding options expected by the C JSON scanner. '''
+
+    strict = True
+    object_hook = None
+    object_pairs_hook = None
+    parse_float = float
+    parse_int = int
+    parse_constant = float
+
+
+def _parse_json( text: str ) -> object:
+    ''' Parses JSON document, preferring the C scanner. '''
+    try: from _json import make_scanner
+    except ImportError:
+        from json import loads
+        return loads( text )
+    text = text.strip( )
+    try: value, _ = make_scanner( _ScannerContext )( text, 0 )
+    except StopIteration as exception:
+        message = f"Invalid JSON at offset {exception.value}."
+        raise ValueError( message ) from None
+    return value
+
 
 def _abbreviate_home_in_path( path: str ) -> str:
     ''' Replaces home directory prefix with tilde. '''
-    home = str( Path.home( ) )
+    home = _os.path.expanduser( '~' )
     if path.startswith( home ): return '~' + path[ len( home ): ]
     return path
 
 
 def _detect_git_branch( cwd: str ) -> str | None:
+    ''' Detects current Git branch, consulting metadata cache first. '''
+    cache = _resident_git_cache
+    cache_file = None if cache is not None else _locate_git_cache_file( )
+    if cache is None:
+        cache = _load_git_cache( cache_file ) if cache_file else { }
+    entry = cache.get( cwd )
+    if entry is not None and _is_git_cache_entry_current( entry ):
+        return entry[ 'branch' ]
+    entry = _survey_git_branch( cwd )
+    if entry is None: return None
+    cache.pop( cwd, None )
+    cache[ cwd ] = entry
+    if len( cache ) > _GIT_CACHE_ENTRIES_MAXIMUM:
+        del cache[ next( iter( cache ) ) ]
+    if cache_file: _save_git_cache( cache_file, cache )
+    return entry[ 'branch' ]
+
+
+def _survey_git_branch( cwd: str ) -> dict[ str, object ] | None:
     ''' Detects current Git branch by parsing .git/HEAD.
 
         Handles both regular repositories and worktrees. In worktrees,
         .git is a file containing a gitdir reference rather than a directory.
+        Returns cache entry with branch and validating modification times;
+        outside of repositories, the branch is None and the ancestors
+        searched validate the entry. Returns None if the repository cannot
+        be interpreted.
     '''
-    search_dir = Path( cwd ).resolve( ) if cwd != '~' else Path.home( )
-    while search_dir != search_dir.parent:
-        git_path = search_dir / '.git'
-        if git_path.exists( ):
+    search_dir = _os.path.realpath( _os.path.expanduser( cwd ) )
+    parent = _os.path.dirname( search_dir )
+    ancestors: list[ list[ object ] ] = [ ]
+    while search_dir != parent:
+        try: mtime = _os.stat( search_dir ).st_mtime_ns
+        except OSError: return None
+        ancestors.append( [ search_dir, mtime ] )
+        git_path = _os.path.join( search_dir, '.git' )
+        if _os.path.exists( git_path ):
             git_dir = _resolve_git_directory( git_path )
             if git_dir is None: return None
-            return _read_branch_from_head( git_dir / 'HEAD' )
-        search_dir = search_dir.parent
-    return None
+            head_path = _os.path.join( git_dir, 'HEAD' )
+            try:
+                git_mtime = _os.stat( git_path ).st_mtime_ns
+                head_mtime = _os.stat( head_path ).st_mtime_ns
+            except OSError: return None
+            branch = _read_branch_from_head( head_path )
+            if branch is None: return None
+            return {
+                'git': git_path, 'git_mtime': git_mtime,
+                'head': head_path, 'head_mtime': head_mtime,
+                'branch': branch }
+        search_dir, parent = parent, _os.path.dirname( parent )
+    return { 'ancestors': ancestors, 'branch': None }
+
+
+def _locate_git_cache_file( ) -> str | None:
+    ''' Locates per-user Git metadata cache file. '''
+    directory = _locate_private_directory( )
+    if directory is None: return None
+    return _os.path.join( directory, _GIT_CACHE_NAME )
+
+
+def _locate_private_directory( ) -> str | None:
+    ''' Locates per-user directory in runtime or temporary directory.
+
+        The directory need not exist yet. Returns None if it exists but
+        belongs to another user or cannot be inspected.
+    '''
+    runtime = _os.environ.get( 'XDG_RUNTIME_DIR' )
+    if runtime and _os.path.isdir( runtime ):
+        directory = _os.path.join( runtime, 'agentsmgr' )
+    else:
+        user = _os.getuid( ) if hasattr( _os, 'getuid' ) else 'user'
+        directory = _os.path.join(
+            _os.environ.get( 'TMPDIR', '/tmp' ), f"agentsmgr-{user}" )
+    try: status = _os.stat( directory )
+    except FileNotFoundError: pass
+    except OSError: return None
+    else:
+        if hasattr( _os, 'getuid' ) and status.st_uid != _os.getuid( ):
+            return None
+    return directory
+
+
+def _load_git_cache( cache_file: str ) -> dict[ str, dict[ str, object ] ]:
+    try:
+        with open( cache_file, encoding = 'utf-8' ) as stream:
+            cache = _parse_json( stream.read( ) )
+    except ( OSError, ValueError ): return { }
+    return cache if isinstance( cache, dict ) else { }
+
+
+def _is_git_cache_entry_current( entry: dict[ str, object ] ) -> bool:
+    ''' Checks cache entry against modification times of .git and HEAD.
+
+        Entries for directories outside of repositories are checked
+        against modification times of the ancestors searched instead.
+    '''
+    try:
+        if 'ancestors' in entry:
+            return all(
+                _os.stat( path ).st_mtime_ns == mtime
+                for path, mtime in entry[ 'ancestors' ] )
+        return (
+                _os.stat( entry[ 'head' ] ).st_mtime_ns == entry[ 'head_mtime' ]
+            and _os.stat( entry[ 'git' ] ).st_mtime_ns == entry[ 'git_mtime' ] )
+    except ( OSError, KeyError, TypeError, ValueError ): return False
+
+
+def _save_git_cache(
+    cache_file: str, cache: dict[ str, dict[ str, object ] ]
+) -> None:
+    ''' Saves cache atomically, evicting oldest entries beyond maximum. '''
+    entries = list( cache.items( ) )[ - _GIT_CACHE_ENTRIES_MAXIMUM : ]
+    temporary = f"{cache_file}.{_os.getpid( )}"
+    try:
+        _os.makedirs(
+            _os.path.dirname( cache_file ), mode = 0o700, exist_ok = True )
+        with open( temporary, 'w', encoding = 'utf-8' ) as stream:
+            stream.write( _render_json( dict( entries ) ) )
+        _os.replace( temporary, cache_file )
+    except OSError:
+        try: _os.unlink( temporary )
+        except OSError: pass
+
 
+def _render_json( value: object ) -> str:
+    ''' Renders cache as JSON without importing the json package.
 
-def _resolve_git_directory( git_path: Path ) -> Path | None:
+        Supports only the shapes which cache entries take: objects, lists,
+        strings, integers, and null.
+    '''
+    if value is None: return 'null'
+    if isinstance( value, str ): return _render_json_string( value )
+    if isinstance( value, int ) and not isinstance( value, bool ):
+        return str( value )
+    if isinstance( value, list ):
+        return '[' + ', '.join( map( _render_json, value ) ) + ']'
+    if isinstance( value, dict ):
+        return '{' + ', '.join(
+            f"{_render_json_string( str( key ) )}: {_render_json( item )}"
+            for key, item in value.items( ) ) + '}'
+    message = f"Cannot render {type( value ).__name__} as JSON."
+    raise TypeError( message )
+
+
+def _render_json_string( text: str ) -> str:
+    ''' Renders string as JSON string literal.
+
+        Escapes quotes, backslashes, control characters, and the lone
+        surrogates with which undecodable path bytes are represented.
+    '''
+    characters: list[ str ] = [ ]
+    for character in text:
+        if character in '"\\': characters.append( '\\' + character )
+        elif character < ' ' or '\ud800' <= character <= '\udfff':
+            characters.append( f"\\u{ord( character ):04x}" )
+        else: characters.append( character )
+    return '"' + ''.join( characters ) + '"'
+
+
+def _resolve_git_directory( git_path: str ) -> str | None:
     ''' Resolves actual git directory, handling worktrees.
 
         For regular repos, .git is a directory containing HEAD.
         For worktrees, .git is a file with "gitdir: <path>" content.
     '''
-    if git_path.is_dir( ):
+    if _os.path.isdir( git_path ):
         return git_path
     # Worktree: .git is a file containing gitdir reference
     try:
-        content = git_path.read_text( ).strip( )
+        with open( git_path, encoding = 'utf-8' ) as stream:
+            content = stream.read( ).strip( )
     except ( OSError, IOError ):
         return None
     if content.startswith( 'gitdir: ' ):
         gitdir_path = content[ len( 'gitdir: ' ): ]
-        resolved = Path( gitdir_path )
-        if not resolved.is_absolute( ):
-            resolved = ( git_path.parent / gitdir_path ).resolve( )
-        return resolved if resolved.is_dir( ) else None
+        resolved = gitdir_path
+        if not _os.path.isabs( resolved ):
+            resolved = _os.path.realpath(
+                _os.path.join( _os.path.dirname( git_path ), gitdir_path ) )
+        return resolved if _os.path.isdir( resolved ) else None
     return None
 
 
-def _read_branch_from_head( head_path: Path ) -> str | None:
+def _read_branch_from_head( head_path: str ) -> str | None:
     ''' Reads branch name from HEAD file. '''
     try:
-        content = head_path.read_text( ).strip( )
+        with open( head_path, encoding = 'utf-8' ) as stream:
+            content = stream.read( ).strip( )
         if content.startswith( 'ref: refs/heads/' ):
             return content[ len( 'ref: refs/heads/' ): ]
         return f"detached@{content[:7]}"
@@ -74,7 +275,9 @@ def _read_branch_from_head( head_path: Path ) -> str | None:
         return None
 
 
-def _adjust_for_autocompact_buffer( used_percentage: float ) -> float:
+def _adjust_for_autocompact_buffer(
+    used_percentage: float, override: str | None = None
+) -> float:
     ''' Renormalizes raw context percentage against the effective window.
 
         The API's used_percentage is calculated against the full model context
@@ -82,8 +285,10 @@ def _adjust_for_autocompact_buffer( used_percentage: float ) -> float:
         window, making the effective usable window smaller. This function
         scales the raw percentage to reflect the fraction of the usable window
         consumed, matching the built-in Claude Code status display.
+        Override defaults to the CLAUDE_AUTOCOMPACT_PCT_OVERRIDE variable.
     '''
-    override = _environ.get( 'CLAUDE_AUTOCOMPACT_PCT_OVERRIDE' )
+    if override is None:
+        override = _os.environ.get( 'CLAUDE_AUTOCOMPACT_PCT_OVERRIDE' )
     if override is not None:
         try: effective_fraction = float( override ) / 100
         except ValueError:
@@ -113,18 +318,157 @@ def _format_status(
     return ' | '.join( sections )
 
 
-def main( ) -> None:
-    ''' Displays token usage from context_window and current directory. '''
-    input_data = _json_loads( _stdin.read( ) )
-    cwd = _abbreviate_home_in_path( input_data.get( 'cwd', '~' ) )
-    branch = _detect_git_branch( input_data.get( 'cwd', '~' ) )
-    context_window = input_data.get( 'context_window', { } )
+def _produce_status(
+    input_data: dict[ str, object ], override: str | None = None
+) -> str:
+    ''' Produces status line from decoded hook input. '''
+    cwd = input_data.get( 'cwd', '~' )
+    branch = _detect_git_branch( cwd )
+    context_window = input_data.get( 'context_window' ) or { }
     used_percentage = context_window.get( 'used_percentage' )
     if used_percentage is not None:
-        used_percentage = _adjust_for_autocompact_buffer( used_percentage )
-    model_info = input_data.get( 'model', { } )
+        used_percentage = _adjust_for_autocompact_buffer(
+            used_percentage, override )
+    model_info = input_data.get( 'model' ) or { }
     model_name = model_info.get( 'display_name' )
-    status = _format_status( cwd, branch, used_percentage, model_name )
+    return _format_status(
+        _abbreviate_home_in_path( cwd ), branch, used_percentage, model_name )
+
+
+def _benchmark( text: str ) -> None:
+    ''' Reports first and mean cost of each phase on standard error.
+
+        Interpreter startup is not included; measure it with
+        ``python -X importtime``. The daemon round trip is included when a
+        daemon is listening.
+    '''
+    from time import perf_counter_ns
+    input_data = _parse_json( text )
+    cwd = input_data.get( 'cwd', '~' )
+    phases = [
+        ( 'parse', lambda: _parse_json( text ) ),
+        ( 'git', lambda: _detect_git_branch( cwd ) ),
+        ( 'format', lambda: _produce_status( input_data ) ),
+    ]
+    if _request_status( text ) is not None:
+        phases.append( ( 'daemon', lambda: _request_status( text ) ) )
+    for name, phase in phases:
+        durations: list[ int ] = [ ]
+        for _ in range( _BENCHMARK_ITERATIONS ):
+            start = perf_counter_ns( )
+            phase( )
+            durations.append( perf_counter_ns( ) - start )
+        mean = sum( durations ) / len( durations )
+        print(
+            f"{name:<8} first {durations[ 0 ] / 1000:8.1f} µs"
+            f"  mean {mean / 1000:8.1f} µs",
+            file = _sys.stderr )
+
+
+def _request_status( text: str ) -> str | None:
+    ''' Requests status line from daemon, if one is listening.
+
+        Forwards the autocompact override of this process on the first
+        line, followed by the hook input. Returns None if no daemon
+        answers, so that the caller can compute the status line itself.
+    '''
+    directory = _locate_private_directory( )
+    if directory is None: return None
+    # The C socket module avoids the enum machinery of the socket package.
+    try: import _socket
+    except ImportError: return None
+    family = getattr( _socket, 'AF_UNIX', None )
+    if family is None: return None
+    override = _os.environ.get( 'CLAUDE_AUTOCOMPACT_PCT_OVERRIDE', '' )
+    request = f"{override}\n{text}".encode( )
+    try: connection = _socket.socket( family, _socket.SOCK_STREAM )
+    except OSError: return None
+    try:
+        connection.settimeout( _SOCKET_TIMEOUT )
+        connection.connect( _os.path.join( directory, _SOCKET_NAME ) )
+        connection.sendall( request )
+        connection.shutdown( _socket.SHUT_WR )
+        chunks: list[ bytes ] = [ ]
+        while chunk := connection.recv( _RECEPTION_SIZE ):
+            chunks.append( chunk )
+    except OSError: return None
+    finally: connection.close( )
+    if not chunks: return None
+    return b''.join( chunks ).decode( )
+
+
+def _serve( ) -> None:
+    ''' Serves status line requests on per-user Unix socket until killed.
+
+        Git metadata is cached in memory rather than in the cache file.
+        Refuses to start if another daemon is already listening.
+    '''
+    import signal
+    import socket
+    global _resident_git_cache
+    if not hasattr( socket, 'AF_UNIX' ):
+        raise RuntimeError(
+            "Statusline daemon is unsupported on this platform: "
+            "no Unix domain sockets." )
+    directory = _locate_private_directory( )
+    if directory is None:
+        raise RuntimeError( "No private runtime directory available." )
+    if _request_status( '{}' ) is not None:
+        raise RuntimeError( "Statusline daemon is already running." )
+    _os.makedirs( directory, mode = 0o700, exist_ok = True )
+    path = _os.path.join( directory, _SOCKET_NAME )
+    try: _os.unlink( path )
+    except FileNotFoundError: pass
+    _resident_git_cache = { }
+    server = socket.socket( socket.AF_UNIX, socket.SOCK_STREAM )
+    server.bind( path )
+    _os.chmod( path, 0o600 )
+    server.listen( )
+    signal.signal( signal.SIGTERM, lambda *_: _sys.exit( 0 ) )
+    try:
+        while True:
+            connection, _ = server.accept( )
+            with connection: _serve_connection( connection )
+    except KeyboardInterrupt: pass
+    finally:
+        server.close( )
+        try: _os.unlink( path )
+        except OSError: pass
+
+
+def _serve_connection( connection: 'socket.socket' ) -> None:
+    ''' Answers one request; failures are reported in the response. '''
+    connection.settimeout( _SOCKET_TIMEOUT )
+    try:
+        chunks: list[ bytes ] = [ ]
+        while chunk := connection.recv( _RECEPTION_SIZE ):
+            chunks.append( chunk )
+        override, _, text = b''.join( chunks ).decode( ).partition( '\n' )
+        input_data = _parse_json( text )
+        status = _produce_status( input_data, override or None )
+    except OSError: return
+    except Exception as exc:
+        status = f"⚠️ {exc}"
+    try: connection.sendall( status.encode( ) )
+    except OSError: pass
+
+
+def main( ) -> None:
+    ''' Displays token usage from context_window and current directory. '''
+    if '--serve' in _sys.argv[ 1: ]:
+        _serve( )
+        return
+    if '--benchmark' in _sys.argv[ 1: ]:
+        text = '' if _sys.stdin.isatty( ) else _sys.stdin.read( )
+        if not text:
+            cwd = _os.getcwd( )
+            cwd = cwd.replace( '\\', '\\\\' ).replace( '"', '\\"' )
+            text = f'{{"cwd": "{cwd}"}}'
+        _benchmark( text )
+        return
+    text = _sys.stdin.read( )
+    status = _request_status( text )
+    if status is None: status = _produce_status( _parse_json( text ) )
     print( status, end = '' )
 
 
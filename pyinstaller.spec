@@ -24,7 +24,8 @@ a = Analysis(
         ('data', 'data'),
         # --- END: Injected by Copier ---
     ],
-    hiddenimports = [ ],
+    # Source handlers imported by name on first use of their schemes.
+    hiddenimports = [ 'agentsmgr.sources.git' ],
     hookspath = [ ],
     hooksconfig = { },
     runtime_hooks = [ ],
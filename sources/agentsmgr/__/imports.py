@@ -39,12 +39,11 @@ import                      tempfile
 import                      types
 import urllib.error as      urlerr
 import urllib.parse as      urlparse
-import urllib.request as    urlreq
 
 from fnmatch import fnmatch
 from logging import getLogger as provide_scribe
 from packaging.version import InvalidVersion, Version
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 
 
 import accretive as         accret
@@ -59,7 +58,6 @@ import frigid as            immut
 import                      tyro
 # --- END: Injected by Copier ---
 
-from appcore import cli as appcore_cli
 # --- BEGIN: Injected by Copier ---
 from absence import Absential, absent, is_absent
 # --- END: Injected by Copier ---
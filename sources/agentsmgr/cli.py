@@ -21,13 +21,51 @@
 ''' Command-line interface. '''
 
 
+from appcore import cli as _appcore_cli
+
 from . import __
+from . import cmdbase as _cmdbase
 from . import core as _core
 from . import detection as _detection
+from . import events as _events
+from . import exceptions as _exceptions
 from . import population as _population
+from . import profiling as _profiling
+from . import sources as _sources
+from . import timings as _timings
+
+
+class ServeCommand( _appcore_cli.Command ):
+    ''' Serves detect, generate, check, and populate as JSON-RPC.
+
+        Reads one JSON-RPC 2.0 request per line and writes one response
+        per line. Keeps resolved sources, generators, configurations, and
+        staleness check results warm across requests. Stops at end of
+        input or upon ``shutdown`` request. The server module is imported
+        only when serving, so that other commands do not pay for it.
+    '''
+
+    socket: __.typx.Annotated[
+        __.typx.Optional[ __.Path ],
+        __.tyro.conf.arg(
+            help = (
+                "Unix socket on which to listen, rather than standard "
+                "input and output." ),
+            prefix_name = False ),
+    ] = None
+
+    @_cmdbase.intercept_errors( )
+    async def execute( self, auxdata: __.appcore.state.Globals ) -> None:  # pyright: ignore[reportIncompatibleMethodOverride]
+        ''' Serves requests until shutdown. '''
+        if not isinstance( auxdata, _core.Globals ):  # pragma: no cover
+            raise _exceptions.ContextInvalidity
+        from . import server as _server
+        server = _server.Server( _server.ServerState( auxdata.configuration ) )
+        if self.socket is None: await server.serve_stdio( )
+        else: await server.serve_socket( self.socket )
 
 
-class Application( __.appcore_cli.Application ):
+class Application( _appcore_cli.Application ):
     ''' Agents configuration management CLI. '''
 
     version: __.typx.Annotated[
@@ -36,6 +74,48 @@ class Application( __.appcore_cli.Application ):
             help = "Print package version and exit." ),
         __.tyro.conf.FlagCreatePairsOff,
     ] = False
+    timings: __.typx.Annotated[
+        bool,
+        __.tyro.conf.arg(
+            help = "Print phase timings and counters to stderr." ),
+        __.tyro.conf.FlagCreatePairsOff,
+    ] = False
+    timings_file: __.typx.Annotated[
+        __.typx.Optional[ __.Path ],
+        __.tyro.conf.arg( help = "Write phase timings to file." ),
+    ] = None
+    timings_format: __.typx.Annotated[
+        _timings.TimingsFormats,
+        __.tyro.conf.arg( help = "Format of phase timings file." ),
+    ] = _timings.TimingsFormats.Json
+    cprofile: __.typx.Annotated[
+        __.typx.Optional[ __.Path ],
+        __.tyro.conf.arg(
+            help = (
+                "Profile command with cProfile, write statistics to file, "
+                "and print top entries to stderr. Unrelated to the "
+                "'--profile' answers file option of populate commands." ) ),
+    ] = None
+    cprofile_entries: __.typx.Annotated[
+        int,
+        __.tyro.conf.arg(
+            help = "Number of cProfile entries to print to stderr." ),
+    ] = 25
+    progress: __.typx.Annotated[
+        bool,
+        __.tyro.conf.arg(
+            help = (
+                "Display running counts of rendered, written, skipped, "
+                "and linked items on stderr, when it is a terminal." ) ),
+        __.tyro.conf.FlagCreatePairsOff,
+    ] = False
+    manifest: __.typx.Annotated[
+        __.typx.Optional[ __.Path ],
+        __.tyro.conf.arg(
+            help = (
+                "Write manifest of written, skipped, pruned, and linked "
+                "items, with sizes and hashes, to file." ) ),
+    ] = None
     display: _core.DisplayOptions = __.dcls.field(
         default_factory = _core.DisplayOptions )
     command: __.typx.Union[
@@ -51,6 +131,10 @@ class Application( __.appcore_cli.Application ):
             _population.PopulateCommand,
             __.tyro.conf.subcommand( 'populate', prefix_name = False ),
         ],
+        __.typx.Annotated[
+            ServeCommand,
+            __.tyro.conf.subcommand( 'serve', prefix_name = False ),
+        ],
     ] = __.dcls.field( default_factory = _detection.DetectCommand )
 
     async def __call__( self ) -> None:
@@ -62,7 +146,27 @@ class Application( __.appcore_cli.Application ):
         await super( ).__call__( )
 
     async def execute( self, auxdata: _core.Globals ) -> None:  # pyright: ignore[reportIncompatibleMethodOverride]
-        await self.command( auxdata )
+        async with _core.streaming_events( auxdata.display, auxdata.exits ):
+            with (
+                _core.displaying_progress( self.progress ),
+                self._recording_manifest( ),
+                _sources.caching( auxdata.provide_cache_location( ) ),
+            ):
+                if self.cprofile is None:
+                    await self._execute_with_timings( auxdata )
+                    return
+                with _profiling.profiling(
+                    self.cprofile, self.cprofile_entries
+                ): await self._execute_with_timings( auxdata )
+
+    async def _execute_with_timings( self, auxdata: _core.Globals ) -> None:
+        if not self.timings and self.timings_file is None:
+            await self.command( auxdata )
+            return
+        with _timings.recording( ) as recorder:
+            try:
+                with _timings.span( 'command' ): await self.command( auxdata )
+            finally: self._report_timings( recorder )
 
     async def prepare( self, exits: __.ctxl.AsyncExitStack ) -> _core.Globals:
         auxdata_base = await super( ).prepare( exits )
@@ -72,6 +176,38 @@ class Application( __.appcore_cli.Application ):
             if not field.name.startswith( '_' ) }
         return _core.Globals( display = self.display, **nomargs )
 
+    @__.ctxl.contextmanager
+    def _recording_manifest( self ) -> __.cabc.Iterator[ None ]:
+        ''' Records item events and writes manifest, as requested.
+
+            Manifest is written even if command fails, so that it
+            accounts for changes made before failure.
+        '''
+        if self.manifest is None:
+            yield
+            return
+        manifest = _events.Manifest( )
+        try:
+            with _events.receiving( manifest ): yield
+        finally:
+            self.manifest.write_text(
+                __.json.dumps( manifest.render_as_json( ), indent = 2 ),
+                encoding = 'utf-8' )
+
+    def _report_timings( self, recorder: _timings.Recorder ) -> None:
+        ''' Prints phase timings and writes them to file, as requested. '''
+        if self.timings:
+            for line in recorder.render_as_text( ):
+                print( line, file = __.sys.stderr )
+        if self.timings_file is None: return
+        match self.timings_format:
+            case _timings.TimingsFormats.Json:
+                data = recorder.render_as_json( )
+            case _timings.TimingsFormats.ChromeTrace:
+                data = recorder.render_as_chrome_trace( )
+        self.timings_file.write_text(
+            __.json.dumps( data, indent = 2 ), encoding = 'utf-8' )
+
 
 def execute( ) -> None:
     ''' Entrypoint for CLI execution. '''
@@ -26,13 +26,12 @@
 '''
 
 
-import yaml as _yaml
-
 from . import __
 from . import core as _core
 from . import exceptions as _exceptions
 from . import nomina as _nomina
 from . import sources as _sources
+from . import timings as _timings
 
 
 CoderConfiguration: __.typx.TypeAlias = __.cabc.Mapping[ str, __.typx.Any ]
@@ -92,6 +91,11 @@ def intercept_errors( ) -> __.cabc.Callable[
     return decorator
 
 
+def calculate_answers_location( target: __.Path ) -> __.Path:
+    ''' Calculates standard Copier answers file location for target. '''
+    return target / ".auxiliary/configuration/copier-answers--agents.yaml"
+
+
 async def retrieve_configuration(
     target: __.Path,
     profile: __.typx.Optional[ __.Path ] = None,
@@ -102,11 +106,19 @@ async def retrieve_configuration(
         implementations. Reads from standard Copier answers location
         (or specified profile path) and validates required fields.
     '''
-    if profile is not None:
-        answers_file = profile
-    else:
-        answers_file = (
-            target / ".auxiliary/configuration/copier-answers--agents.yaml" )
+    with _timings.span( 'configuration' ):
+        configuration = _load_configuration( target, profile )
+    await validate_configuration( configuration )
+    return configuration
+
+
+def _load_configuration(
+    target: __.Path,
+    profile: __.typx.Optional[ __.Path ],
+) -> __.cabc.Mapping[ str, __.typx.Any ]:
+    import yaml as _yaml
+    if profile is not None: answers_file = profile
+    else: answers_file = calculate_answers_location( target )
     if not answers_file.exists( ):
         raise _exceptions.ConfigurationAbsence( target )
     try: content = answers_file.read_text( encoding = 'utf-8' )
@@ -119,7 +131,6 @@ async def retrieve_configuration(
         raise _exceptions.ConfigurationInvalidity( exception ) from exception
     if not isinstance( configuration, __.cabc.Mapping ):
         raise _exceptions.ConfigurationInvalidity( )
-    await validate_configuration( configuration )
     return configuration
 
 
@@ -143,7 +154,8 @@ def retrieve_data_location(
         pluggable source handlers. Uses registered handlers to resolve
         various URL schemes to local filesystem paths.
     '''
-    return _sources.resolve_source_location( source_spec, tag_prefix )
+    with _timings.span( 'source-resolution' ):
+        return _sources.resolve_source_location( source_spec, tag_prefix )
 
 
 def validate_data_source_structure(
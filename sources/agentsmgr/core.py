@@ -21,28 +21,100 @@
 ''' Core types and interfaces for agentsmgr. '''
 
 
+import threading as _threading
+import time as _time
+import weakref as _weakref
+
+from appcore import cli as _appcore_cli
+
 from . import __
+from . import events as _events
 
 
 class Renderable( __.typx.Protocol ):
-    ''' Protocol for objects that can be rendered as Markdown. '''
+    ''' Protocol for objects that can be rendered as Markdown or JSON. '''
 
     def render_as_markdown( self ) -> tuple[ str, ... ]:
         ''' Renders object as Markdown lines for display. '''
         ...
 
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders object as JSON-compatible record. '''
+        ...
+
 
 class Presentations( __.enum.Enum ):
-    ''' Enumeration for CLI display presentation formats. '''
+    ''' Enumeration for CLI display presentation formats.
+
+        JSON presents command output as one document, listing results
+        under ``results`` when a command has several. NDJSON presents one
+        compact record per line: per-item events as they occur, followed
+        by the result.
+    '''
 
     Markdown = 'markdown'
+    Json = 'json'
+    Ndjson = 'ndjson'
 
 
-class DisplayOptions( __.appcore_cli.DisplayOptions ):
+class DisplayOptions( _appcore_cli.DisplayOptions ):
     ''' Consolidated display configuration for CLI output. '''
 
     presentation: Presentations = Presentations.Markdown
 
+    async def provide_stream(
+        self, exits: __.ctxl.AsyncExitStack
+    ) -> __.typx.TextIO:
+        ''' Provides target stream from options.
+
+            Target file is opened once per exit stack, so that successive
+            results and events append to it rather than replace it.
+        '''
+        streams = _streams.setdefault( exits, { } )
+        if self.target_file not in streams:
+            streams[ self.target_file ] = (
+                await super( ).provide_stream( exits ) )
+        return streams[ self.target_file ]
+
+
+class ProgressDisplay:
+    ''' Displays running counts of item events on terminal status line.
+
+        Redraws at most once per interval, so that displaying progress
+        costs little even when many small items are processed.
+    '''
+
+    def __init__(
+        self, stream: __.typx.TextIO, interval: float = 0.1
+    ) -> None:
+        self.stream = stream
+        self.interval = interval
+        self.counts: dict[ str, int ] = { }
+        self._drawn = 0.0
+        self._lock = _threading.Lock( )
+
+    def __call__( self, event: _events.Event ) -> None:
+        if not isinstance( event, _events.ItemEvent ): return
+        with self._lock:
+            action = event.action
+            self.counts[ action ] = self.counts.get( action, 0 ) + 1
+            moment = _time.monotonic( )
+            if moment - self._drawn < self.interval: return
+            self._drawn = moment
+            summary = ', '.join(
+                f"{action} {count}" for action, count in self.counts.items( ) )
+            width = __.shutil.get_terminal_size( ).columns - 1
+            line = f"{summary}: {event.location.name}"[ : width ]
+            self.stream.write( f"\r\x1b[K{line}" )
+            self.stream.flush( )
+
+    def conclude( self ) -> None:
+        ''' Clears status line. '''
+        with self._lock:
+            if not self._drawn: return
+            self.stream.write( '\r\x1b[K' )
+            self.stream.flush( )
+
 
 class Globals( __.appcore.state.Globals ):
     ''' Agentsmgr-specific global state container.
@@ -54,6 +126,12 @@ class Globals( __.appcore.state.Globals ):
     display: DisplayOptions = __.dcls.field( default_factory = DisplayOptions )
 
 
+_streams: _weakref.WeakKeyDictionary[
+    __.ctxl.AsyncExitStack,
+    dict[ __.typx.Optional[ __.Path ], __.typx.TextIO ],
+] = _weakref.WeakKeyDictionary( )
+
+
 _ASCII_SYMBOL_REPLACEMENTS = __.immut.Dictionary( {
     '✅': '[OK]',
     '❌': '[ERROR]',
@@ -95,20 +173,90 @@ async def render_and_print_result(
     display: DisplayOptions,
     exits: __.ctxl.AsyncExitStack,
 ) -> None:
-    ''' Centralizes result rendering logic with Rich formatting support. '''
+    ''' Centralizes result rendering logic with Rich formatting support.
+
+        JSON and NDJSON presentations bypass Rich entirely.
+    '''
     stream = await display.provide_stream( exits )
     match display.presentation:
+        case Presentations.Json:
+            print(
+                __.json.dumps( result.render_as_json( ), indent = 2 ),
+                file = stream )
+        case Presentations.Ndjson:
+            print( __.json.dumps( result.render_as_json( ) ), file = stream )
         case Presentations.Markdown:
-            lines = result.render_as_markdown( )
-            supports_unicode = _stream_supports_unicode( stream )
-            if supports_unicode and display.determine_colorization( stream ):
-                from rich.console import Console
-                from rich.markdown import Markdown
-                console = Console( file = stream, force_terminal = True )
-                markdown_obj = Markdown( '\n'.join( lines ) )
-                console.print( markdown_obj )
-            else:
-                if not supports_unicode:
-                    lines = _adapt_output_lines_for_stream( lines, stream )
-                output = '\n'.join( lines )
-                print( output, file = stream )
+            _print_markdown( result.render_as_markdown( ), display, stream )
+
+
+async def render_and_print_results(
+    results: __.cabc.Sequence[ Renderable ],
+    display: DisplayOptions,
+    exits: __.ctxl.AsyncExitStack,
+) -> None:
+    ''' Renders several results of one command.
+
+        JSON presentation emits one document with a list of results, so
+        that output remains parseable. NDJSON presentation emits one
+        record per result.
+    '''
+    if display.presentation is not Presentations.Json:
+        for result in results:
+            await render_and_print_result( result, display, exits )
+        return
+    stream = await display.provide_stream( exits )
+    print(
+        __.json.dumps(
+            { 'results': [ result.render_as_json( ) for result in results ] },
+            indent = 2 ),
+        file = stream )
+
+
+def _print_markdown(
+    lines: tuple[ str, ... ],
+    display: DisplayOptions,
+    stream: __.typx.TextIO,
+) -> None:
+    supports_unicode = _stream_supports_unicode( stream )
+    if supports_unicode and display.determine_colorization( stream ):
+        from rich.console import Console
+        from rich.markdown import Markdown
+        console = Console( file = stream, force_terminal = True )
+        markdown_obj = Markdown( '\n'.join( lines ) )
+        console.print( markdown_obj )
+    else:
+        if not supports_unicode:
+            lines = _adapt_output_lines_for_stream( lines, stream )
+        output = '\n'.join( lines )
+        print( output, file = stream )
+
+
+@__.ctxl.asynccontextmanager
+async def streaming_events(
+    display: DisplayOptions, exits: __.ctxl.AsyncExitStack
+) -> __.cabc.AsyncIterator[ None ]:
+    ''' Streams events as NDJSON records, if so presenting. '''
+    if display.presentation is not Presentations.Ndjson:
+        yield
+        return
+    stream = await display.provide_stream( exits )
+    mutex = _threading.Lock( )
+
+    def receive( event: _events.Event ) -> None:
+        record = __.json.dumps( event.render_as_json( ) )
+        with mutex: print( record, file = stream, flush = True )
+
+    with _events.receiving( receive ): yield
+
+
+@__.ctxl.contextmanager
+def displaying_progress( enable: bool ) -> __.cabc.Iterator[ None ]:
+    ''' Displays progress on stderr, if enabled and stderr is terminal. '''
+    stream = __.sys.stderr
+    if not enable or not stream.isatty( ):
+        yield
+        return
+    display = ProgressDisplay( stream )
+    try:
+        with _events.receiving( display ): yield
+    finally: display.conclude( )
@@ -21,6 +21,8 @@
 ''' Command for detecting Copier configuration in target directories. '''
 
 
+from appcore import cli as _appcore_cli
+
 from . import __
 from . import cmdbase as _cmdbase
 from . import core as _core
@@ -31,7 +33,7 @@ from . import results as _results
 _scribe = __.provide_scribe( __name__ )
 
 
-class DetectCommand( __.appcore_cli.Command ):
+class DetectCommand( _appcore_cli.Command ):
     ''' Detects and displays current Copier configuration for agents. '''
 
     source: __.typx.Annotated[
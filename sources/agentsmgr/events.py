@@ -0,0 +1,230 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Typed events from generation and population.
+
+    Operations emit events as they render, write, skip, prune, and link
+    items, and as they encounter recoverable problems. Receivers, such as
+    NDJSON streams, progress displays, and manifests, subscribe within
+    :py:func:`receiving`. Without receivers, emission costs a single
+    context variable lookup: events are not constructed and content is
+    neither measured nor hashed.
+'''
+
+
+import contextvars as _contextvars
+import hashlib as _hashlib
+import threading as _threading
+
+from . import __
+
+
+class Event( __.immut.DataclassObject ):
+    ''' Base for events from generation and population. '''
+
+    @__.abc.abstractmethod
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders event as JSON-compatible record. '''
+        raise NotImplementedError
+
+
+class ItemEvent( Event ):
+    ''' Base for events which concern one item at a location. '''
+
+    location: __.Path
+    simulated: bool = False
+
+    @property
+    def action( self ) -> str:
+        ''' Name of action taken on item. '''
+        raise NotImplementedError
+
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders event as JSON-compatible item record. '''
+        return {
+            'kind': 'item',
+            'action': self.action,
+            'path': str( self.location ),
+            'simulated': self.simulated,
+        }
+
+
+class RenderedEvent( ItemEvent ):
+    ''' Item rendered from components, prior to writing. '''
+
+    item_type: str = ''
+    item_name: str = ''
+    coder: str = ''
+
+    @property
+    def action( self ) -> str: return 'rendered'
+
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders event as JSON-compatible item record. '''
+        return {
+            **super( ).render_as_json( ),
+            'item_type': self.item_type,
+            'item_name': self.item_name,
+            'coder': self.coder,
+        }
+
+
+class WrittenEvent( ItemEvent ):
+    ''' File written, with size and SHA-256 digest if known. '''
+
+    size: __.typx.Optional[ int ] = None
+    digest: __.typx.Optional[ str ] = None
+
+    @property
+    def action( self ) -> str: return 'written'
+
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders event as JSON-compatible item record. '''
+        return {
+            **super( ).render_as_json( ),
+            'bytes': self.size,
+            'hash': (
+                None if self.digest is None else f"sha256:{self.digest}" ),
+        }
+
+
+class SkippedEvent( ItemEvent ):
+    ''' Item skipped, with reason. '''
+
+    reason: str = ''
+
+    @property
+    def action( self ) -> str: return 'skipped'
+
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders event as JSON-compatible item record. '''
+        return { **super( ).render_as_json( ), 'reason': self.reason }
+
+
+class PrunedEvent( ItemEvent ):
+    ''' Previously populated file removed. '''
+
+    @property
+    def action( self ) -> str: return 'pruned'
+
+
+class LinkedEvent( ItemEvent ):
+    ''' Symlink created or updated at location. '''
+
+    target: str = ''
+
+    @property
+    def action( self ) -> str: return 'linked'
+
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders event as JSON-compatible item record. '''
+        return { **super( ).render_as_json( ), 'target': self.target }
+
+
+class WarningEvent( Event ):
+    ''' Recoverable problem, also logged as warning. '''
+
+    message: str
+
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders event as JSON-compatible warning record. '''
+        return { 'kind': 'warning', 'message': self.message }
+
+
+EventReceiver: __.typx.TypeAlias = __.cabc.Callable[ [ Event ], None ]
+
+
+class Manifest:
+    ''' Records item events for export after command completes.
+
+        Rendered events are omitted, since their outcomes are reported by
+        subsequent written or skipped events.
+    '''
+
+    def __init__( self ) -> None:
+        self.items: list[ ItemEvent ] = [ ]
+        self.warnings: list[ str ] = [ ]
+        self._lock = _threading.Lock( )
+
+    def __call__( self, event: Event ) -> None:
+        with self._lock:
+            if isinstance( event, WarningEvent ):
+                self.warnings.append( event.message )
+            elif (  isinstance( event, ItemEvent )
+                and not isinstance( event, RenderedEvent )
+            ): self.items.append( event )
+
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders manifest as JSON-compatible data. '''
+        totals: dict[ str, int ] = { }
+        for item in self.items:
+            totals[ item.action ] = totals.get( item.action, 0 ) + 1
+        return {
+            'items': [
+                item.render_as_json( ) for item in sorted(
+                    self.items, key = lambda item: item.location ) ],
+            'totals': dict( sorted( totals.items( ) ) ),
+            'warnings': list( self.warnings ),
+        }
+
+
+_receivers: _contextvars.ContextVar[ tuple[ EventReceiver, ... ] ] = (
+    _contextvars.ContextVar( 'agentsmgr_events_receivers', default = ( ) ) )
+
+
+def emit( species: type[ Event ], **arguments: __.typx.Any ) -> None:
+    ''' Constructs event and delivers it to receivers, if any. '''
+    receivers = _receivers.get( )
+    if not receivers: return
+    event = species( **arguments )
+    for receiver in receivers: receiver( event )
+
+
+def emit_written(
+    location: __.Path,
+    content: __.typx.Optional[ bytes ] = None,
+    size: __.typx.Optional[ int ] = None,
+    simulated: bool = False,
+) -> None:
+    ''' Emits written event, if any receivers.
+
+        Size and digest are computed from content, when provided.
+    '''
+    if not _receivers.get( ): return
+    digest = None
+    if content is not None:
+        size = len( content )
+        digest = _hashlib.sha256( content ).hexdigest( )
+    emit(
+        WrittenEvent, location = location, simulated = simulated,
+        size = size, digest = digest )
+
+
+@__.ctxl.contextmanager
+def receiving( receiver: EventReceiver ) -> __.cabc.Iterator[ None ]:
+    ''' Delivers events emitted in current context to receiver.
+
+        Receivers accumulate across nested contexts. Receivers may be
+        called from worker threads and must be thread-safe.
+    '''
+    token = _receivers.set( ( *_receivers.get( ), receiver ) )
+    try: yield
+    finally: _receivers.reset( token )
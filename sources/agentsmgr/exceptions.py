@@ -35,6 +35,14 @@ class Omnierror( Omniexception, Exception ):
         ''' Renders exception as Markdown lines for display. '''
         return ( f"❌ {self}", )
 
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders exception as JSON-compatible record. '''
+        return {
+            'kind': 'error',
+            'error': type( self ).__name__,
+            'message': str( self ),
+        }
+
 
 class CoderAbsence( Omnierror, ValueError ):
     ''' Coder absence in registry. '''
@@ -151,6 +159,14 @@ class DataSourceInvalidity( Omnierror, ValueError ):
             "configurations, contents, and templates." )
         return tuple( lines )
 
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders data source invalidity with missing directories. '''
+        return {
+            **super( ).render_as_json( ),
+            'location': str( self.location ),
+            'missing_directories': list( self.missing_directories ),
+        }
+
 
 class DataSourceNoSupport( Omnierror, ValueError ):
     ''' Unsupported data source format error. '''
@@ -168,6 +184,14 @@ class GlobalsPopulationFailure( Omnierror, OSError ):
         super( ).__init__( message )
 
 
+class JsoncInvalidity( Omnierror, ValueError ):
+    ''' JSONC document invalidity. '''
+
+    def __init__( self, offset: int ):
+        self.offset = offset
+        super( ).__init__( f"Invalid JSONC document at offset {offset}." )
+
+
 class MemoryFileAbsence( Omnierror, FileNotFoundError ):
     ''' Memory file absence.
 
@@ -201,6 +225,19 @@ class MemoryFileAbsence( Omnierror, FileNotFoundError ):
             "project." )
         return tuple( lines )
 
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders memory file absence with expected location. '''
+        return {
+            **super( ).render_as_json( ), 'location': str( self.location ) }
+
+
+class TargetsAbsence( Omnierror, ValueError ):
+    ''' Population targets absence. '''
+
+    def __init__( self ):
+        message = "No population targets matched specifications."
+        super( ).__init__( message )
+
 
 class TargetModeNoSupport( Omnierror, ValueError ):
     ''' Targeting mode lack of support. '''
@@ -26,13 +26,16 @@
 '''
 
 
-import jinja2 as _jinja2
-
 from . import __
 from . import cmdbase as _cmdbase
 from . import context as _context
 from . import exceptions as _exceptions
 from . import renderers as _renderers
+from . import timings as _timings
+
+
+if __.typx.TYPE_CHECKING:
+    import jinja2 as _jinja2
 
 
 CoderFallbackMap: __.typx.TypeAlias = __.immut.Dictionary[ str, str ]
@@ -71,7 +74,7 @@ class ContentGenerator( __.immut.DataclassObject ):
         __.dcls.field(
             default_factory = __.immut.Dictionary[ str, __.typx.Any ] ) )
     mode: _renderers.TargetMode = 'per-project'
-    jinja_environment: _jinja2.Environment = __.dcls.field( init = False )
+    jinja_environment: '_jinja2.Environment' = __.dcls.field( init = False )
 
     def __post_init__( self ) -> None:
         self.jinja_environment = (  # pyright: ignore[reportAttributeAccessIssue]
@@ -234,11 +237,15 @@ class ContentGenerator( __.immut.DataclassObject ):
         primary_path, fallback_path = self.resolve_content_paths(
             item_type, item_name, coder )
         if primary_path.exists( ):
-            return primary_path.read_text( encoding = 'utf-8' )
+            content = primary_path.read_text( encoding = 'utf-8' )
+            _timings.count( 'bytes-read', len( content ) )
+            return content
         if fallback_path and fallback_path.exists( ):
             fallback_coder = self._retrieve_fallback_mappings( ).get( coder )
             _scribe.debug( f"Using {fallback_coder} content for {coder}" )
-            return fallback_path.read_text( encoding = 'utf-8' )
+            content = fallback_path.read_text( encoding = 'utf-8' )
+            _timings.count( 'bytes-read', len( content ) )
+            return content
         raise _exceptions.ContentAbsence( item_type, item_name, coder )
 
     def _retrieve_skill_content( self, item_name: str ) -> str:
@@ -313,6 +320,7 @@ class ContentGenerator( __.immut.DataclassObject ):
         try: toml_content = configuration_file.read_bytes( )
         except ( OSError, IOError ) as exception:
             raise _exceptions.ConfigurationAbsence( ) from exception
+        _timings.count( 'bytes-read', len( toml_content ) )
         try: toml_data: dict[ str, __.typx.Any ] = __.tomli.loads(
             toml_content.decode( 'utf-8' ) )
         except __.tomli.TOMLDecodeError as exception:
@@ -334,12 +342,15 @@ class ContentGenerator( __.immut.DataclassObject ):
         coder_config = coders_dict.get( coder, { 'name': coder } )
         return { 'context': context, 'coder': coder_config }
 
-    def _produce_jinja_environment( self ) -> _jinja2.Environment:
+    def _produce_jinja_environment( self ) -> '_jinja2.Environment':
         ''' Produces Jinja2 environment configured for templates directory.
 
             Creates new Jinja2 environment instance with FileSystemLoader
-            pointing to data source templates directory.
+            pointing to data source templates directory. Jinja2 is imported
+            here, rather than with the module, so that commands which never
+            render do not pay for it.
         '''
+        import jinja2 as _jinja2
         directory = self.location / "templates"
         loader = _jinja2.FileSystemLoader( directory )
         return _jinja2.Environment(
@@ -0,0 +1,177 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Lightweight discovery of Git control directories.
+
+    Locates the Git control directory for a working tree by walking parent
+    directories and interpreting ``.git`` entries directly. Handles
+    worktrees (``gitdir:`` files) and shared control directories
+    (``commondir`` files) without opening a repository object store.
+'''
+
+
+import stat as _stat
+
+from . import __
+
+
+_GITDIR_PREFIX = 'gitdir:'
+_REF_PREFIX = 'ref:'
+
+
+class GitDirectories( __.immut.DataclassObject ):
+    ''' Git control directory locations for a working tree.
+
+        The control directory is specific to the working tree (holds
+        ``HEAD``). The common directory is shared across worktrees (holds
+        ``refs``, ``objects``, and ``info/exclude``). For ordinary
+        repositories, both are the same directory.
+    '''
+
+    worktree: __.Path
+    control: __.Path
+    common: __.Path
+
+
+def discover_git_directories(
+    start: __.Path
+) -> __.typx.Optional[ GitDirectories ]:
+    ''' Discovers Git control directories for a path.
+
+        Walks from the start path toward the filesystem root, looking for
+        a ``.git`` directory or ``gitdir:`` file. Ignores ambient Git
+        environment variables, such as ``GIT_DIR``, so that the explicit
+        start path controls discovery. Results are memoized per absolute
+        start path until forgotten; long-running processes should forget
+        them between requests.
+
+        Returns None if the path is not within a Git working tree.
+    '''
+    return _discover_git_directories( __.os.path.abspath( start ) )
+
+
+def forget_git_directories( ) -> None:
+    ''' Forgets memoized discoveries of Git control directories.
+
+        Working trees may be created, moved, or removed while a process
+        runs, which would leave memoized discoveries stale.
+    '''
+    _discover_git_directories.cache_clear( )
+
+
+@__.funct.lru_cache( maxsize = 64 )
+def _discover_git_directories(
+    start: str
+) -> __.typx.Optional[ GitDirectories ]:
+    ''' Walks parents of absolute start path for Git control entries. '''
+    directory = start
+    while True:
+        entry = __.os.path.join( directory, '.git' )
+        try: status = __.os.stat( entry )
+        except OSError: status = None
+        if status is not None:
+            control = _resolve_control_directory( entry, status )
+            if control is None: return None
+            return GitDirectories(
+                worktree = __.Path( directory ),
+                control = __.Path( control ),
+                common = __.Path( _resolve_common_directory( control ) ),
+            )
+        parent = __.os.path.dirname( directory )
+        if parent == directory: return None
+        directory = parent
+
+
+def _resolve_control_directory(
+    entry: str, status: __.os.stat_result
+) -> __.typx.Optional[ str ]:
+    ''' Resolves control directory from ``.git`` directory or file.
+
+        For worktrees and submodules, ``.git`` is a file containing a
+        ``gitdir:`` reference, which may be relative to the file.
+    '''
+    if _stat.S_ISDIR( status.st_mode ): return entry
+    try:
+        with open( entry, encoding = 'utf-8' ) as stream:
+            content = stream.read( ).strip( )
+    except ( OSError, UnicodeDecodeError ): return None
+    if not content.startswith( _GITDIR_PREFIX ): return None
+    reference = content[ len( _GITDIR_PREFIX ): ].strip( )
+    if not reference: return None
+    control = __.os.path.normpath( __.os.path.join(
+        __.os.path.dirname( entry ), reference ) )
+    if not __.os.path.isdir( control ): return None
+    return control
+
+
+def _resolve_common_directory( control: str ) -> str:
+    ''' Resolves common directory, honoring ``commondir`` references.
+
+        Returns control directory unchanged for ordinary repositories.
+    '''
+    try:
+        with open(
+            __.os.path.join( control, 'commondir' ), encoding = 'utf-8'
+        ) as stream: reference = stream.read( ).strip( )
+    except ( OSError, UnicodeDecodeError ): return control
+    if not reference: return control
+    return __.os.path.normpath( __.os.path.join( control, reference ) )
+
+
+def resolve_head_commit(
+    directories: GitDirectories
+) -> __.typx.Optional[ str ]:
+    ''' Resolves commit identifier for ``HEAD`` of a working tree.
+
+        Follows one symbolic reference from ``HEAD`` to a loose reference
+        or to an entry in ``packed-refs``. Returns None if ``HEAD`` is
+        unborn or cannot be interpreted.
+    '''
+    try:
+        with open(
+            __.os.path.join( directories.control, 'HEAD' ), encoding = 'utf-8'
+        ) as stream: head = stream.read( ).strip( )
+    except ( OSError, UnicodeDecodeError ): return None
+    if not head.startswith( _REF_PREFIX ): return head or None
+    reference = head[ len( _REF_PREFIX ): ].strip( )
+    for directory in ( directories.control, directories.common ):
+        try:
+            with open(
+                __.os.path.join( directory, reference ), encoding = 'utf-8'
+            ) as stream: commit = stream.read( ).strip( )
+        except ( OSError, UnicodeDecodeError ): continue
+        if commit: return commit
+    return _resolve_packed_reference( directories.common, reference )
+
+
+def _resolve_packed_reference(
+    common: __.Path, reference: str
+) -> __.typx.Optional[ str ]:
+    ''' Resolves reference from ``packed-refs`` of common directory. '''
+    try:
+        with open(
+            __.os.path.join( common, 'packed-refs' ), encoding = 'utf-8'
+        ) as stream: lines = stream.read( ).splitlines( )
+    except ( OSError, UnicodeDecodeError ): return None
+    for line in lines:
+        if line.startswith( ( '#', '^' ) ): continue
+        commit, _, name = line.partition( ' ' )
+        if name.strip( ) == reference: return commit
+    return None
@@ -26,9 +26,13 @@
 '''
 
 
+import hashlib as _hashlib
+
 from . import __
 from . import exceptions as _exceptions
+from . import preprocessors as _preprocessors
 from . import sources as _sources
+from . import timings as _timings
 
 
 InstructionSourceConfiguration: __.typx.TypeAlias = (
@@ -37,60 +41,139 @@ FilePreprocessingConfiguration: __.typx.TypeAlias = (
     __.cabc.Mapping[ str, __.typx.Any ] )
 
 
+_COMPARISON_CHUNK_SIZE = 65536
+
+
 _scribe = __.provide_scribe( __name__ )
 
 
-def populate_instructions(
+class InstructionCache( __.immut.DataclassObject ):
+    ''' On-disk cache of preprocessed instruction files.
+
+        Entries are keyed by digest of source file content, source-relative
+        file path, and preprocessing configuration. Failures to store
+        entries only degrade caching and are never fatal.
+    '''
+
+    location: __.Path
+
+    def locate( self, key: str ) -> __.typx.Optional[ __.Path ]:
+        ''' Returns location of cached file for key, if present. '''
+        entry = self._calculate_entry_location( key )
+        if entry.is_file( ):
+            _timings.count( 'cache-hits' )
+            return entry
+        _timings.count( 'cache-misses' )
+        return None
+
+    def store( self, key: str, produced: __.Path ) -> None:
+        ''' Stores copy of produced file for key, replacing atomically. '''
+        entry = self._calculate_entry_location( key )
+        try:
+            entry.parent.mkdir( parents = True, exist_ok = True )
+            with __.tempfile.NamedTemporaryFile(
+                dir = entry.parent, prefix = '.', delete = False
+            ) as stream: pass
+            __.shutil.copyfile( produced, stream.name )
+            __.os.replace( stream.name, entry )
+        except OSError as exception:
+            _scribe.debug(
+                f"Could not cache instruction file at {entry}: "
+                f"{exception}" )
+
+    def _calculate_entry_location( self, key: str ) -> __.Path:
+        return self.location / key[ : 2 ] / key
+
+
+async def populate_instructions(  # noqa: PLR0913
     sources_configuration: __.cabc.Sequence[ InstructionSourceConfiguration ],
     target: __.Path,
     tag_prefix: __.Absential[ str ] = __.absent,
     simulate: bool = False,
+    *,
+    concurrency: int = 4,
+    cache_location: __.Absential[ __.typx.Optional[ __.Path ] ] = __.absent,
 ) -> tuple[ int, int ]:
     ''' Populates instruction files from configured Git sources.
 
-        For each source configuration, resolves the Git source, filters
-        files by configured patterns, applies preprocessing (such as
-        header stripping), and writes results to the target directory.
+        Resolves all configured sources concurrently in worker threads, at
+        most concurrency at a time, so that several clones overlap. Then,
+        in configuration order, filters files by configured patterns,
+        applies preprocessing (such as header stripping), and writes
+        results to the target directory. Applying in configuration order
+        keeps overwrite precedence deterministic. Preprocessed contents
+        are memoized across runs under the cache location, which defaults
+        to the source data cache of the current context, such as the
+        application cache directory under the CLI. None disables
+        memoization.
 
         Returns tuple of (files_attempted, files_written) across all
         sources.
     '''
+    files_configurations = tuple(
+        _validate_source_configuration( source_config )
+        for source_config in sources_configuration )
+    source_specs = tuple( spec for spec, _ in files_configurations )
+    limiter = __.asyncio.Semaphore( max( 1, concurrency ) )
+    async def resolve( source_spec: str ) -> __.typx.Optional[ __.Path ]:
+        async with limiter:
+            _scribe.info( f"Resolving instruction source: {source_spec}" )
+            try:
+                return await __.asyncio.to_thread(
+                    _sources.resolve_source_location,
+                    source_spec, tag_prefix )
+            except Exception as exception:
+                _scribe.warning(
+                    f"Failed to resolve instruction source "
+                    f"'{source_spec}': {exception}" )
+                return None
+    unique_specs = tuple( dict.fromkeys( source_specs ) )
+    locations = dict( zip(
+        unique_specs,
+        await __.asyncio.gather(
+            *( resolve( spec ) for spec in unique_specs ) ),
+        strict = True ) )
+    if __.is_absent( cache_location ):
+        cache_location = _sources.access_cache_location( 'instructions' )
+    cache = (
+        None if cache_location is None
+        else InstructionCache( location = cache_location ) )
     files_attempted = 0
     files_written = 0
-    for source_config in sources_configuration:
-        try: source_spec = source_config[ 'source' ]
-        except KeyError as exception:
-            raise _exceptions.InstructionSourceFieldAbsence( ) from exception
-        files_config = source_config.get( 'files', { '*.rst': { } } )
-        if not isinstance( files_config, __.cabc.Mapping ):
-            raise _exceptions.InstructionFilesConfigurationInvalidity( )
-        files_mapping: __.cabc.Mapping[
-            str, FilePreprocessingConfiguration ] = (
-            __.typx.cast(
-                __.cabc.Mapping[ str, FilePreprocessingConfiguration ],
-                files_config ) )
-        _scribe.info( f"Resolving instruction source: {source_spec}" )
-        try:
-            source_location = _sources.resolve_source_location(
-                source_spec, tag_prefix )
-        except Exception as exception:
-            _scribe.warning(
-                f"Failed to resolve instruction source '{source_spec}': "
-                f"{exception}" )
-            continue
+    for source_spec, files_mapping in files_configurations:
+        source_location = locations[ source_spec ]
+        if source_location is None: continue
         attempted, written = _populate_instructions_from_location(
-            source_location, target, files_mapping, simulate )
+            source_location, target, files_mapping, simulate, cache )
         files_attempted += attempted
         files_written += written
     return ( files_attempted, files_written )
 
 
+def _validate_source_configuration(
+    source_config: InstructionSourceConfiguration
+) -> tuple[ str, __.cabc.Mapping[ str, FilePreprocessingConfiguration ] ]:
+    ''' Validates source configuration, returning spec and files mapping. '''
+    try: source_spec = source_config[ 'source' ]
+    except KeyError as exception:
+        raise _exceptions.InstructionSourceFieldAbsence( ) from exception
+    files_config = source_config.get( 'files', { '*.rst': { } } )
+    if not isinstance( files_config, __.cabc.Mapping ):
+        raise _exceptions.InstructionFilesConfigurationInvalidity( )
+    files_mapping: __.cabc.Mapping[ str, FilePreprocessingConfiguration ] = (
+        __.typx.cast(
+            __.cabc.Mapping[ str, FilePreprocessingConfiguration ],
+            files_config ) )
+    return ( source_spec, files_mapping )
+
+
 def _populate_instructions_from_location(
     source_location: __.Path,
     target: __.Path,
     files_configuration: __.cabc.Mapping[
         str, FilePreprocessingConfiguration ],
     simulate: bool,
+    cache: __.typx.Optional[ InstructionCache ] = None,
 ) -> tuple[ int, int ]:
     ''' Populates instructions from resolved source location.
 
@@ -103,76 +186,183 @@ def _populate_instructions_from_location(
         _scribe.warning(
             f"Instruction source location does not exist: {source_location}" )
         return ( files_attempted, files_written )
-    for pattern, preprocessing_config in files_configuration.items( ):
-        config: FilePreprocessingConfiguration = (
-            preprocessing_config
-            if isinstance( preprocessing_config, __.cabc.Mapping )
-            else { } )
-        for file_path in source_location.rglob( pattern ):
-            if not file_path.is_file( ): continue
+    selections = _select_instruction_files(
+        source_location, files_configuration )
+    with __.tempfile.TemporaryDirectory(
+        prefix = 'agentsmgr-instructions-'
+    ) as workspace:
+        for relative_path, config in selections.items( ):
             files_attempted += 1
+            source_file = source_location / relative_path
+            context = _preprocessors.PreprocessingContext(
+                source_file = source_file, source_root = source_location )
             was_written = _process_and_write_instruction_file(
-                file_path, target, config, simulate )
+                context, target, config, simulate,
+                workspace = __.Path( workspace ),
+                cache = cache,
+                cache_key = _calculate_cache_key(
+                    source_file, relative_path, config ) )
             if was_written: files_written += 1
     return ( files_attempted, files_written )
 
 
-def _process_and_write_instruction_file(
+def _select_instruction_files(
+    source_location: __.Path,
+    files_configuration: __.cabc.Mapping[
+        str, FilePreprocessingConfiguration ],
+) -> dict[ str, FilePreprocessingConfiguration ]:
+    ''' Selects files matching configured patterns in one tree walk.
+
+        Patterns match source-relative paths beneath any directory, as
+        with ``rglob``, and ``**`` matches zero or more directories. A
+        file matched by several patterns is selected once, with
+        preprocessing configuration from the last matching pattern, since
+        that pattern's output used to overwrite earlier ones.
+    '''
+    patterns = tuple(
+        ( pattern,
+          preprocessing_config
+          if isinstance( preprocessing_config, __.cabc.Mapping )
+          else { } )
+        for pattern, preprocessing_config in files_configuration.items( ) )
+    selections: dict[ str, FilePreprocessingConfiguration ] = { }
+    for directory, subdirectories, filenames in __.os.walk( source_location ):
+        subdirectories[ : ] = sorted(
+            name for name in subdirectories if name != '.git' )
+        relative_directory = __.os.path.relpath( directory, source_location )
+        for filename in sorted( filenames ):
+            relative_path = __.PurePosixPath(
+                relative_directory, filename ).as_posix( )
+            parts = relative_path.split( '/' )
+            for pattern, config in reversed( patterns ):
+                if _match_pattern( parts, pattern ):
+                    selections[ relative_path ] = config
+                    break
+    return selections
+
+
+def _match_pattern( parts: __.cabc.Sequence[ str ], pattern: str ) -> bool:
+    ''' Matches path parts against pattern with ``rglob`` semantics. '''
+    segments = [ '**', *( segment for segment in pattern.split( '/' )
+                          if segment not in ( '', '.' ) ) ]
+    return _match_segments( tuple( parts ), tuple( segments ) )
+
+
+def _match_segments(
+    parts: tuple[ str, ... ], segments: tuple[ str, ... ]
+) -> bool:
+    if not segments: return not parts
+    segment, rest = segments[ 0 ], segments[ 1: ]
+    if segment == '**':
+        return any(
+            _match_segments( parts[ index: ], rest )
+            for index in range( len( parts ) + 1 ) )
+    return bool( parts ) and __.fnmatch( parts[ 0 ], segment ) and (
+        _match_segments( parts[ 1: ], rest ) )
+
+
+def _calculate_cache_key(
     source_file: __.Path,
+    relative_path: str,
+    configuration: FilePreprocessingConfiguration,
+) -> __.typx.Optional[ str ]:
+    ''' Calculates cache key for source file and preprocessing.
+
+        Source files are identified by digest of their content, so that
+        edits are never served from cache, whether committed or not, and
+        so that fresh clones of unchanged sources still hit the cache.
+        Preprocessing which reads other files disables caching.
+    '''
+    if not _preprocessors.is_hermetic( configuration ): return None
+    try: content = source_file.read_bytes( )
+    except OSError: return None
+    identity = _hashlib.sha256( content ).hexdigest( )
+    material = __.json.dumps(
+        [ identity, relative_path, configuration ],
+        sort_keys = True, default = str )
+    return _hashlib.sha256( material.encode( 'utf-8' ) ).hexdigest( )
+
+
+def _process_and_write_instruction_file(  # noqa: PLR0913
+    context: _preprocessors.PreprocessingContext,
     target_directory: __.Path,
     preprocessing_configuration: FilePreprocessingConfiguration,
     simulate: bool,
+    *,
+    workspace: __.Path,
+    cache: __.typx.Optional[ InstructionCache ] = None,
+    cache_key: __.typx.Optional[ str ] = None,
 ) -> bool:
     ''' Processes and writes instruction file to target directory.
 
-        Reads source file, applies configured preprocessing (such as
-        header stripping), and writes to target directory. Returns True
-        if file was written, False otherwise.
+        Streams source file through configured preprocessing stages into
+        a workspace file, unless a cached result is available, and then
+        copies the result to target directory. Returns True if file was
+        written, False if it could not be written or the target already
+        matches.
     '''
-    try: content = source_file.read_text( encoding = 'utf-8' )
-    except ( OSError, IOError ) as exception:
-        _scribe.warning(
-            f"Failed to read instruction file '{source_file}': {exception}" )
-        return False
-    processed_content = _preprocess_content(
-        content, preprocessing_configuration )
-    target_file = target_directory / source_file.name
+    produced = None
+    if cache is not None and cache_key is not None:
+        produced = cache.locate( cache_key )
+    if produced is None:
+        produced = workspace / 'processed'
+        if not _produce_instruction_file(
+            context, produced, preprocessing_configuration
+        ): return False
+        if cache is not None and cache_key is not None:
+            cache.store( cache_key, produced )
+    target_file = target_directory / context.source_file.name
+    if _is_file_current( target_file, produced ): return False
+    try: relative_path = target_file.relative_to( __.Path.cwd( ) )
+    except ValueError: relative_path = target_file
     if simulate:
-        try: relative_path = target_file.relative_to( __.Path.cwd( ) )
-        except ValueError: relative_path = target_file
         _scribe.info( f"Would write instruction file: {relative_path}" )
         return True
     try:
         target_directory.mkdir( parents = True, exist_ok = True )
-        target_file.write_text( processed_content, encoding = 'utf-8' )
+        __.shutil.copyfile( produced, target_file )
     except ( OSError, IOError ) as exception:
         _scribe.warning(
             f"Failed to write instruction file '{target_file}': {exception}" )
         return False
-    else:
-        try: relative_path = target_file.relative_to( __.Path.cwd( ) )
-        except ValueError: relative_path = target_file
-        _scribe.debug( f"Wrote instruction file: {relative_path}" )
-        return True
+    _scribe.debug( f"Wrote instruction file: {relative_path}" )
+    return True
 
 
-def _preprocess_content(
-    content: str,
+def _produce_instruction_file(
+    context: _preprocessors.PreprocessingContext,
+    destination: __.Path,
     configuration: FilePreprocessingConfiguration,
-) -> str:
-    ''' Applies configured preprocessing transforms to content.
+) -> bool:
+    ''' Streams source file through preprocessing stages to destination.
 
-        Supports header stripping via strip_header_lines configuration.
-        Additional preprocessing operations can be added here.
+        Memory use is independent of file size. Returns False if the
+        source file could not be read and processed.
     '''
-    if not configuration: return content
-    strip_lines = configuration.get( 'strip_header_lines' )
-    if strip_lines is None: return content
-    if not isinstance( strip_lines, int ):
+    try:
+        with (
+            context.source_file.open( encoding = 'utf-8' ) as source,
+            destination.open( 'w', encoding = 'utf-8' ) as stream,
+        ):
+            stream.writelines(
+                _preprocessors.preprocess_lines(
+                    source, configuration, context ) )
+    except ( OSError, UnicodeDecodeError ) as exception:
         _scribe.warning(
-            f"Invalid strip_header_lines value (expected int): {strip_lines}" )
-        return content
-    if strip_lines <= 0: return content
-    lines = content.splitlines( keepends = True )
-    if len( lines ) <= strip_lines: return ''
-    return ''.join( lines[ strip_lines: ] )
+            f"Failed to read instruction file '{context.source_file}': "
+            f"{exception}" )
+        return False
+    return True
+
+
+def _is_file_current( location: __.Path, produced: __.Path ) -> bool:
+    ''' Checks whether file at location matches produced file. '''
+    try:
+        if location.stat( ).st_size != produced.stat( ).st_size:
+            return False
+        with location.open( 'rb' ) as current, produced.open( 'rb' ) as new:
+            while True:
+                chunk = current.read( _COMPARISON_CHUNK_SIZE )
+                if chunk != new.read( _COMPARISON_CHUNK_SIZE ): return False
+                if not chunk: return True
+    except OSError: return False
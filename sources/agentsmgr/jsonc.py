@@ -0,0 +1,296 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Tolerant JSONC parsing and span-preserving patch application.
+
+    JSONC is JSON with ``//`` and ``/* */`` comments and optional trailing
+    commas. Parsing is a single linear pass which also records the spans
+    of objects and their members, so that settings patches can be applied
+    by inserting text, leaving comments and formatting untouched.
+'''
+
+
+import json.decoder as _json_decoder
+import re as _re
+
+from . import __
+from . import exceptions as _exceptions
+from . import patches as _patches
+
+
+_scan_string = __.typx.cast(
+    __.cabc.Callable[ [ str, int ], tuple[ str, int ] ],
+    _json_decoder.scanstring )  # pyright: ignore
+_NUMBER_REGEX = _re.compile(
+    r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?' )
+_LITERALS: __.immut.Dictionary[ str, __.typx.Any ] = __.immut.Dictionary( {
+    'true': True, 'false': False, 'null': None } )
+
+
+class _Member( __.immut.DataclassObject ):
+    ''' Span of object member: key start and value end offsets. '''
+
+    key: str
+    start: int
+    end: int
+    value: '__.typx.Optional[ _ObjectSpan ]' = None
+
+
+class _ObjectSpan( __.immut.DataclassObject ):
+    ''' Spans of object braces, members, and any trailing comma. '''
+
+    opening: int
+    closing: int
+    members: tuple[ _Member, ... ]
+    comma: __.typx.Optional[ int ] = None
+
+
+def loads( text: str ) -> __.typx.Any:
+    ''' Parses JSONC text into Python values. '''
+    value, _ = _parse_document( text )
+    return value
+
+
+def apply_patch_to_jsonc_text(
+    text: str, patch: _patches.SettingsPatch
+) -> __.typx.Optional[ str ]:
+    ''' Applies patch to JSONC document text, preserving existing text.
+
+        Missing members are inserted after the last member of their parent
+        object, following its indentation and trailing-comma style.
+        Returns None if a parent is not an object literal in the text or
+        if the edited document does not parse to the expected settings.
+    '''
+    try: original, root = _parse_document( text )
+    except _exceptions.JsoncInvalidity: return None
+    if root is None: return None
+    groups: dict[ int, tuple[ _ObjectSpan, list[ str ] ] ] = { }
+    for addition in patch.additions:
+        span = _locate_object( root, addition.path[ : -1 ] )
+        if span is None: return None
+        group = groups.setdefault( span.opening, ( span, [ ] ) )
+        group[ 1 ].append( _render_member( text, span, addition ) )
+    insertions: dict[ int, list[ str ] ] = { }
+    for span, members in groups.values( ):
+        for position, fragment in _render_insertions( text, span, members ):
+            insertions.setdefault( position, [ ] ).append( fragment )
+    result = text
+    for position in sorted( insertions, reverse = True ):
+        fragment = ''.join( insertions[ position ] )
+        result = f"{result[ : position ]}{fragment}{result[ position : ]}"
+    expected = __.typx.cast( dict[ str, __.typx.Any ], original )
+    _patches.apply_settings_patch( expected, patch )
+    try: actual = loads( result )
+    except _exceptions.JsoncInvalidity: return None
+    if actual != expected: return None
+    return result
+
+
+def _detect_indentation( text: str, offset: int ) -> str:
+    ''' Returns leading whitespace of line containing offset. '''
+    start = text.rfind( '\n', 0, offset ) + 1
+    end = start
+    while end < len( text ) and text[ end ] in ' \t': end += 1
+    return text[ start : end ]
+
+
+def _detect_member_indentation(
+    text: str, span: _ObjectSpan
+) -> tuple[ str, str ]:
+    ''' Detects indentation of members and indentation unit of object. '''
+    outer = _detect_indentation( text, span.opening )
+    if not span.members: return f"{outer}  ", '  '
+    indentation = _detect_indentation( text, span.members[ -1 ].start )
+    if indentation.startswith( outer ) and len( indentation ) > len( outer ):
+        return indentation, indentation[ len( outer ): ]
+    return indentation, '  '
+
+
+def _locate_object(
+    root: _ObjectSpan, path: tuple[ str, ... ]
+) -> __.typx.Optional[ _ObjectSpan ]:
+    span = root
+    for key in path:
+        member = next(
+            ( member for member in reversed( span.members )
+              if member.key == key ), None )
+        if member is None or member.value is None: return None
+        span = member.value
+    return span
+
+
+def _render_insertions(
+    text: str, span: _ObjectSpan, members: list[ str ]
+) -> tuple[ tuple[ int, str ], ... ]:
+    ''' Renders insertions of member texts into object.
+
+        Follows trailing-comma style of the object. A line comment after
+        the last member stays with that member.
+    '''
+    indentation, unit = _detect_member_indentation( text, span )
+    if not span.members:
+        fragment = ','.join( f"\n{indentation}{member}" for member in members )
+        if text.find( '\n', span.opening, span.closing ) == -1:
+            fragment = f"{fragment}\n{indentation[ : -len( unit ) ]}"
+        return ( ( span.opening + 1, fragment ), )
+    if span.comma is not None:
+        fragment = ''.join( f"\n{indentation}{member}," for member in members )
+        return ( ( span.comma + 1, fragment ), )
+    fragment = ''.join( f",\n{indentation}{member}" for member in members )
+    end = span.members[ -1 ].end
+    eol = text.find( '\n', end, span.closing )
+    if eol != -1 and text[ end : eol ].strip( ).startswith( '//' ):
+        return ( ( end, ',' ), ( eol, fragment[ 1 : ] ) )
+    return ( ( end, fragment ), )
+
+
+def _render_member(
+    text: str, span: _ObjectSpan, addition: _patches.SettingsAddition
+) -> str:
+    ''' Renders member text at indentation of object members. '''
+    indentation, unit = _detect_member_indentation( text, span )
+    value = __.json.dumps(
+        addition.value, indent = unit, ensure_ascii = False )
+    value = value.replace( '\n', f"\n{indentation}" )
+    return f"{__.json.dumps( addition.path[ -1 ] )}: {value}"
+
+
+def _parse_document(
+    text: str
+) -> tuple[ __.typx.Any, __.typx.Optional[ _ObjectSpan ] ]:
+    parser = _Parser( text )
+    value, span = parser.parse_value( )
+    parser.skip_insignificant( )
+    if parser.offset != len( text ):
+        raise _exceptions.JsoncInvalidity( parser.offset )
+    return value, span
+
+
+class _Parser:
+    ''' Single-pass recursive descent JSONC parser with object spans. '''
+
+    def __init__( self, text: str ):
+        self.text = text
+        self.offset: int = 0
+
+    def parse_value(
+        self
+    ) -> tuple[ __.typx.Any, __.typx.Optional[ _ObjectSpan ] ]:
+        self.skip_insignificant( )
+        text, offset = self.text, self.offset
+        if offset >= len( text ):
+            raise _exceptions.JsoncInvalidity( offset )
+        character = text[ offset ]
+        if character == '{': return self._parse_object( )
+        if character == '[': return self._parse_array( ), None
+        if character == '"': return self._parse_string( ), None
+        for literal, value in _LITERALS.items( ):
+            if text.startswith( literal, offset ):
+                self.offset += len( literal )
+                return value, None
+        match = _NUMBER_REGEX.match( text, offset )
+        if match is None:
+            raise _exceptions.JsoncInvalidity( offset )
+        self.offset = match.end( )
+        number = match.group( )
+        if any( marker in number for marker in '.eE' ):
+            return float( number ), None
+        return int( number ), None
+
+    def skip_insignificant( self ) -> None:
+        ''' Skips whitespace and comments. '''
+        text = self.text
+        while self.offset < len( text ):
+            character = text[ self.offset ]
+            if character in ' \t\r\n':
+                self.offset += 1
+            elif text.startswith( '//', self.offset ):
+                end = text.find( '\n', self.offset )
+                self.offset = len( text ) if end == -1 else end + 1
+            elif text.startswith( '/*', self.offset ):
+                end = text.find( '*/', self.offset + 2 )
+                if end == -1:
+                    raise _exceptions.JsoncInvalidity( self.offset )
+                self.offset = end + 2
+            else: return
+
+    def _expect( self, character: str ) -> None:
+        self.skip_insignificant( )
+        if not self.text.startswith( character, self.offset ):
+            raise _exceptions.JsoncInvalidity( self.offset )
+        self.offset += 1
+
+    def _parse_array( self ) -> list[ __.typx.Any ]:
+        self.offset += 1
+        items: list[ __.typx.Any ] = [ ]
+        while True:
+            self.skip_insignificant( )
+            if self.text.startswith( ']', self.offset ):
+                self.offset += 1
+                return items
+            item, _ = self.parse_value( )
+            items.append( item )
+            self.skip_insignificant( )
+            if self.text.startswith( ',', self.offset ): self.offset += 1
+            else:
+                self._expect( ']' )
+                return items
+
+    def _parse_object(
+        self
+    ) -> tuple[ dict[ str, __.typx.Any ], _ObjectSpan ]:
+        opening = self.offset
+        self.offset += 1
+        result: dict[ str, __.typx.Any ] = { }
+        members: list[ _Member ] = [ ]
+        comma = None
+        while True:
+            self.skip_insignificant( )
+            if self.text.startswith( '}', self.offset ): break
+            if not self.text.startswith( '"', self.offset ):
+                raise _exceptions.JsoncInvalidity( self.offset )
+            start = self.offset
+            key = self._parse_string( )
+            self._expect( ':' )
+            value, span = self.parse_value( )
+            result[ key ] = value
+            members.append( _Member(
+                key = key, start = start, end = self.offset, value = span ) )
+            self.skip_insignificant( )
+            comma = None
+            if self.text.startswith( ',', self.offset ):
+                comma = self.offset
+                self.offset += 1
+            elif self.text.startswith( '}', self.offset ): break
+            else:
+                raise _exceptions.JsoncInvalidity( self.offset )
+        closing = self.offset
+        self.offset += 1
+        return result, _ObjectSpan(
+            opening = opening, closing = closing,
+            members = tuple( members ), comma = comma )
+
+    def _parse_string( self ) -> str:
+        try:
+            value, end = _scan_string( self.text, self.offset + 1 )
+        except ValueError as exception:
+            raise _exceptions.JsoncInvalidity( self.offset ) from exception
+        self.offset = end
+        return value
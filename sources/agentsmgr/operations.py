@@ -30,9 +30,12 @@
 import difflib as _difflib
 
 from . import __
+from . import events as _events
 from . import exceptions as _exceptions
 from . import generator as _generator
+from . import gitdirs as _gitdirs
 from . import renderers as _renderers
+from . import timings as _timings
 
 
 _MANAGED_BLOCK_BEGIN = '# BEGIN: Managed by agentsmgr (emcd-agents)'
@@ -137,12 +140,23 @@ def generate_coder_item_type(
             __.provide_scribe( __name__ ).warning(
                 f"Skipping {item_type}/{item_name} for {coder}: "
                 "content not found" )
+            _timings.count( 'files-skipped' )
+            _events.emit(
+                _events.SkippedEvent, location = configuration_file,
+                simulated = simulate, reason = 'content not found' )
             continue
         items_attempted += 1
-        result = generator.render_single_item(
-            item_type, item_name, coder, target )
-        if save_content_text( result.content, result.location, simulate ):
-            items_written += 1
+        with _timings.span( 'render' ):
+            result = generator.render_single_item(
+                item_type, item_name, coder, target )
+        _events.emit(
+            _events.RenderedEvent, location = result.location,
+            simulated = simulate, item_type = item_type,
+            item_name = item_name, coder = coder )
+        with _timings.span( 'write' ):
+            written = save_content_text(
+                result.content, result.location, simulate )
+        if written: items_written += 1
     return ( items_attempted, items_written )
 
 
@@ -168,7 +182,11 @@ def save_content_bytes(
         In simulation mode, no actual writing occurs. Returns True if file
         was written, False if simulated.
     '''
-    if simulate: return False
+    if simulate:
+        _events.emit_written( location, content, simulated = True )
+        return False
+    _timings.count( 'bytes-written', len( content ) )
+    _timings.count( 'files-written' )
     try: location.parent.mkdir( parents = True, exist_ok = True )
     except ( OSError, IOError ) as exception:
         raise _exceptions.FileOperationFailure(
@@ -177,13 +195,28 @@ def save_content_bytes(
     except ( OSError, IOError ) as exception:
         raise _exceptions.FileOperationFailure(
             location, "save content" ) from exception
+    _events.emit_written( location, content )
     return True
 
 
+def locate_git_exclude( target: __.Path ) -> __.typx.Optional[ __.Path ]:
+    ''' Locates .git/info/exclude for repository containing target.
+
+        Returns None if target is not in a git repository or if the
+        repository has no exclude file.
+    '''
+    git_dir = _resolve_git_directory( target )
+    if not git_dir: return None
+    exclude_file = git_dir / 'info' / 'exclude'
+    if not exclude_file.exists( ): return None
+    return exclude_file
+
+
 def update_git_exclude(
     target: __.Path,
     entries: __.cabc.Collection[ str ],
-    simulate: bool = False
+    simulate: bool = False,
+    location: __.Absential[ __.typx.Optional[ __.Path ] ] = __.absent,
 ) -> int:
     ''' Updates .git/info/exclude with managed block of agentsmgr entries.
 
@@ -193,15 +226,17 @@ def update_git_exclude(
         managed block are preserved.
 
         Uses repository discovery from the explicit target and uses the
-        common git directory for shared resources in worktrees.
+        common git directory for shared resources in worktrees. Discovery
+        is skipped if location is supplied, as from
+        :py:func:`locate_git_exclude`.
 
         Returns count of entries in managed block.
     '''
     if simulate: return 0
-    git_dir = _resolve_git_directory( target )
-    if not git_dir: return 0
-    exclude_file = git_dir / 'info' / 'exclude'
-    if not exclude_file.exists( ): return 0
+    exclude_file = (
+        locate_git_exclude( target ) if __.is_absent( location )
+        else location )
+    if exclude_file is None: return 0
     try: content = exclude_file.read_text( encoding = 'utf-8' )
     except ( OSError, IOError ) as exception:
         raise _exceptions.FileOperationFailure(
@@ -274,6 +309,13 @@ def _remove_managed_block( content: str ) -> str:
     return '\n'.join( result_lines ) + '\n'
 
 
+def _warn_malformed_block( ) -> None:
+    ''' Warns of malformed managed block, which is then rebuilt. '''
+    message = "Malformed agentsmgr block in .git/info/exclude; rebuilding."
+    __.provide_scribe( __name__ ).warning( message )
+    _events.emit( _events.WarningEvent, message = message )
+
+
 def _partition_around_managed_block(
     lines: __.cabc.Sequence[ str ]
 ) -> tuple[ list[ str ], list[ str ] ]:
@@ -287,12 +329,10 @@ def _partition_around_managed_block(
     except ValueError: return ( list( lines ), [ ] )
     try: end_index = lines.index( _MANAGED_BLOCK_END, begin_index )
     except ValueError:
-        __.provide_scribe( __name__ ).warning(
-            "Malformed agentsmgr block in .git/info/exclude; rebuilding." )
+        _warn_malformed_block( )
         return ( list( lines ), [ ] )
     if end_index < begin_index:
-        __.provide_scribe( __name__ ).warning(
-            "Malformed agentsmgr block in .git/info/exclude; rebuilding." )
+        _warn_malformed_block( )
         return ( list( lines ), [ ] )
     before_block = list( lines[ :begin_index ] )
     while before_block and not before_block[ -1 ].strip( ):
@@ -307,30 +347,15 @@ def _resolve_git_directory(
 ) -> __.typx.Optional[ __.Path ]:
     ''' Resolves git directory location, handling worktrees.
 
-        Uses Dulwich to discover the repository from the explicit target.
-        Returns common git directory (shared across worktrees) for access
-        to shared resources like info/exclude.
-
-        Returns None if not in a git repository or on error.
-    '''
-    from dulwich.repo import Repo
-    try: repo = Repo.discover( str( start_path ) )
-    except Exception: return None
-    git_dir_path = __.Path( repo.controldir( ) )
-    return _discover_common_git_directory( git_dir_path )
-
-def _discover_common_git_directory( git_dir: __.Path ) -> __.Path:
-    ''' Discovers common git directory, handling worktree commondir.
+        Discovers the repository from the explicit target without opening
+        its object store. Returns common git directory (shared across
+        worktrees) for access to shared resources like info/exclude.
 
-        For worktrees, reads commondir file to find shared resources.
-        For standard repos, returns git_dir unchanged.
+        Returns None if not in a git repository.
     '''
-    commondir_file = git_dir / 'commondir'
-    if not commondir_file.exists( ):
-        return git_dir
-    try: common_path = commondir_file.read_text( encoding = 'utf-8' ).strip( )
-    except ( OSError, IOError ): return git_dir
-    return ( git_dir / common_path ).resolve( )
+    directories = _gitdirs.discover_git_directories( start_path )
+    if directories is None: return None
+    return directories.common
 
 
 def generate_distribution(
@@ -355,8 +380,9 @@ def generate_distribution(
         for item_type in renderer.item_types_available:
             if item_type == 'skills':
                 continue  # Skills are direct distribution artifacts.
-            attempted, written = _generate_for_distribution(
-                generator, coder_name, item_type, distribution, simulate )
+            with _timings.span( f"{coder_name}/{item_type}" ):
+                attempted, written = _generate_for_distribution(
+                    generator, coder_name, item_type, distribution, simulate )
             items_attempted += attempted
             items_written += written
     return ( items_attempted, items_written )
@@ -388,17 +414,28 @@ def _generate_for_distribution(
             __.provide_scribe( __name__ ).warning(
                 f"Skipping {item_type}/{item_name} for {coder}: "
                 "content not found" )
+            _timings.count( 'files-skipped' )
+            _events.emit(
+                _events.SkippedEvent, location = configuration_file,
+                simulated = simulate, reason = 'content not found' )
             continue
         items_attempted += 1
-        result = generator.render_single_item(
-            item_type, item_name, coder, distribution )
+        with _timings.span( 'render' ):
+            result = generator.render_single_item(
+                item_type, item_name, coder, distribution )
         renderer = _renderers.RENDERERS[ coder ]
         dirname = renderer.produce_output_structure( item_type )
         output_path = (
             distribution / 'per-project' / 'coders' / coder / dirname /
             f"{item_name}.{_parse_output_extension( result.location )}" )
-        if save_content_text( result.content, output_path, simulate ):
-            items_written += 1
+        _events.emit(
+            _events.RenderedEvent, location = output_path,
+            simulated = simulate, item_type = item_type,
+            item_name = item_name, coder = coder )
+        with _timings.span( 'write' ):
+            written = save_content_text(
+                result.content, output_path, simulate )
+        if written: items_written += 1
     return ( items_attempted, items_written )
 
 
@@ -436,8 +473,9 @@ def check_distribution_staleness(
         for item_type in renderer.item_types_available:
             if item_type == 'skills':
                 continue
-            checked, diffs, paths = _check_staleness_for_type(
-                generator, coder_name, item_type, distribution )
+            with _timings.span( f"{coder_name}/{item_type}" ):
+                checked, diffs, paths = _check_staleness_for_type(
+                    generator, coder_name, item_type, distribution )
             items_checked += checked
             all_diffs.extend( diffs )
             expected_paths.update( paths )
@@ -471,13 +509,18 @@ def _check_staleness_for_type(
         if not _content_exists( generator, item_type, item_name, coder ):
             continue
         items_checked += 1
-        result = generator.render_single_item(
-            item_type, item_name, coder, distribution )
+        with _timings.span( 'render' ):
+            result = generator.render_single_item(
+                item_type, item_name, coder, distribution )
         renderer = _renderers.RENDERERS[ coder ]
         dirname = renderer.produce_output_structure( item_type )
         output_path = (
             distribution / 'per-project' / 'coders' / coder / dirname /
             f"{item_name}.{_parse_output_extension( result.location )}" )
+        _events.emit(
+            _events.RenderedEvent, location = output_path,
+            simulated = True, item_type = item_type,
+            item_name = item_name, coder = coder )
         expected_paths.add( output_path )
         if not output_path.exists( ):
             diffs.append(
@@ -485,6 +528,7 @@ def _check_staleness_for_type(
                 f"missing from distribution" )
             continue
         existing_content = output_path.read_text( encoding = 'utf-8' )
+        _timings.count( 'bytes-read', len( existing_content ) )
         if result.content != existing_content:
             diff_lines = list( _difflib.unified_diff(
                 existing_content.splitlines( ),
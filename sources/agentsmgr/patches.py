@@ -0,0 +1,112 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Structured patches for additive settings merges.
+
+    Settings templates are merged into user settings additively: keys
+    missing from user settings are added, nested tables are merged
+    recursively, and user values always win on conflict. A patch records
+    only the additions, so that unchanged settings need neither copying
+    nor rewriting, and so that pending changes can be displayed.
+'''
+
+
+from . import __
+
+
+_VALUE_DISPLAY_LENGTH_MAXIMUM = 60
+
+
+class SettingsAddition( __.immut.DataclassObject ):
+    ''' Addition of value at key path within settings. '''
+
+    path: tuple[ str, ... ]
+    value: __.typx.Any
+
+    def render_as_markdown( self ) -> str:
+        ''' Renders addition as one Markdown line. '''
+        value = __.json.dumps( self.value, default = str )
+        if len( value ) > _VALUE_DISPLAY_LENGTH_MAXIMUM:
+            value = f"{value[ : _VALUE_DISPLAY_LENGTH_MAXIMUM - 1 ]}…"
+        return f"+ {'.'.join( self.path )} = {value}"
+
+
+class SettingsPatch( __.immut.DataclassObject ):
+    ''' Additions which bring user settings up to date with template. '''
+
+    additions: tuple[ SettingsAddition, ... ] = ( )
+
+    def __bool__( self ) -> bool: return bool( self.additions )
+
+    def render_as_markdown( self ) -> tuple[ str, ... ]:
+        ''' Renders patch as Markdown lines for display. '''
+        return tuple(
+            addition.render_as_markdown( ) for addition in self.additions )
+
+
+def calculate_settings_patch(
+    settings: __.cabc.Mapping[ str, __.typx.Any ],
+    template: __.cabc.Mapping[ str, __.typx.Any ],
+) -> SettingsPatch:
+    ''' Calculates additions needed to merge template into settings.
+
+        Adds keys from template that are missing in settings. When both
+        contain same key with table values, recursively merges nested
+        tables. For conflicting values, settings value wins (user
+        preferences preserved). Neither argument is modified.
+    '''
+    additions: list[ SettingsAddition ] = [ ]
+    _survey_additions( settings, template, ( ), additions )
+    return SettingsPatch( additions = tuple( additions ) )
+
+
+def apply_settings_patch(
+    settings: dict[ str, __.typx.Any ], patch: SettingsPatch
+) -> None:
+    ''' Applies patch to settings in place.
+
+        Only tables along addition paths are visited; untouched subtrees
+        are neither traversed nor copied.
+    '''
+    for addition in patch.additions:
+        table = settings
+        for key in addition.path[ : -1 ]: table = table[ key ]
+        table[ addition.path[ -1 ] ] = addition.value
+
+
+def _survey_additions(
+    settings: __.cabc.Mapping[ str, __.typx.Any ],
+    template: __.cabc.Mapping[ str, __.typx.Any ],
+    prefix: tuple[ str, ... ],
+    additions: list[ SettingsAddition ],
+) -> None:
+    for key, value in template.items( ):
+        path = ( *prefix, key )
+        if key not in settings:
+            additions.append( SettingsAddition( path = path, value = value ) )
+            continue
+        current = settings[ key ]
+        if (    isinstance( current, __.cabc.Mapping )
+            and isinstance( value, __.cabc.Mapping )
+        ):
+            _survey_additions(
+                __.typx.cast( __.cabc.Mapping[ str, __.typx.Any ], current ),
+                __.typx.cast( __.cabc.Mapping[ str, __.typx.Any ], value ),
+                path, additions )
@@ -25,9 +25,12 @@
 '''
 
 
+from appcore import cli as _appcore_cli
+
 from . import __
 from . import cmdbase as _cmdbase
 from . import core as _core
+from . import events as _events
 from . import exceptions as _exceptions
 from . import generator as _generator
 from . import memorylinks as _memorylinks
@@ -35,11 +38,48 @@ from . import operations as _operations
 from . import renderers as _renderers
 from . import resolver as _resolver
 from . import results as _results
+from . import symlinks as _symlinks
+from . import timings as _timings
 from . import userdata as _userdata
 
 
 _scribe = __.provide_scribe( __name__ )
 
+_OFFLOADS_MAXIMUM = 4
+
+_T = __.typx.TypeVar( '_T' )
+
+
+async def _offload(
+    limiter: __.asyncio.Semaphore,
+    names: __.cabc.Sequence[ str ],
+    function: __.cabc.Callable[ ..., _T ],
+    *posargs: __.typx.Any,
+    **nomargs: __.typx.Any,
+) -> _T:
+    ''' Runs blocking function in worker thread within named spans.
+
+        Spans nest beneath innermost span open where work is offloaded.
+        Limiter bounds number of worker threads in use at once.
+    '''
+    path = _timings.locate( )
+    def run( ) -> _T:
+        with __.ctxl.ExitStack( ) as spans:
+            spans.enter_context( _timings.adopting( path ) )
+            for name in names: spans.enter_context( _timings.span( name ) )
+            return function( *posargs, **nomargs )
+    async with limiter: return await __.asyncio.to_thread( run )
+
+
+async def _settle( *tasks: __.asyncio.Task[ __.typx.Any ] ) -> None:
+    ''' Waits for all tasks, then raises first failure, if any.
+
+        Worker threads cannot be cancelled, so sibling stages finish
+        before a failure propagates.
+    '''
+    if tasks: await __.asyncio.wait( tasks )
+    for task in tasks: task.result( )
+
 
 def _produce_default_configuration(
     location: __.Path,
@@ -55,6 +95,19 @@ def _produce_default_configuration(
     return { 'coders': coders, 'languages': [ 'python' ] }
 
 
+def produce_distribution_generator(
+    location: __.Path,
+    application_configuration: __.cabc.Mapping[ str, __.typx.Any ],
+) -> _generator.ContentGenerator:
+    ''' Produces generator which renders components/ for distribution. '''
+    return _generator.ContentGenerator(
+        location = location,
+        configuration = _produce_default_configuration( location ),
+        application_configuration = application_configuration,
+        mode = 'per-project',
+    )
+
+
 SourceArgument: __.typx.TypeAlias = __.typx.Annotated[
     __.tyro.conf.Positional[ str ],
     __.tyro.conf.arg( help = "Data source (local path or git URL)" ),
@@ -96,53 +149,41 @@ def _create_all_symlinks(
 ) -> tuple[ str, ... ]:
     ''' Creates all symlinks and returns their names for git exclude.
 
-        Creates memory symlinks for all coders and coder directory
-        symlinks for per-project mode. Returns list of all symlink
-        names (both newly created and pre-existing) for git exclude
-        update.
+        Declares memory symlinks for all coders, coder directory symlinks
+        for per-project mode, and the OpenSpec home symlink. Surveys them
+        as one batch and applies only links which differ from the desired
+        state. Returns list of all symlink names (both newly created and
+        pre-existing) for git exclude update.
     '''
-    all_symlink_names: list[ str ] = [ ]
-    if mode == 'nowhere': return tuple( all_symlink_names )
-    links_attempted, links_created, symlink_names_memory = (
-        _memorylinks.create_memory_symlinks_for_coders(
-            coders = configuration[ 'coders' ],
-            target = target,
-            simulate = simulate,
-        ) )
-    all_symlink_names.extend( symlink_names_memory )
-    if links_created > 0:
-        _scribe.info(
-            f"Created {links_created}/{links_attempted} memory symlinks" )
+    if mode == 'nowhere': return ( )
+    coders = configuration[ 'coders' ]
+    intentions = list(
+        _memorylinks.produce_memory_symlink_intentions( coders, target ) )
     needs_coder_symlinks = (
         mode == 'per-project'
         or ( mode == 'default' and any(
             coder in _renderers.RENDERERS
             and _renderers.RENDERERS[ coder ].mode_default == 'per-project'
-            for coder in configuration[ 'coders' ] ) ) )
+            for coder in coders ) ) )
     if needs_coder_symlinks:
-        (   coder_symlinks_attempted,
-            coder_symlinks_created,
-            coder_symlink_names ) = (
-            _create_coder_directory_symlinks(
-                coders = configuration[ 'coders' ],
-                target = target,
-                simulate = simulate,
-            ) )
-        all_symlink_names.extend( coder_symlink_names )
-        if coder_symlinks_created > 0:
-            _scribe.info(
-                f"Created {coder_symlinks_created}/"
-                f"{coder_symlinks_attempted} coder directory symlinks" )
-    openspec_link_path = target / 'openspec'
+        intentions.extend(
+            _produce_coder_directory_symlink_intentions( coders, target ) )
     openspec_source_path = (
         target / 'documentation' / 'architecture' / 'openspec' )
     if not simulate:
         openspec_source_path.mkdir( parents = True, exist_ok = True )
-    _, symlink_name_openspec = _memorylinks.create_memory_symlink(
-        openspec_source_path, openspec_link_path, simulate )
-    all_symlink_names.append( symlink_name_openspec )
-    _scribe.info( "Created 1/1 openspec symlink" )
-    return tuple( all_symlink_names )
+    intentions.append( _symlinks.SymlinkIntention(
+        source = openspec_source_path, link = target / 'openspec' ) )
+    plan = _symlinks.survey_symlinks( intentions )
+    changed = _symlinks.apply_symlink_plan( plan, simulate )
+    if changed > 0:
+        _scribe.info(
+            f"Created {changed}/{len( plan.actions )} project symlinks" )
+    return tuple( intention.link.name for intention in intentions )
+
+
+_INSTRUCTIONS_INDEX_NAME = 'languages.toml'
+_INSTRUCTIONS_LANGUAGE_PREFIX = 'practices-'
 
 
 def _copy_instructions_from_distribution(
@@ -150,11 +191,14 @@ def _copy_instructions_from_distribution(
     target: __.Path,
     instructions_target: str,
     simulate: bool,
+    languages: __.typx.Optional[ __.cabc.Collection[ str ] ] = None,
 ) -> tuple[ int, int, tuple[ str, ... ] ]:
     ''' Copies instruction files from distribution/ to target.
 
         Reads from distribution/per-project/general/instructions/ and
-        copies to the configured instructions target path.
+        copies to the configured instructions target path. When languages
+        are given, copies only instructions relevant to them and removes
+        previously copied instructions which are not.
         Returns tuple of (files_attempted, files_written, exclude_entries).
     '''
     import contextlib as _contextlib
@@ -162,11 +206,12 @@ def _copy_instructions_from_distribution(
     if not source_dir.exists( ):
         return ( 0, 0, ( ) )
     target_dir = target / instructions_target
+    selected, deselected = _select_instructions( source_dir, languages )
+    _prune_instructions( target_dir, deselected, simulate )
     files_attempted = 0
     files_written = 0
     exclude_entries: list[ str ] = [ ]
-    for source_file in source_dir.glob( '*' ):
-        if not source_file.is_file( ): continue
+    for source_file in selected:
         files_attempted += 1
         dest_path = target_dir / source_file.name
         if _operations.save_content_text(
@@ -181,6 +226,86 @@ def _copy_instructions_from_distribution(
     return ( files_attempted, files_written, tuple( exclude_entries ) )
 
 
+def _select_instructions(
+    source_dir: __.Path,
+    languages: __.typx.Optional[ __.cabc.Collection[ str ] ],
+) -> tuple[ tuple[ __.Path, ... ], tuple[ __.Path, ... ] ]:
+    ''' Partitions instruction files by relevance to languages.
+
+        Language applicability comes from the ``languages.toml`` index
+        alongside the instructions, falling back to the
+        ``practices-<language>.rst`` filename convention. Files with no
+        language applicability are relevant to every project. Returns
+        tuple of (selected, deselected) files.
+    '''
+    applicability = _load_instructions_index( source_dir )
+    selected: list[ __.Path ] = [ ]
+    deselected: list[ __.Path ] = [ ]
+    for source_file in sorted( source_dir.glob( '*' ) ):
+        if not source_file.is_file( ): continue
+        if source_file.name == _INSTRUCTIONS_INDEX_NAME: continue
+        applicable = applicability.get( source_file.name )
+        if applicable is None and source_file.stem.startswith(
+            _INSTRUCTIONS_LANGUAGE_PREFIX
+        ):
+            applicable = ( source_file.stem[
+                len( _INSTRUCTIONS_LANGUAGE_PREFIX ): ], )
+        if (    languages is None
+            or  applicable is None
+            or  not frozenset( applicable ).isdisjoint( languages )
+        ): selected.append( source_file )
+        else: deselected.append( source_file )
+    return ( tuple( selected ), tuple( deselected ) )
+
+
+def _load_instructions_index(
+    source_dir: __.Path
+) -> dict[ str, tuple[ str, ... ] ]:
+    ''' Loads language applicability index for instruction files. '''
+    index_file = source_dir / _INSTRUCTIONS_INDEX_NAME
+    if not index_file.is_file( ): return { }
+    try:
+        with index_file.open( 'rb' ) as stream:
+            index = __.tomli.load( stream )
+    except ( OSError, __.tomli.TOMLDecodeError ) as exception:
+        raise _exceptions.ConfigurationInvalidity( exception ) from exception
+    entries = index.get( 'instructions', { } )
+    if not isinstance( entries, dict ):
+        message = f"Ignoring malformed instructions index: {index_file}"
+        _scribe.warning( message )
+        _events.emit( _events.WarningEvent, message = message )
+        return { }
+    return {
+        name: tuple(
+            str( language ) for language in __.typx.cast(
+                list[ __.typx.Any ], applicable ) )
+        for name, applicable in __.typx.cast(
+            dict[ str, __.typx.Any ], entries ).items( )
+        if isinstance( applicable, list ) }
+
+
+def _prune_instructions(
+    target_dir: __.Path,
+    deselected: __.cabc.Sequence[ __.Path ],
+    simulate: bool,
+) -> None:
+    ''' Removes previously copied instructions which are not relevant. '''
+    for source_file in deselected:
+        dest_path = target_dir / source_file.name
+        if not dest_path.is_file( ): continue
+        if simulate:
+            _scribe.info( f"Would remove irrelevant instruction: {dest_path}" )
+            _events.emit(
+                _events.PrunedEvent, location = dest_path, simulated = True )
+            continue
+        try: dest_path.unlink( )
+        except OSError as exception:
+            raise _exceptions.FileOperationFailure(
+                dest_path, "remove instruction file" ) from exception
+        _scribe.info( f"Removed irrelevant instruction: {dest_path}" )
+        _events.emit( _events.PrunedEvent, location = dest_path )
+
+
 def _populate_per_user_content(
     location: __.Path,
     coders: __.cabc.Sequence[ str ],
@@ -202,44 +327,59 @@ def _populate_per_user_content(
     return ( attempted, written )
 
 
-def _create_coder_directory_symlinks(
+def _produce_coder_directory_symlink_intentions(
     coders: __.cabc.Sequence[ str ],
     target: __.Path,
-    simulate: bool = False,
-) -> tuple[ int, int, tuple[ str, ... ] ]:
-    ''' Creates symlinks from .{coder} to .auxiliary/configuration/coders/.
+) -> tuple[ _symlinks.SymlinkIntention, ... ]:
+    ''' Declares symlinks from .{coder} to .auxiliary/configuration/coders/.
 
-        For per-project mode, creates symlinks that make coder directories
-        accessible at their expected locations (.claude, .opencode, etc.)
-        while keeping actual files organized under
+        For per-project mode, symlinks make coder directories accessible
+        at their expected locations (.claude, .opencode, etc.) while
+        keeping actual files organized under
         .auxiliary/configuration/coders/.
 
         Each renderer is responsible for specifying its symlink requirements
         via provide_project_symlinks(). Population logic simply iterates
         coders and asks renderers for their symlinks.
 
-        Only creates symlinks for coders whose default mode is per-project.
+        Only declares symlinks for coders whose default mode is per-project.
         Coders with per-user default mode are skipped since they do not
         use per-project directories.
+    '''
+    return tuple(
+        _symlinks.SymlinkIntention( source = source, link = link_path )
+        for _, renderer in _resolver.resolve_coders(
+            coders, mode = 'per-project' )
+        for source, link_path in renderer.provide_project_symlinks( target ) )
+
+
+def _survey_coder_trees(
+    distribution: __.Path,
+    coders: __.cabc.Sequence[ str ],
+    target: __.Path,
+    *,
+    configuration: __.cabc.Mapping[ str, __.typx.Any ],
+    mode: _renderers.ExplicitTargetMode,
+) -> tuple[ tuple[ str, __.Path, __.Path ], ... ]:
+    ''' Surveys distribution coder trees to copy.
 
-        Returns tuple of (attempted, created, symlink_names) where
-        symlink_names contains names of all symlinks (both newly created
-        and pre-existing).
+        Returns tuples of (coder_name, source, base_directory) for each
+        coder which has a tree in the distribution.
     '''
-    attempted = 0
-    created = 0
-    symlink_names: list[ str ] = [ ]
-    for coder_name, renderer in _resolver.resolve_coders(
-        coders, mode = 'per-project'
+    trees: list[ tuple[ str, __.Path, __.Path ] ] = [ ]
+    for coder_name, manager in _resolver.resolve_coders(
+        coders, mode = mode
     ):
-        for source, link_path in renderer.provide_project_symlinks( target ):
-            attempted += 1
-            was_created, symlink_name = (
-                _memorylinks.create_memory_symlink(
-                    source, link_path, simulate ) )
-            if was_created: created += 1
-            symlink_names.append( symlink_name )
-    return ( attempted, created, tuple( symlink_names ) )
+        base_directory = manager.resolve_base_directory(
+            mode = mode,
+            target = target,
+            configuration = configuration,
+            environment = __.os.environ,
+        )
+        coder_source = distribution / mode / 'coders' / coder_name
+        if coder_source.exists( ):
+            trees.append( ( coder_name, coder_source, base_directory ) )
+    return tuple( trees )
 
 
 def _copy_distribution_items(  # noqa: PLR0913
@@ -266,26 +406,57 @@ def _copy_distribution_items(  # noqa: PLR0913
     items_attempted = 0
     items_written = 0
     exclude_entries: list[ str ] = [ ]
-    for coder_name, manager in _resolver.resolve_coders(
-        coders, mode = mode
+    for coder_name, coder_source, base_directory in _survey_coder_trees(
+        distribution, coders, target,
+        configuration = configuration, mode = mode
     ):
-        base_directory = manager.resolve_base_directory(
-            mode = mode,
-            target = target,
-            configuration = configuration,
-            environment = __.os.environ,
-        )
-        coder_source = distribution / mode / 'coders' / coder_name
         # Copy entire coder tree (commands, agents, resources).
-        if coder_source.exists( ):
+        with _timings.span( coder_name ):
             attempted, written, entries = _copy_tree(
                 coder_source, base_directory, target, simulate )
-            items_attempted += attempted
-            items_written += written
-            exclude_entries.extend( entries )
+        items_attempted += attempted
+        items_written += written
+        exclude_entries.extend( entries )
     if mode == 'per-project':
-        attempted, written, entries = _copy_skills(
-            distribution, target, coders, configuration, simulate )
+        with _timings.span( 'copy-skills' ):
+            attempted, written, entries = _copy_skills(
+                distribution, target, coders, configuration, simulate )
+        items_attempted += attempted
+        items_written += written
+        exclude_entries.extend( entries )
+    return ( items_attempted, items_written, tuple( exclude_entries ) )
+
+
+async def _copy_project_distribution(
+    distribution: __.Path,
+    target: __.Path,
+    configuration: __.cabc.Mapping[ str, __.typx.Any ],
+    simulate: bool,
+    limiter: __.asyncio.Semaphore,
+) -> tuple[ int, int, tuple[ str, ... ] ]:
+    ''' Copies per-project distribution items concurrently.
+
+        Each coder tree and the skills tree copy in separate worker
+        threads, since their destinations are disjoint. Returns tuple of
+        (items_attempted, items_written, exclude_entries).
+    '''
+    coders = configuration[ 'coders' ]
+    tasks = [
+        __.asyncio.create_task( _offload(
+            limiter, ( 'copy-distribution', coder_name ), _copy_tree,
+            coder_source, base_directory, target, simulate ) )
+        for coder_name, coder_source, base_directory in _survey_coder_trees(
+            distribution, coders, target,
+            configuration = configuration, mode = 'per-project' ) ]
+    tasks.append( __.asyncio.create_task( _offload(
+        limiter, ( 'copy-distribution', 'copy-skills' ), _copy_skills,
+        distribution, target, coders, configuration, simulate ) ) )
+    await _settle( *tasks )
+    items_attempted = 0
+    items_written = 0
+    exclude_entries: list[ str ] = [ ]
+    for task in tasks:
+        attempted, written, entries = task.result( )
         items_attempted += attempted
         items_written += written
         exclude_entries.extend( entries )
@@ -313,13 +484,8 @@ def _copy_tree(
         files_attempted += 1
         relative = source_file.relative_to( source )
         dest_path = target / relative
-        if _operations.save_content_bytes(
-            source_file.read_bytes( ),
-            dest_path,
-            simulate,
-        ):
+        if _copy_file( source_file, dest_path, simulate ):
             files_written += 1
-            __.shutil.copymode( source_file, dest_path )
         with _contextlib.suppress( ValueError ):
             exclude_entries.append(
                 _format_exclude_path(
@@ -327,67 +493,24 @@ def _copy_tree(
     return ( files_attempted, files_written, tuple( exclude_entries ) )
 
 
-def _canonical_skills_directory( project_root: __.Path ) -> __.Path:
-    ''' Returns project-canonical skills root under .auxiliary/agents. '''
-    return project_root / '.auxiliary' / 'agents' / 'skills'
-
+def _copy_file( source: __.Path, target: __.Path, simulate: bool ) -> bool:
+    ''' Copies file content (binary-safe) and mode to target.
 
-def _ensure_directory_symlink(
-    source: __.Path,
-    link_path: __.Path,
-    *,
-    simulate: bool = False,
-    replace_existing: bool = False,
-) -> bool:
-    ''' Ensures link_path is a symlink to source.
-
-        When replace_existing is true, removes an existing non-symlink
-        directory or file at link_path so managed coder skill trees can cut
-        over to the canonical package root. When false (default), leaves an
-        existing non-symlink path in place and reports a warning — used for
-        root ``.agents``, which may belong to another tool. Returns whether
-        the symlink was created or updated.
+        Returns True if file was written, False if simulated.
     '''
-    try:
-        relative_source = __.os.path.relpath(
-            source, start = link_path.parent )
-    except ValueError:
-        relative_source = str( source.resolve( ) )
-    if link_path.is_symlink( ):
-        try: current_target = __.os.readlink( link_path )
-        except OSError as exception:
-            _scribe.warning(
-                f"Cannot read symlink {link_path}: {exception}." )
-            return False
-        if current_target == relative_source:
-            return False
-        _scribe.info(
-            f"Updating symlink {link_path.name}: "
-            f"{current_target} → {relative_source}" )
-        if not simulate: link_path.unlink( )
-    elif link_path.exists( ):
-        if not replace_existing:
-            _scribe.warning(
-                f"Path already exists at {link_path}; "
-                "not replacing with symlink. Remove or relocate it to "
-                "enable agentsmgr skills discovery linking." )
-            return False
-        _scribe.info(
-            f"Replacing existing path with symlink: {link_path}" )
-        if not simulate:
-            if link_path.is_dir( ): __.shutil.rmtree( link_path )
-            else: link_path.unlink( )
-    if not simulate:
-        link_path.parent.mkdir( parents = True, exist_ok = True )
-        link_path.symlink_to( relative_source )
-        _scribe.info( f"Created directory symlink: {link_path.name}" )
-    else:
-        _scribe.info(
-            f"[SIMULATE] Would create symlink: "
-            f"{link_path} → {relative_source}" )
+    content = source.read_bytes( )
+    _timings.count( 'bytes-read', len( content ) )
+    if not _operations.save_content_bytes( content, target, simulate ):
+        return False
+    __.shutil.copymode( source, target )
     return True
 
 
+def _canonical_skills_directory( project_root: __.Path ) -> __.Path:
+    ''' Returns project-canonical skills root under .auxiliary/agents. '''
+    return project_root / '.auxiliary' / 'agents' / 'skills'
+
+
 def _link_skills_discovery(
     project_root: __.Path,
     coders: __.cabc.Sequence[ str ],
@@ -402,19 +525,12 @@ def _link_skills_discovery(
           (destructive cutover of legacy dual-copy skill trees only)
     '''
     import contextlib as _contextlib
-    exclude_entries: list[ str ] = [ ]
     agents_source = project_root / '.auxiliary' / 'agents'
-    agents_link = project_root / '.agents'
-    if not simulate:
-        agents_source.mkdir( parents = True, exist_ok = True )
-    if _ensure_directory_symlink(
-        agents_source, agents_link,
-        simulate = simulate, replace_existing = False,
-    ) or agents_link.is_symlink( ):
-        exclude_entries.append( agents_link.name )
     canonical = _canonical_skills_directory( project_root )
     if not simulate:
         canonical.mkdir( parents = True, exist_ok = True )
+    intentions = [ _symlinks.SymlinkIntention(
+        source = agents_source, link = project_root / '.agents' ) ]
     for _, manager in _resolver.resolve_coders(
         coders, mode = 'per-project'
     ):
@@ -426,15 +542,19 @@ def _link_skills_discovery(
             environment = __.os.environ,
         )
         skills_name = manager.calculate_directory_location( 'skills' )
-        link_path = base_directory / skills_name
-        if _ensure_directory_symlink(
-            canonical, link_path,
-            simulate = simulate, replace_existing = True,
-        ) or link_path.is_symlink( ):
-            with _contextlib.suppress( ValueError ):
-                exclude_entries.append(
-                    _format_exclude_path(
-                        link_path.relative_to( project_root ) ) )
+        intentions.append( _symlinks.SymlinkIntention(
+            source = canonical,
+            link = base_directory / skills_name,
+            replace_existing = True ) )
+    plan = _symlinks.survey_symlinks( intentions )
+    _symlinks.apply_symlink_plan( plan, simulate )
+    exclude_entries: list[ str ] = [ ]
+    for action in plan.actions:
+        if not action.managed: continue
+        with _contextlib.suppress( ValueError ):
+            exclude_entries.append(
+                _format_exclude_path(
+                    action.intention.link.relative_to( project_root ) ) )
     return tuple( exclude_entries )
 
 
@@ -492,56 +612,297 @@ def _copy_skills(
             if item_name in directory_skills: continue
             items_attempted += 1
             dest_path = canonical / item_name / 'SKILL.md'
-            if _operations.save_content_bytes(
-                skill_file.read_bytes( ),
-                dest_path,
-                simulate,
-            ):
+            if _copy_file( skill_file, dest_path, simulate ):
                 items_written += 1
-                __.shutil.copymode( skill_file, dest_path )
             with _contextlib.suppress( ValueError ):
                 exclude_entries.append(
                     _format_exclude_path(
                         dest_path.relative_to( project_root ) ) )
-    exclude_entries.extend(
-        _link_skills_discovery(
-            project_root, coders, configuration, simulate ) )
+    with _timings.span( 'link-skills' ):
+        exclude_entries.extend(
+            _link_skills_discovery(
+                project_root, coders, configuration, simulate ) )
     return ( items_attempted, items_written, tuple( exclude_entries ) )
 
 
-def _manage_project_auxiliaries(
+async def _manage_project_auxiliaries(
     configuration: __.cabc.Mapping[ str, __.typx.Any ],
     distribution: __.Path,
     target: __.Path,
-    distribution_entries: __.cabc.Sequence[ str ],
-    simulate: bool
-) -> None:
-    ''' Manages auxiliary project files (instructions, symlinks, excludes). '''
-    instruction_entries: tuple[ str, ... ] = ( )
+    simulate: bool,
+    limiter: __.typx.Optional[ __.asyncio.Semaphore ] = None,
+) -> tuple[ tuple[ str, ... ], __.typx.Optional[ __.Path ] ]:
+    ''' Manages auxiliary project files (instructions, symlinks).
+
+        Copies instructions, creates symlinks, and locates the git exclude
+        file concurrently. Returns exclude entries for instructions and
+        symlinks, along with location of git exclude file, if any.
+    '''
+    if limiter is None: limiter = __.asyncio.Semaphore( _OFFLOADS_MAXIMUM )
+    symlinking = __.asyncio.create_task( _offload(
+        limiter, ( 'project-auxiliaries', 'symlinks' ),
+        _create_all_symlinks,
+        configuration, target, 'per-project', simulate ) )
+    locating = __.asyncio.create_task( _offload(
+        limiter, ( 'project-auxiliaries', 'git-exclude-discovery' ),
+        _operations.locate_git_exclude, target ) )
+    tasks: list[ __.asyncio.Task[ __.typx.Any ] ] = [ symlinking, locating ]
+    instructing: __.typx.Optional[
+        __.asyncio.Task[ tuple[ int, int, tuple[ str, ... ] ] ] ] = None
     if configuration.get( 'provide_instructions', False ):
         instructions_target = configuration.get(
             'instructions_target', '.auxiliary/agents/standards' )
+        instructing = __.asyncio.create_task( _offload(
+            limiter, ( 'project-auxiliaries', 'instructions' ),
+            _copy_instructions_from_distribution,
+            distribution, target, instructions_target, simulate,
+            languages = configuration[ 'languages' ] ) )
+        tasks.append( instructing )
+    await _settle( *tasks )
+    entries: list[ str ] = [ ]
+    if instructing is not None:
         instructions_attempted, instructions_written, instruction_entries = (
-            _copy_instructions_from_distribution(
-                distribution, target, instructions_target, simulate ) )
+            instructing.result( ) )
         if instructions_written > 0:
             _scribe.info(
                 f"Copied {instructions_written}/{instructions_attempted} "
                 "instruction files" )
-    all_symlink_names: list[ str ] = list( _create_all_symlinks(
-        configuration, target, 'per-project', simulate ) )
-    git_exclude_entries: list[ str ] = list( distribution_entries )
-    git_exclude_entries.extend( instruction_entries )
-    git_exclude_entries.extend( all_symlink_names )
+        entries.extend( instruction_entries )
+    entries.extend( symlinking.result( ) )
+    return tuple( entries ), locating.result( )
+
+
+def _filter_project_configuration(
+    configuration: __.cabc.Mapping[ str, __.typx.Any ]
+) -> __.typx.Optional[ dict[ str, __.typx.Any ] ]:
+    ''' Restricts configuration to per-project default coders.
+
+        Returns None if no configured coder defaults to per-project mode.
+    '''
+    coders = _filter_coders_by_mode( configuration[ 'coders' ], 'per-project' )
+    if not coders: return None
+    filtered_configuration = dict( configuration )
+    filtered_configuration[ 'coders' ] = coders
+    return filtered_configuration
+
+
+async def _populate_project_content(
+    location: __.Path,
+    target: __.Path,
+    configuration: __.cabc.Mapping[ str, __.typx.Any ],
+    simulate: bool,
+    limiter: __.typx.Optional[ __.asyncio.Semaphore ] = None,
+) -> int:
+    ''' Populates per-project content and auxiliaries into one target.
+
+        Distribution copies, instruction copies, symlink planning, and git
+        exclude discovery are independent stages, which overlap in worker
+        threads, at most limiter permits at a time. The git exclude file is
+        updated last, since it lists entries from every stage.
+
+        Expects configuration restricted to per-project coders. Returns
+        number of items generated (or which would be, when simulating).
+    '''
+    if limiter is None: limiter = __.asyncio.Semaphore( _OFFLOADS_MAXIMUM )
+    copying = __.asyncio.create_task( _copy_project_distribution(
+        location, target, configuration, simulate, limiter ) )
+    managing = __.asyncio.create_task( _manage_project_auxiliaries(
+        configuration, location, target, simulate, limiter ) )
+    await _settle( copying, managing )
+    items_attempted, items_copied, distribution_entries = copying.result( )
+    auxiliary_entries, exclude_location = managing.result( )
+    if items_attempted > 0:
+        if simulate:
+            _scribe.info( f"Would copy {items_attempted} items" )
+        else:
+            _scribe.info( f"Copied {items_copied}/{items_attempted} items" )
+    git_exclude_entries = ( *distribution_entries, *auxiliary_entries )
     if git_exclude_entries:
-        entries_count = _operations.update_git_exclude(
-            target, git_exclude_entries, simulate )
+        entries_count = await _offload(
+            limiter, ( 'git-exclude', ), _operations.update_git_exclude,
+            target, git_exclude_entries, simulate,
+            location = exclude_location )
         if entries_count > 0:
             _scribe.info(
                 f"Managing {entries_count} entries in .git/info/exclude" )
+    return items_attempted if simulate else items_copied
 
 
-class PopulateProjectCommand( __.appcore_cli.Command ):
+async def populate_project(
+    location: __.Path,
+    target: __.Path,
+    configuration: __.cabc.Mapping[ str, __.typx.Any ],
+    simulate: bool = False,
+) -> _results.ContentGenerationResult:
+    ''' Populates per-project content from resolved data source.
+
+        Raises ConfigurationInvalidity if configuration names no
+        per-project coders.
+    '''
+    project_configuration = _filter_project_configuration( configuration )
+    if project_configuration is None:
+        raise _exceptions.ConfigurationInvalidity(
+            reason = "no per-project default coders" )
+    items_generated = await _populate_project_content(
+        location, target, project_configuration, simulate )
+    return _results.ContentGenerationResult(
+        source_location = location,
+        target_location = target,
+        coders = tuple( configuration[ 'coders' ] ),
+        simulated = simulate,
+        items_generated = items_generated,
+    )
+
+
+def _populate_user_content(
+    location: __.Path,
+    coders: __.cabc.Sequence[ str ],
+    configuration: __.cabc.Mapping[ str, __.typx.Any ],
+    simulate: bool,
+) -> int:
+    ''' Populates per-user content, global settings, and wrappers.
+
+        Returns number of items generated (or which would be, when
+        simulating).
+    '''
+    with _timings.span( 'user-content' ):
+        content_attempted, content_generated = _populate_per_user_content(
+            location, coders, configuration, simulate )
+    if content_attempted > 0:
+        _scribe.info(
+            f"Generated {content_generated}/{content_attempted} items" )
+    with _timings.span( 'globals' ):
+        globals_attempted, globals_updated = _userdata.populate_globals(
+            location, coders, configuration, simulate )
+    _scribe.info(
+        f"Updated {globals_updated}/{globals_attempted} global files; "
+        f"{globals_attempted - globals_updated} up to date" )
+    with _timings.span( 'wrappers' ):
+        wrappers_attempted, wrappers_installed = (
+            _userdata.populate_user_wrappers( location, simulate ) )
+    if wrappers_attempted > 0:
+        _scribe.info(
+            f"Installed {wrappers_installed}/{wrappers_attempted} "
+            "wrapper scripts; "
+            f"{wrappers_attempted - wrappers_installed} up to date" )
+    return content_generated + globals_updated + wrappers_installed
+
+
+def _expand_population_targets(
+    specifications: __.cabc.Sequence[ str ],
+    targets_file: __.typx.Optional[ __.Path ] = None,
+) -> tuple[ __.Path, ... ]:
+    ''' Expands target specifications into unique project directories.
+
+        Specifications containing glob metacharacters are expanded, keeping
+        only matching directories. A targets file lists one specification
+        per line; blank lines and ``#`` comments are ignored. Order of first
+        appearance is preserved.
+    '''
+    import glob as _glob
+    specifications_ = list( specifications )
+    if targets_file is not None:
+        try: lines = targets_file.read_text( encoding = 'utf-8' ).splitlines( )
+        except OSError as exception:
+            raise _exceptions.FileOperationFailure(
+                targets_file, "read targets file" ) from exception
+        specifications_.extend(
+            line.strip( ) for line in lines
+            if line.strip( ) and not line.strip( ).startswith( '#' ) )
+    targets: dict[ __.Path, None ] = { }
+    for specification in specifications_:
+        expanded = __.os.path.expanduser( specification )
+        if any( character in expanded for character in '*?[' ):
+            matches = sorted(
+                match for match in _glob.glob( expanded, recursive = True )
+                if __.os.path.isdir( match ) )
+        else: matches = [ expanded ]
+        for match in matches:
+            targets[ __.Path( __.os.path.abspath( match ) ) ] = None
+    return tuple( targets )
+
+
+ProjectConfigurationSurvey: __.typx.TypeAlias = (
+    __.cabc.Mapping[ str, __.typx.Any ] | _exceptions.Omnierror | None )
+
+
+async def _retrieve_project_configurations(
+    targets: __.cabc.Sequence[ __.Path ]
+) -> dict[ __.Path, ProjectConfigurationSurvey ]:
+    ''' Retrieves per-project configuration for each target.
+
+        Targets with byte-identical Copier answers share one parsed and
+        validated configuration. Configuration errors are recorded per
+        target instead of being raised. Targets without per-project
+        default coders are recorded as None.
+    '''
+    configurations: dict[ __.Path, ProjectConfigurationSurvey ] = { }
+    groups: dict[ bytes, list[ __.Path ] ] = { }
+    for target in targets:
+        answers_file = _cmdbase.calculate_answers_location( target )
+        try: answers = answers_file.read_bytes( )
+        except OSError:
+            configurations[ target ] = (
+                _exceptions.ConfigurationAbsence( target ) )
+            continue
+        groups.setdefault( answers, [ ] ).append( target )
+    for members in groups.values( ):
+        configuration: ProjectConfigurationSurvey
+        try:
+            configuration_ = await _cmdbase.retrieve_configuration(
+                members[ 0 ] )
+        except _exceptions.Omnierror as exception: configuration = exception
+        else:
+            configuration = _filter_project_configuration( configuration_ )
+        for member in members: configurations[ member ] = configuration
+    return configurations
+
+
+async def _populate_projects(
+    location: __.Path,
+    targets: __.cabc.Sequence[ __.Path ],
+    *,
+    simulate: bool,
+    jobs: int,
+) -> tuple[ _results.ProjectPopulationOutcome, ... ]:
+    ''' Populates many projects concurrently from one resolved source.
+
+        At most jobs projects populate at a time, and their stages share
+        at most jobs worker threads. Failures are recorded per target
+        rather than aborting the fleet. Projects without per-project
+        default coders are skipped, as by single-project population.
+        Returns outcomes in target order.
+    '''
+    configurations = await _retrieve_project_configurations( targets )
+    limiter = __.asyncio.Semaphore( max( 1, jobs ) )
+    offloads = __.asyncio.Semaphore( max( 1, jobs ) )
+    async def populate(
+        target: __.Path
+    ) -> _results.ProjectPopulationOutcome:
+        configuration = configurations[ target ]
+        if configuration is None:
+            _scribe.warning(
+                f"No per-project default coders found for {target}" )
+            return _results.ProjectPopulationOutcome(
+                target = target, skipped = "no per-project default coders" )
+        if isinstance( configuration, _exceptions.Omnierror ):
+            return _results.ProjectPopulationOutcome(
+                target = target, error = str( configuration ) )
+        async with limiter:
+            _scribe.info( f"Populating project content to {target}" )
+            try:
+                items_generated = await _populate_project_content(
+                    location, target, configuration, simulate, offloads )
+            except ( _exceptions.Omnierror, OSError ) as exception:
+                return _results.ProjectPopulationOutcome(
+                    target = target, error = str( exception ) )
+        return _results.ProjectPopulationOutcome(
+            target = target, items_generated = items_generated )
+    return tuple( await __.asyncio.gather(
+        *( populate( target ) for target in targets ) ) )
+
+
+class PopulateProjectCommand( _appcore_cli.Command ):
     ''' Generates project-scoped agent content from data sources.
 
         Populates agent commands, definitions, and static resources
@@ -585,49 +946,94 @@ class PopulateProjectCommand( __.appcore_cli.Command ):
             f"Populating project content from {self.source} to {self.target}" )
         configuration = await _cmdbase.retrieve_configuration(
             self.target, self.profile )
-        per_project_coders = _filter_coders_by_mode(
-            configuration[ 'coders' ], 'per-project' )
-        if not per_project_coders:
+        if _filter_project_configuration( configuration ) is None:
             _scribe.warning(
                 "No per-project default coders found in configuration" )
             return
-        filtered_configuration = dict( configuration )
-        filtered_configuration[ 'coders' ] = per_project_coders
         prefix = __.absent if self.tag_prefix is None else self.tag_prefix
         location = _cmdbase.retrieve_data_location( self.source, prefix )
         _cmdbase.validate_data_source_structure(
             location, ( 'per-project', ) )
-        items_attempted, items_copied, exclude_entries = (
-            _copy_distribution_items(
-                location,
-                filtered_configuration[ 'coders' ],
-                self.target,
-                configuration = filtered_configuration,
-                mode = 'per-project',
-                simulate = self.simulate ) )
-        if items_attempted > 0:
-            if self.simulate:
-                _scribe.info(
-                    f"Would copy {items_attempted} items" )
-            else:
-                _scribe.info(
-                    f"Copied {items_copied}/{items_attempted} items" )
-        _manage_project_auxiliaries(
-            filtered_configuration, location, self.target,
-            exclude_entries, self.simulate )
-        result = _results.ContentGenerationResult(
+        result = await populate_project(
+            location, self.target, configuration, self.simulate )
+        await _core.render_and_print_result(
+            result, auxdata.display, auxdata.exits )
+
+
+class PopulateProjectsCommand( _appcore_cli.Command ):
+    ''' Populates project-scoped agent content across many projects.
+
+        Resolves the data source once, shares parsed configuration among
+        projects with identical Copier answers, and populates projects
+        concurrently with a bounded pool of workers. Failure to populate
+        one project does not prevent population of the others.
+    '''
+
+    source: SourceArgument = '.'
+    targets: __.typx.Annotated[
+        __.tyro.conf.Positional[ tuple[ str, ... ] ],
+        __.tyro.conf.arg(
+            help = "Project directories or glob patterns" ),
+    ] = ( )
+    targets_file: __.typx.Annotated[
+        __.typx.Optional[ __.Path ],
+        __.tyro.conf.arg(
+            help = (
+                "File listing project directories or glob patterns, "
+                "one per line" ),
+            prefix_name = False ),
+    ] = None
+    jobs: __.typx.Annotated[
+        int,
+        __.tyro.conf.arg(
+            help = (
+                "Maximum number of projects populated concurrently, and "
+                "of worker threads they share" ),
+            prefix_name = False ),
+    ] = 4
+    simulate: __.typx.Annotated[
+        bool,
+        __.tyro.conf.arg(
+            help = "Dry run mode - show generated content",
+            prefix_name = False ),
+    ] = False
+    tag_prefix: __.typx.Annotated[
+        __.typx.Optional[ str ],
+        __.tyro.conf.arg(
+            help = (
+                "Prefix for version tags (e.g., 'v', 'stable-', 'prod-'); "
+                "only tags with this prefix are considered and the prefix "
+                "is stripped before version parsing" ),
+            prefix_name = False ),
+    ] = None
+
+    @_cmdbase.intercept_errors( )
+    async def execute( self, auxdata: __.appcore.state.Globals ) -> None:  # pyright: ignore[reportIncompatibleMethodOverride]
+        ''' Populates project content for each target. '''
+        if not isinstance( auxdata, _core.Globals ):  # pragma: no cover
+            raise _exceptions.ContextInvalidity
+        targets = _expand_population_targets(
+            self.targets, self.targets_file )
+        if not targets: raise _exceptions.TargetsAbsence
+        _scribe.info(
+            f"Populating {len( targets )} projects from {self.source}" )
+        prefix = __.absent if self.tag_prefix is None else self.tag_prefix
+        location = _cmdbase.retrieve_data_location( self.source, prefix )
+        _cmdbase.validate_data_source_structure(
+            location, ( 'per-project', ) )
+        outcomes = await _populate_projects(
+            location, targets, simulate = self.simulate, jobs = self.jobs )
+        result = _results.FleetPopulationResult(
             source_location = location,
-            target_location = self.target,
-            coders = tuple( configuration[ 'coders' ] ),
             simulated = self.simulate,
-            items_generated = (
-                items_attempted if self.simulate else items_copied ),
+            outcomes = outcomes,
         )
         await _core.render_and_print_result(
             result, auxdata.display, auxdata.exits )
+        if result.failures: raise SystemExit( 1 )
 
 
-class PopulateUserCommand( __.appcore_cli.Command ):
+class PopulateUserCommand( _appcore_cli.Command ):
     ''' Populates per-user global settings and executables. '''
 
     source: SourceArgument = '.'
@@ -674,30 +1080,8 @@ class PopulateUserCommand( __.appcore_cli.Command ):
         _cmdbase.validate_data_source_structure(
             location,
             ( 'per-user', ) )
-        content_attempted, content_generated = _populate_per_user_content(
-            location,
-            per_user_coders,
-            configuration,
-            self.simulate,
-        )
-        if content_attempted > 0:
-            _scribe.info(
-                f"Generated {content_generated}/{content_attempted} items" )
-        globals_attempted, globals_updated = _userdata.populate_globals(
-            location,
-            per_user_coders,
-            configuration,
-            self.simulate,
-        )
-        _scribe.info(
-            f"Updated {globals_updated}/{globals_attempted} global files" )
-        wrappers_attempted, wrappers_installed = (
-            _userdata.populate_user_wrappers( location, self.simulate ) )
-        if wrappers_attempted > 0:
-            _scribe.info(
-                f"Installed {wrappers_installed}/{wrappers_attempted} "
-                "wrapper scripts" )
-        total_items = content_generated + globals_updated + wrappers_installed
+        total_items = _populate_user_content(
+            location, per_user_coders, configuration, self.simulate )
         result = _results.ContentGenerationResult(
             source_location = location,
             target_location = __.Path.home( ),
@@ -709,7 +1093,99 @@ class PopulateUserCommand( __.appcore_cli.Command ):
             result, auxdata.display, auxdata.exits )
 
 
-class PopulateCommand( __.appcore_cli.Command ):
+class PopulateAllCommand( _appcore_cli.Command ):
+    ''' Populates project-scoped and user-scoped content together.
+
+        Resolves the data source once and validates both per-project and
+        per-user structure before running either phase, so that a Git
+        source is cloned or fetched only once.
+    '''
+
+    source: SourceArgument = '.'
+    target: TargetArgument = __.dcls.field( default_factory = __.Path.cwd )
+    profile: __.typx.Annotated[
+        __.typx.Optional[ __.Path ],
+        __.tyro.conf.arg(
+            help = (
+                "Alternative Copier answers file (defaults to "
+                "auto-detected)" ),
+            prefix_name = False ),
+    ] = None
+    simulate: __.typx.Annotated[
+        bool,
+        __.tyro.conf.arg(
+            help = "Dry run mode - show what would be populated",
+            prefix_name = False ),
+    ] = False
+    tag_prefix: __.typx.Annotated[
+        __.typx.Optional[ str ],
+        __.tyro.conf.arg(
+            help = (
+                "Prefix for version tags (e.g., 'v', 'stable-', 'prod-'); "
+                "only tags with this prefix are considered and the prefix "
+                "is stripped before version parsing" ),
+            prefix_name = False ),
+    ] = None
+
+    @_cmdbase.intercept_errors( )
+    async def execute( self, auxdata: __.appcore.state.Globals ) -> None:  # pyright: ignore[reportIncompatibleMethodOverride]
+        ''' Populates project and user content from one data source. '''
+        if not isinstance( auxdata, _core.Globals ):  # pragma: no cover
+            raise _exceptions.ContextInvalidity
+        _scribe.info(
+            f"Populating project and user content from {self.source}" )
+        configuration = await _cmdbase.retrieve_configuration(
+            self.target, self.profile )
+        project_configuration = _filter_project_configuration(
+            configuration )
+        per_user_coders = _filter_coders_by_mode(
+            configuration[ 'coders' ], 'per-user' )
+        if project_configuration is None and not per_user_coders:
+            _scribe.warning( "No default coders found in configuration" )
+            return
+        prefix = __.absent if self.tag_prefix is None else self.tag_prefix
+        location = _cmdbase.retrieve_data_location( self.source, prefix )
+        _cmdbase.validate_data_source_structure(
+            location, ( 'per-project', 'per-user' ) )
+        # Project and user phases write disjoint trees, so they overlap.
+        limiter = __.asyncio.Semaphore( _OFFLOADS_MAXIMUM )
+        phases: list[ tuple[
+            __.Path, tuple[ str, ... ], __.asyncio.Task[ int ] ] ] = [ ]
+        if project_configuration is None:
+            _scribe.warning(
+                "No per-project default coders found in configuration" )
+        else:
+            phases.append( (
+                self.target,
+                tuple( project_configuration[ 'coders' ] ),
+                __.asyncio.create_task( _populate_project_content(
+                    location, self.target, project_configuration,
+                    self.simulate, limiter ) ) ) )
+        if not per_user_coders:
+            _scribe.warning(
+                "No per-user default coders found in configuration" )
+        else:
+            phases.append( (
+                __.Path.home( ),
+                per_user_coders,
+                __.asyncio.create_task( _offload(
+                    limiter, ( ), _populate_user_content,
+                    location, per_user_coders, configuration,
+                    self.simulate ) ) ) )
+        await _settle( *( task for _, _, task in phases ) )
+        results = [
+            _results.ContentGenerationResult(
+                source_location = location,
+                target_location = target,
+                coders = coders,
+                simulated = self.simulate,
+                items_generated = task.result( ),
+            ) for target, coders, task in phases ]
+        await _core.render_and_print_results(
+            results, auxdata.display, auxdata.exits )
+
+
+class PopulateCommand( _appcore_cli.Command ):
     ''' Populates agent content and configuration. '''
 
     command: __.typx.Union[
@@ -717,17 +1193,25 @@ class PopulateCommand( __.appcore_cli.Command ):
             PopulateProjectCommand,
             __.tyro.conf.subcommand( 'project', prefix_name = False ),
         ],
+        __.typx.Annotated[
+            PopulateProjectsCommand,
+            __.tyro.conf.subcommand( 'projects', prefix_name = False ),
+        ],
         __.typx.Annotated[
             PopulateUserCommand,
             __.tyro.conf.subcommand( 'user', prefix_name = False ),
         ],
+        __.typx.Annotated[
+            PopulateAllCommand,
+            __.tyro.conf.subcommand( 'all', prefix_name = False ),
+        ],
     ] = __.dcls.field( default_factory = PopulateProjectCommand )
 
     async def execute( self, auxdata: __.appcore.state.Globals ) -> None:  # pyright: ignore[reportIncompatibleMethodOverride]
         await self.command( auxdata )
 
 
-class GenerateCommand( __.appcore_cli.Command ):
+class GenerateCommand( _appcore_cli.Command ):
     ''' Generates pre-rendered artifacts from components/.
 
         Two invocation shapes:
@@ -819,29 +1303,27 @@ class GenerateCommand( __.appcore_cli.Command ):
             else __.Path( 'distribution' ) )
         _scribe.info(
             f"Generating distribution from {self.source} to {target}" )
-        configuration = _produce_default_configuration( location )
-        generator = _generator.ContentGenerator(
-            location = location,
-            configuration = configuration,
-            application_configuration = auxdata.configuration,
-            mode = 'per-project',
-        )
+        generator = produce_distribution_generator(
+            location, auxdata.configuration )
+        configuration = generator.configuration
         if self.check:
-            items_checked, diff_lines = (
-                _operations.check_distribution_staleness(
-                    generator, target ) )
-            if diff_lines:
-                _scribe.error(
-                    f"Distribution is stale ({items_checked} items checked):" )
-                for line in diff_lines:
-                    print( line )
-                raise SystemExit( 1 )
-            _scribe.info(
-                f"Distribution is current ({items_checked} items checked)" )
+            with _timings.span( 'check' ):
+                items_checked, diff_lines = (
+                    _operations.check_distribution_staleness(
+                        generator, target ) )
+            result = _results.DistributionStalenessResult(
+                source_location = location,
+                target_location = target,
+                items_checked = items_checked,
+                diffs = tuple( diff_lines ) )
+            await _core.render_and_print_result(
+                result, auxdata.display, auxdata.exits )
+            if not result.current: raise SystemExit( 1 )
             return
-        items_attempted, items_generated = (
-            _operations.generate_distribution(
-                generator, target, self.simulate ) )
+        with _timings.span( 'generate' ):
+            items_attempted, items_generated = (
+                _operations.generate_distribution(
+                    generator, target, self.simulate ) )
         _scribe.info(
             f"Generated {items_generated}/{items_attempted} artifacts" )
         result = _results.ContentGenerationResult(
@@ -0,0 +1,245 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Streaming preprocessing stages for instruction files.
+
+    Stages transform iterators of lines, so that instruction files of any
+    size are processed in constant memory. Each stage registers under the
+    name of the preprocessing configuration key which activates it. Active
+    stages are chained in registration order.
+'''
+
+
+import itertools as _itertools
+
+from . import __
+
+
+_scribe = __.provide_scribe( __name__ )
+
+
+class PreprocessingContext( __.immut.DataclassObject ):
+    ''' Location of file being preprocessed within its source tree. '''
+
+    source_file: __.Path
+    source_root: __.Path
+
+
+Transformer: __.typx.TypeAlias = __.cabc.Callable[
+    [ __.cabc.Iterator[ str ], __.typx.Any, PreprocessingContext ],
+    __.cabc.Iterator[ str ] ]
+
+
+class Preprocessor( __.immut.DataclassObject ):
+    ''' Registered preprocessing stage.
+
+        Hermetic stages depend only on the lines of the file being
+        processed and their configuration; non-hermetic stages read other
+        files, so their outputs cannot be memoized by source file alone.
+    '''
+
+    name: str
+    transform: Transformer
+    hermetic: bool = True
+
+
+PREPROCESSORS: __.accret.Dictionary[ str, Preprocessor ] = (
+    __.accret.Dictionary( ) )
+
+
+def preprocessor(
+    name: str, hermetic: bool = True
+) -> __.cabc.Callable[ [ Transformer ], Transformer ]:
+    ''' Decorator for automatic preprocessing stage registration. '''
+    def decorator( transform: Transformer ) -> Transformer:
+        PREPROCESSORS[ name ] = Preprocessor(
+            name = name, transform = transform, hermetic = hermetic )
+        return transform
+    return decorator
+
+
+def is_hermetic( configuration: __.cabc.Mapping[ str, __.typx.Any ] ) -> bool:
+    ''' Checks whether all stages activated by configuration are hermetic. '''
+    return all(
+        processor.hermetic for processor in PREPROCESSORS.values( )
+        if configuration.get( processor.name ) is not None )
+
+
+def preprocess_lines(
+    lines: __.cabc.Iterable[ str ],
+    configuration: __.cabc.Mapping[ str, __.typx.Any ],
+    context: PreprocessingContext,
+) -> __.cabc.Iterator[ str ]:
+    ''' Chains stages activated by configuration over lines.
+
+        Configuration keys which do not name a registered stage are
+        ignored.
+    '''
+    result = iter( lines )
+    for processor in PREPROCESSORS.values( ):
+        setting = configuration.get( processor.name )
+        if setting is None: continue
+        result = processor.transform( result, setting, context )
+    return result
+
+
+@preprocessor( 'strip_header_lines' )
+def strip_header_lines(
+    lines: __.cabc.Iterator[ str ],
+    setting: __.typx.Any,
+    context: PreprocessingContext,
+) -> __.cabc.Iterator[ str ]:
+    ''' Drops configured number of leading lines. '''
+    if not isinstance( setting, int ):
+        _scribe.warning(
+            f"Invalid strip_header_lines value (expected int): {setting}" )
+        return lines
+    if setting <= 0: return lines
+    return _itertools.islice( lines, setting, None )
+
+
+_INCLUDE_DIRECTIVE = '.. include::'
+_INCLUDE_DEPTH_MAXIMUM = 8
+
+
+@preprocessor( 'expand_includes', hermetic = False )
+def expand_includes(
+    lines: __.cabc.Iterator[ str ],
+    setting: __.typx.Any,
+    context: PreprocessingContext,
+) -> __.cabc.Iterator[ str ]:
+    ''' Replaces reStructuredText include directives with file contents.
+
+        Included paths resolve relative to the including file and must
+        remain within the source tree. Unresolvable includes are left in
+        place with a warning.
+    '''
+    if not setting: return lines
+    return _expand_includes(
+        lines, context.source_file, context.source_root, ( ) )
+
+
+def _expand_includes(
+    lines: __.cabc.Iterable[ str ],
+    source_file: __.Path,
+    source_root: __.Path,
+    ancestors: tuple[ __.Path, ... ],
+) -> __.cabc.Iterator[ str ]:
+    for line in lines:
+        if not line.startswith( _INCLUDE_DIRECTIVE ):
+            yield line
+            continue
+        reference = line[ len( _INCLUDE_DIRECTIVE ): ].strip( )
+        included = _resolve_include( reference, source_file, source_root )
+        if (    included is None
+            or  included in ancestors
+            or  len( ancestors ) >= _INCLUDE_DEPTH_MAXIMUM
+        ):
+            _scribe.warning(
+                f"Cannot expand include '{reference}' in {source_file}." )
+            yield line
+            continue
+        with included.open( encoding = 'utf-8' ) as stream:
+            yield from _expand_includes(
+                stream, included, source_root,
+                ( *ancestors, source_file.resolve( ) ) )
+
+
+def _resolve_include(
+    reference: str, source_file: __.Path, source_root: __.Path
+) -> __.typx.Optional[ __.Path ]:
+    if not reference: return None
+    included = ( source_file.parent / reference ).resolve( )
+    if not included.is_relative_to( source_root.resolve( ) ): return None
+    if not included.is_file( ): return None
+    return included
+
+
+_LANGUAGE_MARKER = '.. language:'
+_LANGUAGE_END = 'end'
+
+
+@preprocessor( 'filter_languages' )
+def filter_languages(
+    lines: __.cabc.Iterator[ str ],
+    setting: __.typx.Any,
+    context: PreprocessingContext,
+) -> __.cabc.Iterator[ str ]:
+    ''' Keeps language-specific blocks only for configured languages.
+
+        Blocks open with a reStructuredText comment line, such as
+        ``.. language: python rust``, and close with ``.. language: end``.
+        Marker lines are always dropped. Lines outside blocks are kept.
+    '''
+    if isinstance( setting, str ): setting = ( setting, )
+    if not isinstance( setting, ( list, tuple ) ) or not all(
+        isinstance( language, str )
+        for language in __.typx.cast( __.cabc.Sequence[ object ], setting )
+    ):
+        _scribe.warning(
+            "Invalid filter_languages value "
+            f"(expected string or list of strings): {setting}" )
+        return lines
+    languages = frozenset( __.typx.cast( __.cabc.Sequence[ str ], setting ) )
+    return _filter_languages( lines, languages )
+
+
+def _filter_languages(
+    lines: __.cabc.Iterable[ str ], languages: frozenset[ str ]
+) -> __.cabc.Iterator[ str ]:
+    keep = True
+    for line in lines:
+        if line.startswith( _LANGUAGE_MARKER ):
+            names = line[ len( _LANGUAGE_MARKER ): ].split( )
+            keep = names == [ _LANGUAGE_END ] or not languages.isdisjoint(
+                names )
+            continue
+        if keep: yield line
+
+
+@preprocessor( 'normalize_whitespace' )
+def normalize_whitespace(
+    lines: __.cabc.Iterator[ str ],
+    setting: __.typx.Any,
+    context: PreprocessingContext,
+) -> __.cabc.Iterator[ str ]:
+    ''' Strips trailing whitespace and collapses runs of blank lines.
+
+        Leading and trailing blank lines are dropped and every line,
+        including the last, ends with a newline.
+    '''
+    if not setting: return lines
+    return _normalize_whitespace( lines )
+
+
+def _normalize_whitespace(
+    lines: __.cabc.Iterable[ str ]
+) -> __.cabc.Iterator[ str ]:
+    blank_pending = False
+    started = False
+    for line in lines:
+        content = line.rstrip( )
+        if not content:
+            blank_pending = started
+            continue
+        if blank_pending: yield '\n'
+        blank_pending = False
+        started = True
+        yield f"{content}\n"
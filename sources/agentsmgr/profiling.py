@@ -0,0 +1,54 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Built-in deterministic profiling of command execution.
+
+    Uses cProfile from the standard library, so that profiles can be
+    captured from frozen executables, where attaching external profilers
+    is awkward. Profiles cover the thread which runs the event loop;
+    work in worker threads appears as time spent awaiting them.
+'''
+
+
+from . import __
+
+
+@__.ctxl.contextmanager
+def profiling(
+    location: __.Path, entries: int = 25
+) -> __.cabc.Iterator[ None ]:
+    ''' Profiles enclosed execution and reports statistics.
+
+        Writes statistics in ``pstats`` format to location, for use with
+        tools such as ``snakeviz``, and prints the entries with the
+        greatest cumulative times to stderr.
+    '''
+    import cProfile as _cProfile
+    import pstats as _pstats
+    profiler = _cProfile.Profile( )
+    profiler.enable( )
+    try: yield
+    finally:
+        profiler.disable( )
+        profiler.dump_stats( location )
+        statistics = _pstats.Stats( profiler, stream = __.sys.stderr )
+        statistics.sort_stats( _pstats.SortKey.CUMULATIVE )
+        statistics.print_stats( entries )
+        print( f"Profile written to {location}", file = __.sys.stderr )
@@ -18,7 +18,7 @@
 #============================================================================#
 
 
-''' Result objects for CLI command outputs with Markdown rendering. '''
+''' Result objects for CLI command outputs with Markdown/JSON rendering. '''
 
 
 from . import __
@@ -32,6 +32,11 @@ class ResultBase( __.immut.DataclassObject ):
         ''' Renders result as Markdown lines for display. '''
         raise NotImplementedError
 
+    @__.abc.abstractmethod
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders result as JSON-compatible record. '''
+        raise NotImplementedError
+
 
 class ConfigurationDetectionResult( ResultBase ):
     ''' Agent configuration detection result with formatted output. '''
@@ -51,6 +56,16 @@ class ConfigurationDetectionResult( ResultBase ):
         lines.append( f" * Target Directory: {self.target.resolve( )}" )
         return tuple( lines )
 
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders configuration detection as JSON-compatible record. '''
+        return {
+            'kind': 'configuration-detection',
+            'target': str( self.target.resolve( ) ),
+            'coders': list( self.coders ),
+            'languages': list( self.languages ),
+            'project_name': self.project_name,
+        }
+
 
 class ContentGenerationResult( ResultBase ):
     ''' Agent content generation result with formatted summary. '''
@@ -76,3 +91,133 @@ class ContentGenerationResult( ResultBase ):
         else:
             lines.append( "✅ Content generation complete." )
         return tuple( lines )
+
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders content generation results as JSON-compatible record. '''
+        return {
+            'kind': 'content-generation',
+            'source': str( self.source_location ),
+            'target': str( self.target_location.resolve( ) ),
+            'coders': list( self.coders ),
+            'simulated': self.simulated,
+            'items_generated': self.items_generated,
+        }
+
+
+class DistributionStalenessResult( ResultBase ):
+    ''' Staleness of distribution relative to components. '''
+
+    source_location: __.Path
+    target_location: __.Path
+    items_checked: int
+    diffs: tuple[ str, ... ] = ( )
+
+    @property
+    def current( self ) -> bool:
+        ''' Whether distribution matches rendered components. '''
+        return not self.diffs
+
+    def render_as_markdown( self ) -> tuple[ str, ... ]:
+        ''' Renders staleness check results as Markdown lines. '''
+        if self.current:
+            return (
+                f"✅ Distribution is current "
+                f"({self.items_checked} items checked).", )
+        return (
+            f"❌ Distribution is stale "
+            f"({self.items_checked} items checked):",
+            '',
+            '```diff',
+            *self.diffs,
+            '```',
+        )
+
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders staleness check results as JSON-compatible record. '''
+        return {
+            'kind': 'distribution-staleness',
+            'source': str( self.source_location ),
+            'target': str( self.target_location.resolve( ) ),
+            'items_checked': self.items_checked,
+            'current': self.current,
+            'diffs': list( self.diffs ),
+        }
+
+
+class ProjectPopulationOutcome( __.immut.DataclassObject ):
+    ''' Outcome of populating one project within a fleet. '''
+
+    target: __.Path
+    items_generated: int = 0
+    error: __.typx.Optional[ str ] = None
+    skipped: __.typx.Optional[ str ] = None
+
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders outcome as JSON-compatible record. '''
+        return {
+            'target': str( self.target ),
+            'items_generated': self.items_generated,
+            'error': self.error,
+            'skipped': self.skipped,
+        }
+
+
+class FleetPopulationResult( ResultBase ):
+    ''' Agent content population result across many projects. '''
+
+    source_location: __.Path
+    simulated: bool
+    outcomes: tuple[ ProjectPopulationOutcome, ... ] = ( )
+
+    @property
+    def failures( self ) -> tuple[ ProjectPopulationOutcome, ... ]:
+        ''' Outcomes for projects which could not be populated. '''
+        return tuple(
+            outcome for outcome in self.outcomes
+            if outcome.error is not None )
+
+    def render_as_markdown( self ) -> tuple[ str, ... ]:
+        ''' Renders fleet population results as Markdown lines. '''
+        lines = [
+            f"🚀 Populating agent content across {len( self.outcomes )} "
+            f"projects (simulate={self.simulated}):" ]
+        lines.append( f" * Source: {self.source_location}" )
+        for outcome in self.outcomes:
+            if outcome.error is not None:
+                lines.append( f" * ❌ {outcome.target}: {outcome.error}" )
+            elif outcome.skipped is not None:
+                lines.append(
+                    f" * ⏭️ {outcome.target}: skipped ({outcome.skipped})" )
+            else:
+                lines.append(
+                    f" * ✅ {outcome.target}: "
+                    f"{outcome.items_generated} items" )
+        failures = len( self.failures )
+        skips = sum(
+            1 for outcome in self.outcomes if outcome.skipped is not None )
+        successes = len( self.outcomes ) - failures - skips
+        items = sum( outcome.items_generated for outcome in self.outcomes )
+        lines.append( '' )
+        lines.append(
+            f"   Generated {items} items in "
+            f"{successes}/{len( self.outcomes )} projects" )
+        lines.append( '' )
+        if failures:
+            lines.append( f"⚠️ Population failed for {failures} projects." )
+        elif self.simulated:
+            lines.append(
+                "✅ Simulation complete. Use --no-simulate to write." )
+        else:
+            lines.append( "✅ Content generation complete." )
+        return tuple( lines )
+
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders fleet population results as JSON-compatible record. '''
+        return {
+            'kind': 'fleet-population',
+            'source': str( self.source_location ),
+            'simulated': self.simulated,
+            'outcomes': [
+                outcome.render_as_json( ) for outcome in self.outcomes ],
+            'failures': len( self.failures ),
+        }
@@ -0,0 +1,368 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Long-running server mode with warm caches.
+
+    Serves JSON-RPC 2.0 requests, framed as one JSON object per line, on
+    standard input and output or on a Unix socket. Resolved data sources,
+    content generators (with their compiled Jinja templates), loaded
+    configurations, and staleness check results are kept across requests,
+    so that repeated requests avoid imports, environment construction,
+    and source resolution.
+
+    Staleness check results are invalidated when modification times or
+    sizes of files under components or distribution change; Jinja
+    reloads templates whose modification times change; configurations
+    are reloaded when their answers files change. Resolved data sources
+    are refreshed after an interval or on request, since remote sources
+    can change without local evidence.
+'''
+
+
+import inspect as _inspect
+import time as _time
+
+from . import __
+from . import cmdbase as _cmdbase
+from . import exceptions as _exceptions
+from . import generator as _generator
+from . import gitdirs as _gitdirs
+from . import operations as _operations
+from . import population as _population
+from . import results as _results
+
+
+TreeSurvey: __.typx.TypeAlias = tuple[ tuple[ str, int, int ], ... ]
+
+
+_ERROR_PARSE = -32700
+_ERROR_REQUEST_INVALIDITY = -32600
+_ERROR_METHOD_ABSENCE = -32601
+_ERROR_PARAMS_INVALIDITY = -32602
+_ERROR_INTERNAL = -32603
+_ERROR_APPLICATION = -32000
+
+
+_scribe = __.provide_scribe( __name__ )
+
+
+class ServerState:
+    ''' Warm caches and request handlers shared across requests. '''
+
+    methods = frozenset( ( 'check', 'detect', 'generate', 'populate' ) )
+
+    def __init__(
+        self,
+        application_configuration: __.cabc.Mapping[ str, __.typx.Any ],
+        source_interval: float = 300.0,
+    ) -> None:
+        self.application_configuration = application_configuration
+        self.source_interval = source_interval
+        self.sources: dict[
+            tuple[ str, __.typx.Optional[ str ] ], tuple[ float, __.Path ]
+        ] = { }
+        self.generators: dict[ __.Path, _generator.ContentGenerator ] = { }
+        self.checks: dict[
+            tuple[ __.Path, __.Path ],
+            tuple[ TreeSurvey, _results.DistributionStalenessResult ],
+        ] = { }
+        self.configurations: dict[
+            __.Path,
+            tuple[ tuple[ int, int ], __.cabc.Mapping[ str, __.typx.Any ] ],
+        ] = { }
+
+    def begin_request( self ) -> None:
+        ''' Forgets process memos which cannot detect their staleness.
+
+            Git control directories are memoized by start path only, so
+            that they are rediscovered for each request.
+        '''
+        _gitdirs.forget_git_directories( )
+
+    def resolve_source(
+        self,
+        specification: str,
+        tag_prefix: __.typx.Optional[ str ] = None,
+        refresh: bool = False,
+    ) -> __.Path:
+        ''' Resolves data source, reusing recent resolutions. '''
+        key = ( specification, tag_prefix )
+        moment = _time.monotonic( )
+        if not refresh and key in self.sources:
+            resolved, location = self.sources[ key ]
+            if moment - resolved < self.source_interval: return location
+        prefix = __.absent if tag_prefix is None else tag_prefix
+        location = _cmdbase.retrieve_data_location( specification, prefix )
+        self.sources[ key ] = ( moment, location )
+        return location
+
+    def provide_generator(
+        self, location: __.Path
+    ) -> _generator.ContentGenerator:
+        ''' Provides distribution generator for components location. '''
+        if location not in self.generators:
+            self.generators[ location ] = (
+                _population.produce_distribution_generator(
+                    location, self.application_configuration ) )
+        return self.generators[ location ]
+
+    async def retrieve_configuration(
+        self, target: __.Path, profile: __.typx.Optional[ __.Path ] = None
+    ) -> __.cabc.Mapping[ str, __.typx.Any ]:
+        ''' Retrieves configuration, reloading if answers file changed. '''
+        answers_file = (
+            profile if profile is not None
+            else _cmdbase.calculate_answers_location( target ) )
+        try: status = answers_file.stat( )
+        except OSError: signature = ( 0, 0 )
+        else: signature = ( status.st_mtime_ns, status.st_size )
+        cached = self.configurations.get( answers_file )
+        if cached is not None and cached[ 0 ] == signature:
+            return cached[ 1 ]
+        configuration = await _cmdbase.retrieve_configuration(
+            target, profile )
+        self.configurations[ answers_file ] = ( signature, configuration )
+        return configuration
+
+    async def check(
+        self, *, source: str = 'components', output: str = 'distribution'
+    ) -> dict[ str, __.typx.Any ]:
+        ''' Checks whether distribution is current with components. '''
+        location = self._resolve_components( source, False )
+        target = __.Path( output )
+        survey = (
+            *survey_tree( location ), *survey_tree( target ) )
+        cached = self.checks.get( ( location, target ) )
+        if cached is not None and cached[ 0 ] == survey:
+            return cached[ 1 ].render_as_json( )
+        items_checked, diffs = _operations.check_distribution_staleness(
+            self.provide_generator( location ), target )
+        result = _results.DistributionStalenessResult(
+            source_location = location,
+            target_location = target,
+            items_checked = items_checked,
+            diffs = tuple( diffs ) )
+        self.checks[ ( location, target ) ] = ( survey, result )
+        return result.render_as_json( )
+
+    async def detect(
+        self, *, target: str = '.'
+    ) -> dict[ str, __.typx.Any ]:
+        ''' Detects agent configuration of target. '''
+        location = __.Path( target )
+        configuration = await self.retrieve_configuration( location )
+        return _results.ConfigurationDetectionResult(
+            target = location,
+            coders = tuple( configuration[ 'coders' ] ),
+            languages = tuple( configuration[ 'languages' ] ),
+            project_name = configuration.get( 'project_name' ),
+        ).render_as_json( )
+
+    async def generate(
+        self, *,
+        source: str = 'components',
+        output: str = 'distribution',
+        simulate: bool = False,
+        refresh: bool = False,
+    ) -> dict[ str, __.typx.Any ]:
+        ''' Generates distribution from components. '''
+        location = self._resolve_components( source, refresh )
+        generator = self.provide_generator( location )
+        target = __.Path( output )
+        _, items_generated = _operations.generate_distribution(
+            generator, target, simulate )
+        return _results.ContentGenerationResult(
+            source_location = location,
+            target_location = target,
+            coders = tuple( generator.configuration[ 'coders' ] ),
+            simulated = simulate,
+            items_generated = items_generated,
+        ).render_as_json( )
+
+    async def populate(  # noqa: PLR0913
+        self, *,
+        target: str = '.',
+        source: str = '.',
+        profile: __.typx.Optional[ str ] = None,
+        simulate: bool = False,
+        tag_prefix: __.typx.Optional[ str ] = None,
+        refresh: bool = False,
+    ) -> dict[ str, __.typx.Any ]:
+        ''' Populates project-scoped content into target. '''
+        location_ = __.Path( target )
+        configuration = await self.retrieve_configuration(
+            location_, None if profile is None else __.Path( profile ) )
+        location = self.resolve_source( source, tag_prefix, refresh )
+        _cmdbase.validate_data_source_structure(
+            location, ( 'per-project', ) )
+        result = await _population.populate_project(
+            location, location_, configuration, simulate )
+        return result.render_as_json( )
+
+    def _resolve_components( self, source: str, refresh: bool ) -> __.Path:
+        location = self.resolve_source( source, refresh = refresh )
+        _cmdbase.validate_data_source_structure(
+            location, ( 'configurations', 'contents', 'templates' ) )
+        return location
+
+
+class Server:
+    ''' Dispatches JSON-RPC requests to server state.
+
+        Requests are processed one at a time, in order of arrival, so
+        that handlers need not guard shared caches.
+    '''
+
+    def __init__( self, state: ServerState ) -> None:
+        self.state = state
+        self.finished = __.asyncio.Event( )
+        self._mutex = __.asyncio.Lock( )
+
+    async def respond( self, line: str ) -> __.typx.Optional[ str ]:
+        ''' Processes one request line. Returns response line, if any.
+
+            Notifications (requests without ids) receive no response.
+            Invalid requests always receive an error response. Failures
+            while serving a request are reported to its client and do not
+            stop the server.
+        '''
+        try: request = __.json.loads( line )
+        except ValueError:
+            return _render_error( None, _ERROR_PARSE, "Parse error." )
+        if not isinstance( request, dict ):
+            return _render_error(
+                None, _ERROR_REQUEST_INVALIDITY, "Invalid request." )
+        request_ = __.typx.cast( dict[ str, __.typx.Any ], request )
+        identifier = request_.get( 'id' )
+        method = request_.get( 'method' )
+        if not isinstance( method, str ):
+            return _render_error(
+                identifier, _ERROR_REQUEST_INVALIDITY, "Invalid request." )
+        async with self._mutex:
+            try:
+                response = await self._dispatch(
+                    identifier, method, request_.get( 'params', { } ) )
+            except Exception as exception:
+                _scribe.exception( "Failure while serving request." )
+                response = _render_error(
+                    identifier, _ERROR_INTERNAL, str( exception ) )
+        if 'id' not in request_: return None
+        return response
+
+    async def serve_stdio( self ) -> None:
+        ''' Serves requests from standard input until end or shutdown. '''
+        while not self.finished.is_set( ):
+            line = await __.asyncio.to_thread( __.sys.stdin.readline )
+            if not line: break
+            if not line.strip( ): continue
+            response = await self.respond( line )
+            if response is not None: print( response, flush = True )
+
+    async def serve_socket( self, location: __.Path ) -> None:
+        ''' Serves requests from Unix socket clients until shutdown. '''
+        if location.is_socket( ): location.unlink( )
+        server = await __.asyncio.start_unix_server(
+            self._converse, path = str( location ) )
+        _scribe.info( f"Serving on {location}" )
+        try:
+            async with server: await self.finished.wait( )
+        finally: location.unlink( missing_ok = True )
+
+    async def _converse(
+        self,
+        reader: __.asyncio.StreamReader,
+        writer: __.asyncio.StreamWriter,
+    ) -> None:
+        try:
+            while not self.finished.is_set( ):
+                line = await reader.readline( )
+                if not line: break
+                if not line.strip( ): continue
+                response = await self.respond( line.decode( 'utf-8' ) )
+                if response is None: continue
+                writer.write( f"{response}\n".encode( 'utf-8' ) )
+                await writer.drain( )
+        finally: writer.close( )
+
+    async def _dispatch(
+        self, identifier: __.typx.Any, method: str, params: __.typx.Any
+    ) -> str:
+        if method == 'shutdown':
+            self.finished.set( )
+            return _render_result( identifier, None )
+        invalidity = self._validate_request( method, params )
+        if invalidity is not None:
+            return _render_error( identifier, *invalidity )
+        self.state.begin_request( )
+        try: result = await getattr( self.state, method )( **params )
+        except _exceptions.Omnierror as exception:
+            return _render_error(
+                identifier, _ERROR_APPLICATION, str( exception ),
+                exception.render_as_json( ) )
+        except Exception as exception:
+            _scribe.exception( f"Failure while serving {method}." )
+            return _render_error(
+                identifier, _ERROR_INTERNAL, str( exception ) )
+        return _render_result( identifier, result )
+
+    def _validate_request(
+        self, method: str, params: __.typx.Any
+    ) -> __.typx.Optional[ tuple[ int, str ] ]:
+        ''' Returns error code and message, if request is invalid. '''
+        if method not in self.state.methods:
+            return ( _ERROR_METHOD_ABSENCE, f"Method not found: {method}" )
+        if not isinstance( params, dict ):
+            return ( _ERROR_PARAMS_INVALIDITY, "Invalid params." )
+        handler = getattr( self.state, method )
+        try: _inspect.signature( handler ).bind( **params )
+        except TypeError as exception:
+            return ( _ERROR_PARAMS_INVALIDITY, str( exception ) )
+        return None
+
+
+def survey_tree( location: __.Path ) -> TreeSurvey:
+    ''' Surveys paths, modification times, and sizes of files in tree. '''
+    entries: list[ tuple[ str, int, int ] ] = [ ]
+    for directory, _, names in __.os.walk( location ):
+        for name in names:
+            path = __.os.path.join( directory, name )
+            try: status = __.os.stat( path )
+            except OSError: continue
+            entries.append( ( path, status.st_mtime_ns, status.st_size ) )
+    entries.sort( )
+    return tuple( entries )
+
+
+def _render_error(
+    identifier: __.typx.Any,
+    code: int,
+    message: str,
+    data: __.typx.Any = None,
+) -> str:
+    error: dict[ str, __.typx.Any ] = { 'code': code, 'message': message }
+    if data is not None: error[ 'data' ] = data
+    return __.json.dumps(
+        { 'jsonrpc': '2.0', 'id': identifier, 'error': error } )
+
+
+def _render_result( identifier: __.typx.Any, result: __.typx.Any ) -> str:
+    return __.json.dumps(
+        { 'jsonrpc': '2.0', 'id': identifier, 'result': result } )
@@ -27,11 +27,16 @@
 
 
 from .base import AbstractSourceHandler
+from .base import access_cache_location
+from .base import caching
 from .base import resolve_source_location
 from .base import register_source_handler
+from .base import register_source_module
 from .base import source_handler
 from .local import LocalSourceHandler
-from .git import GitSourceHandler
 
 
-# Source handlers register themselves when their modules are imported
\ No newline at end of file
+# Source handlers register themselves when their modules are imported.
+# Handlers with costly dependencies are imported on first use of a scheme.
+register_source_module(
+    f"{__name__}.git", ( 'github', 'gitlab', 'git+https', 'https', 'git@' ) )
\ No newline at end of file
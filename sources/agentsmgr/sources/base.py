@@ -25,6 +25,10 @@
 '''
 
 
+import contextvars as _contextvars
+
+from importlib import import_module as _import_module
+
 from .. import nomina as _nomina
 from . import __
 
@@ -55,9 +59,16 @@ class AbstractSourceHandler( __.immut.Protocol, __.typx.Protocol ):
 # Private registry mapping URL schemes to source handlers
 _SCHEME_HANDLERS: __.accret.Dictionary[ str, AbstractSourceHandler ] = (
     __.accret.Dictionary( ) )
+# Private registry mapping URL schemes to modules which register handlers
+_SCHEME_MODULES: __.accret.Dictionary[ str, str ] = __.accret.Dictionary( )
 
 _WINDOWS_ABSOLUTE_PATH_MINIMUM_LENGTH = 3
 
+# Location of source data cache for current context, if any
+_cache_location: _contextvars.ContextVar[
+    __.typx.Optional[ __.Path ]
+] = _contextvars.ContextVar( 'agentsmgr_sources_cache', default = None )
+
 
 def _is_windows_absolute_path( source_spec: str ) -> bool:
     ''' Returns true if source specification is a Windows absolute path. '''
@@ -68,6 +79,36 @@ def _is_windows_absolute_path( source_spec: str ) -> bool:
         and source_spec[ 0 ].isalpha( ) )
 
 
+def access_cache_location(
+    *appendages: str
+) -> __.typx.Optional[ __.Path ]:
+    ''' Returns location within source data cache for current context.
+
+        Returns None if no cache location applies to current context.
+    '''
+    location = _cache_location.get( )
+    if location is None: return None
+    return location.joinpath( *appendages )
+
+
+@__.ctxl.contextmanager
+def caching(
+    location: __.typx.Annotated[
+        __.Path,
+        __.ddoc.Doc( ''' Directory in which to cache source data ''' )
+    ]
+) -> __.cabc.Iterator[ None ]:
+    ''' Caches source data under location for current context.
+
+        API responses and preprocessed instruction files are cached in
+        subdirectories. Only the location is recorded here, so that cache
+        users are imported only when needed.
+    '''
+    token = _cache_location.set( location )
+    try: yield
+    finally: _cache_location.reset( token )
+
+
 def register_source_handler(
     handler: __.typx.Annotated[
         AbstractSourceHandler,
@@ -84,6 +125,27 @@ def register_source_handler(
         _SCHEME_HANDLERS[ scheme ] = handler
 
 
+def register_source_module(
+    module_name: __.typx.Annotated[
+        str,
+        __.ddoc.Doc( ''' Qualified name of module which registers handlers
+            for the schemes when imported ''' )
+    ],
+    schemes: __.typx.Annotated[
+        __.cabc.Iterable[ str ],
+        __.ddoc.Doc( ''' URL schemes this module supports
+            (e.g., ['github:', 'gitlab:']) ''' )
+    ]
+) -> None:
+    ''' Registers module providing source handlers for URL schemes.
+
+        The module is imported on first resolution of one of its schemes,
+        so that costly handler dependencies are only loaded when needed.
+    '''
+    for scheme in schemes:
+        _SCHEME_MODULES[ scheme ] = module_name
+
+
 def source_handler(
     schemes: __.typx.Annotated[
         __.cabc.Iterable[ str ],
@@ -119,15 +181,18 @@ def resolve_source_location(
 
         Raises DataSourceNoSupport if no handler can process the specification.
     '''
-    if source_spec.startswith( 'git@' ):
-        if 'git@' in _SCHEME_HANDLERS:
-            return _SCHEME_HANDLERS[ 'git@' ].resolve(
-                source_spec, tag_prefix )
-        raise __.DataSourceNoSupport( source_spec )
-    if _is_windows_absolute_path( source_spec ):
-        return _SCHEME_HANDLERS[ '' ].resolve( source_spec, tag_prefix )
-    parsed = __.urlparse.urlparse( source_spec )
-    if parsed.scheme in _SCHEME_HANDLERS:
-        return _SCHEME_HANDLERS[ parsed.scheme ].resolve(
-            source_spec, tag_prefix )
-    raise __.DataSourceNoSupport( source_spec )
+    if source_spec.startswith( 'git@' ): scheme = 'git@'
+    elif _is_windows_absolute_path( source_spec ): scheme = ''
+    else: scheme = __.urlparse.urlparse( source_spec ).scheme
+    handler = _access_source_handler( scheme )
+    if handler is None: raise __.DataSourceNoSupport( source_spec )
+    return handler.resolve( source_spec, tag_prefix )
+
+
+def _access_source_handler(
+    scheme: str
+) -> __.typx.Optional[ AbstractSourceHandler ]:
+    ''' Accesses handler for scheme, importing its module if needed. '''
+    if scheme not in _SCHEME_HANDLERS and scheme in _SCHEME_MODULES:
+        _import_module( _SCHEME_MODULES[ scheme ] )
+    return _SCHEME_HANDLERS.get( scheme )
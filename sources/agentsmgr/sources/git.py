@@ -22,13 +22,13 @@
 
     This module provides source resolution for Git repositories, supporting
     various URL schemes and subdirectory specifications via fragment syntax.
+    Dulwich is imported only when cloning, since it is costly to import.
 '''
 
 
-import dulwich.porcelain as _dulwich_porcelain
-
 from . import __
 from . import base as _base
+from . import webapi as _webapi
 
 
 GitApiTag: __.typx.TypeAlias = __.cabc.Mapping[ str, __.typx.Any ]
@@ -310,6 +310,7 @@ class GitSourceHandler:
 
             Uses depth=1 and branch parameters for efficient cloning.
         '''
+        from dulwich import porcelain as _dulwich_porcelain
         with open( __.os.devnull, 'wb' ) as devnull:
             _dulwich_porcelain.clone(
                 git_url,
@@ -331,6 +332,7 @@ class GitSourceHandler:
             This is the fallback path for repositories that cannot use
             API optimization or when explicit ref is provided.
         '''
+        from dulwich import porcelain as _dulwich_porcelain
         with open( __.os.devnull, 'wb' ) as devnull:
             _dulwich_porcelain.clone(
                 location.git_url,
@@ -430,6 +432,7 @@ class GitSourceHandler:
 
     def _checkout_ref( self, repo_dir: __.Path, ref: str ) -> None:
         ''' Checks out a specific branch, tag, or commit in cloned repo. '''
+        from dulwich import porcelain as _dulwich_porcelain
         from dulwich.repo import Repo
         try:
             repo = Repo( str( repo_dir ) )
@@ -523,42 +526,37 @@ class GitSourceHandler:
     ) -> __.typx.Optional[ list[ GitApiTag ] ]:
         ''' Retrieves tags from GitHub API.
 
-            Returns list of tag dictionaries or None on failure. Each tag
-            contains 'name' and 'commit' fields.
+            Follows pagination by Link header. Returns list of tag
+            dictionaries or None on failure. Each tag contains 'name' and
+            'commit' fields.
         '''
         token = self._acquire_github_authentication_token( )
-        url = f"https://api.github.com/repos/{owner}/{repository}/tags"
-        request = __.urlreq.Request( url )
-        if token:
-            request.add_header( 'Authorization', f"token {token}" )
-        request.add_header( 'Accept', 'application/vnd.github.v3+json' )
-        try:
-            with __.urlreq.urlopen( request, timeout = 10 ) as response:
-                return __.json.loads( response.read( ) )
-        except ( __.urlerr.URLError, __.urlerr.HTTPError, Exception ):
-            return None
+        url = (
+            f"https://api.github.com/repos/{owner}/{repository}/tags"
+            "?per_page=100" )
+        headers = { 'Accept': 'application/vnd.github.v3+json' }
+        if token: headers[ 'Authorization' ] = f"token {token}"
+        return _webapi.retrieve_json_pages(
+            url, headers, _webapi.locate_next_link )
 
     def _retrieve_gitlab_tags(
         self, owner: str, repository: str
     ) -> __.typx.Optional[ list[ GitApiTag ] ]:
         ''' Retrieves tags from GitLab API.
 
-            Returns list of tag dictionaries or None on failure. Each tag
-            contains 'name' and 'commit' fields.
+            Follows pagination by X-Next-Page header. Returns list of tag
+            dictionaries or None on failure. Each tag contains 'name' and
+            'commit' fields.
         '''
         token = self._acquire_gitlab_authentication_token( )
         project_path = f"{owner}%2F{repository}"
         url = (
             f"https://gitlab.com/api/v4/projects/{project_path}/"
-            f"repository/tags" )
-        request = __.urlreq.Request( url )
-        if token:
-            request.add_header( 'PRIVATE-TOKEN', token )
-        try:
-            with __.urlreq.urlopen( request, timeout = 10 ) as response:
-                return __.json.loads( response.read( ) )
-        except ( __.urlerr.URLError, __.urlerr.HTTPError, Exception ):
-            return None
+            f"repository/tags?per_page=100" )
+        headers: dict[ str, str ] = { }
+        if token: headers[ 'PRIVATE-TOKEN' ] = token
+        return _webapi.retrieve_json_pages(
+            url, headers, _webapi.locate_next_page )
 
     def _extract_repository_information(
         self, git_url: str
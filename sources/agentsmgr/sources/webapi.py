@@ -0,0 +1,382 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Pooled, cached HTTP client for hosting service APIs.
+
+    Reuses keep-alive connections per origin and revalidates responses
+    against an on-disk cache with ETags, so that repeated lookups cost a
+    conditional request answered by ``304 Not Modified``. Failures are
+    remembered for a short interval, so that repeated lookups against an
+    unavailable service fail fast. The HTTP client module is imported only
+    when a connection is first made.
+'''
+
+
+import hashlib as _hashlib
+import http as _http
+import threading as _threading
+import time as _time
+
+from .. import timings as _timings
+from . import __
+from . import base as _base
+
+
+if __.typx.TYPE_CHECKING:
+    import http.client as _httpc
+
+
+_CREDENTIAL_HEADERS = frozenset( ( 'authorization', 'private-token' ) )
+_FAILURE_INTERVAL = 120.0
+_PAGES_MAXIMUM = 50
+_REDIRECTION_STATUSES = frozenset( (
+    _http.HTTPStatus.MOVED_PERMANENTLY,
+    _http.HTTPStatus.FOUND,
+    _http.HTTPStatus.SEE_OTHER,
+    _http.HTTPStatus.TEMPORARY_REDIRECT,
+    _http.HTTPStatus.PERMANENT_REDIRECT,
+) )
+_REDIRECTS_MAXIMUM = 5
+_RETAINED_HEADERS = ( 'etag', 'link', 'x-next-page' )
+_TIMEOUT = 10.0
+
+
+_scribe = __.provide_scribe( __name__ )
+
+
+class ApiResponse( __.immut.DataclassObject ):
+    ''' Successful API response, possibly revalidated from cache. '''
+
+    url: str
+    content: bytes
+    headers: __.immut.Dictionary[ str, str ]
+
+
+class ResponseCache( __.immut.DataclassObject ):
+    ''' On-disk cache of API responses and recent failures.
+
+        Entries are keyed by digest of request URL and headers, so that
+        responses for different credentials are kept apart. Failures to
+        store entries only degrade caching and are never fatal.
+    '''
+
+    location: __.Path
+
+    def access(
+        self, key: str
+    ) -> __.typx.Optional[ dict[ str, __.typx.Any ] ]:
+        ''' Returns cache entry for key, if present and readable. '''
+        entry = self._calculate_entry_location( key )
+        try: data = __.json.loads( entry.read_bytes( ) )
+        except ( OSError, ValueError ): return None
+        if not isinstance( data, dict ): return None
+        return __.typx.cast( dict[ str, __.typx.Any ], data )
+
+    def store(
+        self, key: str, data: __.cabc.Mapping[ str, __.typx.Any ]
+    ) -> None:
+        ''' Stores cache entry for key, replacing atomically. '''
+        entry = self._calculate_entry_location( key )
+        try:
+            entry.parent.mkdir( parents = True, exist_ok = True )
+            with __.tempfile.NamedTemporaryFile(
+                dir = entry.parent, prefix = '.', delete = False
+            ) as stream: stream.write( __.json.dumps( data ).encode( ) )
+            __.os.replace( stream.name, entry )
+        except OSError as exception:
+            _scribe.debug(
+                f"Could not cache API response at {entry}: {exception}" )
+
+    def _calculate_entry_location( self, key: str ) -> __.Path:
+        return self.location / key[ : 2 ] / f"{key}.json"
+
+
+class ApiClient:
+    ''' HTTP client which reuses keep-alive connections per origin.
+
+        Requests are serialized, so that one connection per origin
+        suffices. The lock which serializes them is shared by all hosts,
+        so that concurrent lookups, such as tag lookups from concurrent
+        populate stages, wait for each other even when they address
+        different hosts. Responses are revalidated against the active
+        response cache, if any.
+    '''
+
+    def __init__(
+        self,
+        timeout: float = _TIMEOUT,
+        failure_interval: float = _FAILURE_INTERVAL,
+    ) -> None:
+        self.timeout = timeout
+        self.failure_interval = failure_interval
+        self._connections: dict[
+            tuple[ str, str, __.typx.Optional[ int ] ],
+            '_httpc.HTTPConnection' ] = { }
+        self._failures: dict[ str, float ] = { }
+        self._lock = _threading.Lock( )
+
+    def close( self ) -> None:
+        ''' Closes all pooled connections. '''
+        with self._lock:
+            for connection in self._connections.values( ):
+                connection.close( )
+            self._connections.clear( )
+
+    def retrieve(
+        self, url: str, headers: __.cabc.Mapping[ str, str ]
+    ) -> __.typx.Optional[ ApiResponse ]:
+        ''' Retrieves resource, revalidating any cached response.
+
+            Returns None if the request fails or if it failed within the
+            failure interval.
+        '''
+        location = _base.access_cache_location( 'responses' )
+        cache = None if location is None else ResponseCache(
+            location = location )
+        key = _calculate_key( url, headers )
+        entry = ( cache.access( key ) if cache else None ) or { }
+        now = _time.time( )
+        with self._lock: remembered = self._failures.get( key, 0.0 )
+        failure = max( remembered, entry.get( 'failure', 0.0 ) )
+        if now - failure < self.failure_interval:
+            _timings.count( 'http-failures-remembered' )
+            return None
+        headers_ = dict( headers )
+        if 'etag' in entry and 'content' in entry:
+            headers_[ 'If-None-Match' ] = entry[ 'etag' ]
+        result = self._request_following( url, headers_ )
+        if (
+            result is None
+            or result[ 1 ] >= _http.HTTPStatus.INTERNAL_SERVER_ERROR
+        ):
+            # Only outages are remembered; client errors, such as rate
+            # limits, depend on credentials and may clear at any time.
+            with self._lock: self._failures[ key ] = now
+            if cache: cache.store( key, { **entry, 'failure': now } )
+            return None
+        location, status, response_headers, content = result
+        if status == _http.HTTPStatus.NOT_MODIFIED and 'content' in entry:
+            _timings.count( 'cache-hits' )
+            return ApiResponse(
+                url = entry.get( 'url', location ),
+                content = entry[ 'content' ].encode( ),
+                headers = __.immut.Dictionary( entry[ 'headers' ] ) )
+        if status != _http.HTTPStatus.OK:
+            _scribe.debug( f"Request to {url} answered with {status}." )
+            return None
+        with self._lock: self._failures.pop( key, None )
+        response = ApiResponse(
+            url = location,
+            content = content,
+            headers = __.immut.Dictionary( {
+                name: value for name, value in response_headers.items( )
+                if name in _RETAINED_HEADERS } ) )
+        if cache: _store_response( cache, key, response )
+        return response
+
+    def _request_following(
+        self, url: str, headers: __.cabc.Mapping[ str, str ]
+    ) -> __.typx.Optional[ tuple[ str, int, dict[ str, str ], bytes ] ]:
+        ''' Sends GET request, following a bounded number of redirects.
+
+            Credentials are not forwarded to other hosts. Returns final
+            location, status, headers, and content, or None if an exchange
+            fails.
+        '''
+        host = __.urlparse.urlsplit( url ).netloc
+        for _ in range( _REDIRECTS_MAXIMUM ):
+            result = self._request( url, headers )
+            if result is None: return None
+            status, response_headers, content = result
+            target = response_headers.get( 'location' )
+            if status not in _REDIRECTION_STATUSES or not target:
+                return url, status, response_headers, content
+            url = __.urlparse.urljoin( url, target )
+            if __.urlparse.urlsplit( url ).netloc != host:
+                headers = {
+                    name: value for name, value in headers.items( )
+                    if name.lower( ) not in _CREDENTIAL_HEADERS }
+        result = self._request( url, headers )
+        if result is None: return None
+        return ( url, *result )
+
+    def _request(
+        self, url: str, headers: __.cabc.Mapping[ str, str ]
+    ) -> __.typx.Optional[ tuple[ int, dict[ str, str ], bytes ] ]:
+        ''' Sends GET request on pooled connection.
+
+            Returns status, headers with lowercase names, and content, or
+            None if the exchange fails.
+        '''
+        import http.client as _httpc
+        parts = __.urlparse.urlsplit( url )
+        origin = ( parts.scheme, parts.hostname or '', parts.port )
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        with self._lock:
+            reused = origin in self._connections
+            try: return self._exchange( origin, path, headers )
+            except ( OSError, _httpc.HTTPException ) as exception:
+                if not reused:
+                    _scribe.debug( f"Request to {url} failed: {exception}" )
+                    return None
+            # Servers may close idle keep-alive connections; retry afresh.
+            try: return self._exchange( origin, path, headers )
+            except ( OSError, _httpc.HTTPException ) as exception:
+                _scribe.debug( f"Request to {url} failed: {exception}" )
+                return None
+
+    def _exchange(
+        self,
+        origin: tuple[ str, str, __.typx.Optional[ int ] ],
+        path: str,
+        headers: __.cabc.Mapping[ str, str ],
+    ) -> tuple[ int, dict[ str, str ], bytes ]:
+        connection = self._connections.get( origin )
+        if connection is None:
+            connection = _produce_connection( origin, self.timeout )
+            self._connections[ origin ] = connection
+        else: _timings.count( 'http-connections-reused' )
+        try:
+            connection.request(
+                'GET', path,
+                headers = { 'User-Agent': __.package_name, **headers } )
+            response = connection.getresponse( )
+            content = response.read( )
+        except BaseException:
+            connection.close( )
+            del self._connections[ origin ]
+            raise
+        _timings.count( 'http-requests' )
+        if response.will_close:
+            connection.close( )
+            del self._connections[ origin ]
+        return (
+            response.status,
+            { name.lower( ): value for name, value in response.getheaders( ) },
+            content )
+
+
+_client = ApiClient( )
+
+
+def locate_next_link( response: ApiResponse ) -> __.typx.Optional[ str ]:
+    ''' Returns URL of next page from Link header (GitHub style). '''
+    for link in response.headers.get( 'link', '' ).split( ',' ):
+        target, _, parameters = link.partition( ';' )
+        relations = (
+            parameter.strip( ).replace( ' ', '' )
+            for parameter in parameters.split( ';' ) )
+        if 'rel="next"' in relations:
+            return target.strip( ).strip( '<>' )
+    return None
+
+
+def locate_next_page( response: ApiResponse ) -> __.typx.Optional[ str ]:
+    ''' Returns URL of next page from X-Next-Page header (GitLab style). '''
+    page = response.headers.get( 'x-next-page', '' ).strip( )
+    if not page: return None
+    parts = __.urlparse.urlsplit( response.url )
+    query = [
+        ( name, value )
+        for name, value in __.urlparse.parse_qsl( parts.query )
+        if name != 'page' ]
+    query.append( ( 'page', page ) )
+    return __.urlparse.urlunsplit(
+        parts._replace( query = __.urlparse.urlencode( query ) ) )
+
+
+def retrieve_json_pages(
+    url: str,
+    headers: __.cabc.Mapping[ str, str ],
+    successor: __.cabc.Callable[
+        [ ApiResponse ], __.typx.Optional[ str ] ],
+) -> __.typx.Optional[ list[ __.typx.Any ] ]:
+    ''' Retrieves and concatenates JSON arrays from paginated resource.
+
+        Successor locates URL of the page after each response. Returns
+        None if any page cannot be retrieved or is not a JSON array.
+    '''
+    items: list[ __.typx.Any ] = [ ]
+    url_: __.typx.Optional[ str ] = url
+    for _ in range( _PAGES_MAXIMUM ):
+        if url_ is None: break
+        response = _client.retrieve( url_, headers )
+        if response is None: return None
+        try: page = __.json.loads( response.content )
+        except ValueError: return None
+        if not isinstance( page, list ): return None
+        items.extend( __.typx.cast( list[ __.typx.Any ], page ) )
+        url_ = successor( response )
+    return items
+
+
+def _calculate_key(
+    url: str, headers: __.cabc.Mapping[ str, str ]
+) -> str:
+    hasher = _hashlib.sha256( url.encode( ) )
+    for name, value in sorted( headers.items( ) ):
+        hasher.update( f"\n{name.lower( )}: {value}".encode( ) )
+    return hasher.hexdigest( )
+
+
+def _store_response(
+    cache: ResponseCache, key: str, response: ApiResponse
+) -> None:
+    ''' Stores response for revalidation, if it has an ETag. '''
+    if 'etag' not in response.headers: return
+    try: text = response.content.decode( )
+    except UnicodeDecodeError: return
+    cache.store( key, {
+        'url': response.url,
+        'etag': response.headers[ 'etag' ],
+        'headers': dict( response.headers ),
+        'content': text } )
+
+
+def _produce_connection(
+    origin: tuple[ str, str, __.typx.Optional[ int ] ], timeout: float
+) -> '_httpc.HTTPConnection':
+    ''' Produces connection to origin, tunneling through HTTPS proxy. '''
+    import http.client as _httpc
+    import urllib.request as _urlreq
+    scheme, host, port = origin
+    if scheme != 'https':
+        return _httpc.HTTPConnection( host, port, timeout = timeout )
+    proxy = _urlreq.getproxies( ).get( 'https' )
+    if not proxy or _urlreq.proxy_bypass( host ):
+        return _httpc.HTTPSConnection( host, port, timeout = timeout )
+    if '://' not in proxy: proxy = f"http://{proxy}"
+    proxy_parts = __.urlparse.urlsplit( proxy )
+    proxy_port = proxy_parts.port or (
+        _httpc.HTTPS_PORT if proxy_parts.scheme == 'https'
+        else _httpc.HTTP_PORT )
+    tunnel_headers: dict[ str, str ] = { }
+    if proxy_parts.username is not None:
+        import base64 as _base64
+        credentials = ':'.join( (
+            __.urlparse.unquote( proxy_parts.username ),
+            __.urlparse.unquote( proxy_parts.password or '' ) ) )
+        tunnel_headers[ 'Proxy-Authorization' ] = 'Basic {}'.format(
+            _base64.b64encode( credentials.encode( ) ).decode( ) )
+    connection = _httpc.HTTPSConnection(
+        proxy_parts.hostname or '', proxy_port, timeout = timeout )
+    connection.set_tunnel( host, port, headers = tunnel_headers )
+    return connection
@@ -0,0 +1,230 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Batched planning and application of managed symlinks.
+
+    Populate manages several families of symlinks (memory files, coder
+    directories, OpenSpec home, skills discovery). Rather than probing
+    each link individually, desired links are declared as intentions,
+    surveyed with one directory scan per parent, and turned into a plan
+    which only touches links that differ from the desired state.
+'''
+
+
+from . import __
+from . import events as _events
+
+
+_scribe = __.provide_scribe( __name__ )
+
+
+class SymlinkActions( __.enum.Enum ):
+    ''' Action required to bring a link path to its desired state. '''
+
+    Create = 'create'
+    Update = 'update'
+    Replace = 'replace'
+    Retain = 'retain'
+    Conflict = 'conflict'
+
+
+class SymlinkIntention( __.immut.DataclassObject ):
+    ''' Desired symlink from link path to source.
+
+        When replace_existing is true, an existing non-symlink path at the
+        link location is removed in favor of the symlink. Otherwise, such a
+        path is left in place and reported as a conflict.
+    '''
+
+    source: __.Path
+    link: __.Path
+    replace_existing: bool = False
+
+
+class SymlinkAction( __.immut.DataclassObject ):
+    ''' Planned action for one symlink intention. '''
+
+    intention: SymlinkIntention
+    kind: SymlinkActions
+    target: str
+    current: __.typx.Optional[ str ] = None
+
+    @property
+    def managed( self ) -> bool:
+        ''' Whether link path is (or will be) a managed symlink. '''
+        return self.kind is not SymlinkActions.Conflict
+
+    def render_as_markdown( self ) -> str:
+        ''' Renders action as one Markdown line. '''
+        link = self.intention.link
+        match self.kind:
+            case SymlinkActions.Create:
+                return f"create {link} → {self.target}"
+            case SymlinkActions.Update:
+                return f"update {link}: {self.current} → {self.target}"
+            case SymlinkActions.Replace:
+                return f"replace {link} with symlink → {self.target}"
+            case SymlinkActions.Retain:
+                return f"retain {link} → {self.target}"
+            case SymlinkActions.Conflict:
+                return f"conflict at {link}; not replaced"
+
+
+class SymlinkPlan( __.immut.DataclassObject ):
+    ''' Ordered symlink actions computed from surveyed link paths. '''
+
+    actions: tuple[ SymlinkAction, ... ] = ( )
+
+    @property
+    def changes( self ) -> tuple[ SymlinkAction, ... ]:
+        ''' Actions which alter the filesystem. '''
+        return tuple(
+            action for action in self.actions
+            if action.kind in _CHANGING_ACTIONS )
+
+    def render_as_markdown( self ) -> tuple[ str, ... ]:
+        ''' Renders plan as Markdown lines for display. '''
+        return tuple(
+            f" * {action.render_as_markdown( )}"
+            for action in self.actions )
+
+
+_CHANGING_ACTIONS = frozenset( (
+    SymlinkActions.Create, SymlinkActions.Update, SymlinkActions.Replace ) )
+
+
+def survey_symlinks(
+    intentions: __.cabc.Iterable[ SymlinkIntention ]
+) -> SymlinkPlan:
+    ''' Computes plan to realize intentions against current filesystem.
+
+        Scans each distinct parent directory once. Reads link targets only
+        for existing symlinks. Later intentions for the same link path
+        supersede earlier ones.
+    '''
+    unique: dict[ __.Path, SymlinkIntention ] = { }
+    for intention in intentions:
+        unique.pop( intention.link, None )
+        unique[ intention.link ] = intention
+    entries_by_parent: dict[ __.Path, dict[ str, __.os.DirEntry[ str ] ] ] = (
+        { } )
+    actions: list[ SymlinkAction ] = [ ]
+    for intention in unique.values( ):
+        parent = intention.link.parent
+        if parent not in entries_by_parent:
+            entries_by_parent[ parent ] = _scan_directory( parent )
+        entry = entries_by_parent[ parent ].get( intention.link.name )
+        actions.append( _plan_action( intention, entry ) )
+    return SymlinkPlan( actions = tuple( actions ) )
+
+
+def apply_symlink_plan( plan: SymlinkPlan, simulate: bool = False ) -> int:
+    ''' Applies changing actions from plan.
+
+        Conflicts are reported as warnings and left untouched. In simulate
+        mode, reports intended changes without touching the filesystem.
+        Returns number of symlinks created, updated, or replacing paths.
+    '''
+    for action in plan.actions:
+        if action.kind is SymlinkActions.Conflict:
+            message = (
+                f"Path already exists at {action.intention.link}; "
+                "not replacing with symlink. Remove or relocate it to "
+                "enable agentsmgr linking." )
+            _scribe.warning( message )
+            _events.emit( _events.WarningEvent, message = message )
+    changes = plan.changes
+    for action in changes:
+        if simulate:
+            _scribe.info(
+                f"[SIMULATE] Would {action.render_as_markdown( )}" )
+        else: _apply_action( action )
+        _events.emit(
+            _events.LinkedEvent, location = action.intention.link,
+            simulated = simulate, target = action.target )
+    return len( changes )
+
+
+def _apply_action( action: SymlinkAction ) -> None:
+    ''' Applies one changing action to filesystem. '''
+    link = action.intention.link
+    match action.kind:
+        case SymlinkActions.Update:
+            _scribe.info(
+                f"Updating symlink {link.name}: "
+                f"{action.current} → {action.target}" )
+            link.unlink( )
+        case SymlinkActions.Replace:
+            _scribe.info( f"Replacing existing path with symlink: {link}" )
+            if link.is_dir( ): __.shutil.rmtree( link )
+            else: link.unlink( )
+        case _:
+            link.parent.mkdir( parents = True, exist_ok = True )
+    link.symlink_to( action.target )
+    _scribe.info( f"Created symlink: {link.name}" )
+
+
+def _calculate_link_target( intention: SymlinkIntention ) -> str:
+    ''' Calculates relative link target, falling back to absolute path. '''
+    try:
+        return __.os.path.relpath(
+            intention.source, start = intention.link.parent )
+    except ValueError:
+        return str( intention.source.resolve( ) )
+
+
+def _plan_action(
+    intention: SymlinkIntention,
+    entry: __.typx.Optional[ __.os.DirEntry[ str ] ],
+) -> SymlinkAction:
+    ''' Determines action for intention from surveyed directory entry. '''
+    target = _calculate_link_target( intention )
+    if entry is None:
+        return SymlinkAction(
+            intention = intention, kind = SymlinkActions.Create,
+            target = target )
+    if entry.is_symlink( ):
+        try: current = __.os.readlink( entry.path )
+        except OSError as exception:
+            _scribe.warning(
+                f"Cannot read symlink {intention.link}: {exception}." )
+            return SymlinkAction(
+                intention = intention, kind = SymlinkActions.Conflict,
+                target = target )
+        kind = (
+            SymlinkActions.Retain if current == target
+            else SymlinkActions.Update )
+        return SymlinkAction(
+            intention = intention, kind = kind,
+            target = target, current = current )
+    kind = (
+        SymlinkActions.Replace if intention.replace_existing
+        else SymlinkActions.Conflict )
+    return SymlinkAction( intention = intention, kind = kind, target = target )
+
+
+def _scan_directory(
+    directory: __.Path
+) -> dict[ str, __.os.DirEntry[ str ] ]:
+    ''' Scans directory once, returning entries by name. '''
+    try:
+        with __.os.scandir( directory ) as entries:
+            return { entry.name: entry for entry in entries }
+    except ( FileNotFoundError, NotADirectoryError ): return { }
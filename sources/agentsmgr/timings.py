@@ -0,0 +1,250 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Phase timing spans and counters for diagnostics.
+
+    Spans nest per thread and accumulate counters, such as bytes read and
+    written, files skipped, and cache hits, from everything within them.
+    Recording is active only within :py:func:`recording`; elsewhere, spans
+    and counters cost a single context variable lookup.
+'''
+
+
+import contextvars as _contextvars
+import threading as _threading
+import time as _time
+
+from . import __
+
+
+class TimingsFormats( __.enum.Enum ):
+    ''' Enumeration of timings export formats. '''
+
+    Json = 'json'
+    ChromeTrace = 'chrome-trace'
+
+
+class SpanRecord( __.immut.DataclassObject ):
+    ''' Completed span with offsets from start of recording in seconds. '''
+
+    path: tuple[ str, ... ]
+    start: float
+    duration: float
+    thread: int
+    counters: __.immut.Dictionary[ str, int ]
+
+
+class Recorder:
+    ''' Collects completed spans and counter totals. '''
+
+    def __init__( self ) -> None:
+        self.origin = _time.perf_counter( )
+        self.records: list[ SpanRecord ] = [ ]
+        self.counters: dict[ str, int ] = { }
+        self._lock = _threading.Lock( )
+        self._local = _threading.local( )
+
+    def access_stack( self ) -> list[ tuple[ str, float, dict[ str, int ] ] ]:
+        ''' Returns stack of open spans for current thread. '''
+        try: return self._local.stack
+        except AttributeError:
+            stack: list[ tuple[ str, float, dict[ str, int ] ] ] = [ ]
+            self._local.stack = stack
+            return stack
+
+    def access_prefix( self ) -> tuple[ str, ... ]:
+        ''' Returns path beneath which spans of current thread nest. '''
+        return getattr( self._local, 'prefix', ( ) )
+
+    def assign_prefix( self, prefix: tuple[ str, ... ] ) -> None:
+        ''' Nests subsequent spans of current thread beneath path. '''
+        self._local.prefix = prefix
+
+    def count( self, name: str, amount: int ) -> None:
+        ''' Adds amount to counter totals and to counters of open spans. '''
+        with self._lock:
+            self.counters[ name ] = self.counters.get( name, 0 ) + amount
+        for _, _, counters in self.access_stack( ):
+            counters[ name ] = counters.get( name, 0 ) + amount
+
+    def record(
+        self,
+        path: tuple[ str, ... ],
+        start: float,
+        counters: dict[ str, int ],
+    ) -> None:
+        ''' Records completed span which began at start. '''
+        finish = _time.perf_counter( )
+        record = SpanRecord(
+            path = path,
+            start = start - self.origin,
+            duration = finish - start,
+            thread = _threading.get_ident( ),
+            counters = __.immut.Dictionary( counters ) )
+        with self._lock: self.records.append( record )
+
+    def render_as_json( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders spans and counter totals as JSON-compatible data. '''
+        return {
+            'spans': [
+                {
+                    'name': '/'.join( record.path ),
+                    'start': record.start,
+                    'duration': record.duration,
+                    'thread': record.thread,
+                    'counters': dict( record.counters ),
+                }
+                for record in sorted(
+                    self.records, key = lambda record: record.start ) ],
+            'counters': dict( sorted( self.counters.items( ) ) ),
+        }
+
+    def render_as_chrome_trace( self ) -> dict[ str, __.typx.Any ]:
+        ''' Renders spans as Chrome trace events (``chrome://tracing``). '''
+        process = __.os.getpid( )
+        events: list[ dict[ str, __.typx.Any ] ] = [
+            {
+                'name': record.path[ -1 ],
+                'cat': 'agentsmgr',
+                'ph': 'X',
+                'ts': record.start * 1e6,
+                'dur': record.duration * 1e6,
+                'pid': process,
+                'tid': record.thread,
+                'args': dict( record.counters ),
+            }
+            for record in self.records ]
+        return { 'traceEvents': events, 'displayTimeUnit': 'ms' }
+
+    def render_as_text( self ) -> tuple[ str, ... ]:
+        ''' Renders spans as indented tree with same-path spans combined.
+
+            Lines show total duration, number of spans when more than
+            one, and counters.
+        '''
+        totals: dict[ tuple[ str, ... ], list[ __.typx.Any ] ] = { }
+        for record in sorted(
+            self.records, key = lambda record: record.start
+        ):
+            entry = totals.setdefault( record.path, [ 0.0, 0, { } ] )
+            entry[ 0 ] += record.duration
+            entry[ 1 ] += 1
+            for name, amount in record.counters.items( ):
+                entry[ 2 ][ name ] = entry[ 2 ].get( name, 0 ) + amount
+        lines: list[ str ] = [ ]
+        for path in sorted( totals, key = _order_paths( totals ) ):
+            duration, spans, counters = totals[ path ]
+            label = '  ' * ( len( path ) - 1 ) + path[ -1 ]
+            if spans > 1: label = f"{label} (x{spans})"
+            summary = ' '.join(
+                f"{name}={amount}" for name, amount in sorted(
+                    counters.items( ) ) )
+            line = f"{label:<48} {duration * 1000:10.1f} ms  {summary}"
+            lines.append( line.rstrip( ) )
+        if self.counters:
+            lines.append( ' '.join(
+                f"{name}={amount}"
+                for name, amount in sorted( self.counters.items( ) ) ) )
+        return tuple( lines )
+
+
+class _Span:
+    ''' Context manager which records span into active recorder. '''
+
+    __slots__ = ( 'name', 'recorder' )
+
+    def __init__( self, recorder: Recorder, name: str ) -> None:
+        self.name = name
+        self.recorder = recorder
+
+    def __enter__( self ) -> None:
+        self.recorder.access_stack( ).append(
+            ( self.name, _time.perf_counter( ), { } ) )
+
+    def __exit__( self, *exception_info: __.typx.Any ) -> None:
+        stack = self.recorder.access_stack( )
+        path = self.recorder.access_prefix( ) + tuple(
+            name for name, _, _ in stack )
+        _, start, counters = stack.pop( )
+        self.recorder.record( path, start, counters )
+
+
+_recorder: _contextvars.ContextVar[ __.typx.Optional[ Recorder ] ] = (
+    _contextvars.ContextVar( 'agentsmgr_timings_recorder', default = None ) )
+_inactive_span = __.ctxl.nullcontext( )
+
+
+@__.ctxl.contextmanager
+def adopting( path: tuple[ str, ... ] ) -> __.cabc.Iterator[ None ]:
+    ''' Nests spans of current thread beneath path, if recording.
+
+        For work offloaded to worker threads, with path captured by
+        :py:func:`locate` in the offloading thread.
+    '''
+    recorder = _recorder.get( )
+    if recorder is None:
+        yield
+        return
+    prefix = recorder.access_prefix( )
+    recorder.assign_prefix( path )
+    try: yield
+    finally: recorder.assign_prefix( prefix )
+
+
+def count( name: str, amount: int = 1 ) -> None:
+    ''' Adds amount to named counter, if recording. '''
+    recorder = _recorder.get( )
+    if recorder is not None: recorder.count( name, amount )
+
+
+def locate( ) -> tuple[ str, ... ]:
+    ''' Returns path of innermost open span of current thread. '''
+    recorder = _recorder.get( )
+    if recorder is None: return ( )
+    return recorder.access_prefix( ) + tuple(
+        name for name, _, _ in recorder.access_stack( ) )
+
+
+@__.ctxl.contextmanager
+def recording( ) -> __.cabc.Iterator[ Recorder ]:
+    ''' Activates new recorder for current context. '''
+    recorder = Recorder( )
+    token = _recorder.set( recorder )
+    try: yield recorder
+    finally: _recorder.reset( token )
+
+
+def span( name: str ) -> __.typx.ContextManager[ None ]:
+    ''' Returns context manager which times named span, if recording. '''
+    recorder = _recorder.get( )
+    if recorder is None: return _inactive_span
+    return _Span( recorder, name )
+
+
+def _order_paths(
+    totals: __.cabc.Mapping[ tuple[ str, ... ], __.typx.Any ]
+) -> __.cabc.Callable[ [ tuple[ str, ... ] ], tuple[ int, ... ] ]:
+    ''' Orders paths depth-first by first appearance of each ancestor. '''
+    positions = { path: index for index, path in enumerate( totals ) }
+    def key( path: tuple[ str, ... ] ) -> tuple[ int, ... ]:
+        return tuple(
+            positions.get( path[ : size ], len( positions ) )
+            for size in range( 1, len( path ) + 1 ) )
+    return key
@@ -0,0 +1,154 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Document-preserving application of settings patches to TOML text.
+
+    Inserts missing keys into their existing tables and appends missing
+    tables to the end of the document, leaving all other text, including
+    comments and formatting, untouched.
+'''
+
+
+from . import __
+from . import patches as _patches
+
+
+class _Section( __.immut.DataclassObject ):
+    ''' Span of lines belonging to a table within a TOML document. '''
+
+    path: tuple[ str, ... ]
+    header: int
+    end: int
+
+
+def apply_patch_to_toml_text(
+    content: str, patch: _patches.SettingsPatch
+) -> __.typx.Optional[ str ]:
+    ''' Applies patch to TOML document text, preserving existing text.
+
+        Returns None if the patch cannot be applied by insertion alone,
+        such as when a parent table is defined implicitly or inline, or
+        if the edited document does not parse to the expected settings.
+    '''
+    import toml as _toml
+    lines = content.splitlines( keepends = True )
+    if lines and not lines[ -1 ].endswith( '\n' ): lines[ -1 ] += '\n'
+    sections = _survey_sections( lines )
+    if sections is None: return None
+    insertions: dict[ int, list[ str ] ] = { }
+    appendices: list[ str ] = [ ]
+    for addition in patch.additions:
+        rendered = _toml.dumps( { addition.path[ -1 ]: addition.value } )
+        if _contains_header( rendered ):
+            appendices.append(
+                _toml.dumps( _nest( addition.path, addition.value ) ) )
+            continue
+        section = sections.get( addition.path[ : -1 ] )
+        if section is None: return None
+        position = _locate_insertion( lines, section )
+        insertions.setdefault( position, [ ] ).append( rendered )
+    result: list[ str ] = [ ]
+    for index in range( len( lines ) + 1 ):
+        result.extend( insertions.get( index, ( ) ) )
+        if index < len( lines ): result.append( lines[ index ] )
+    for appendix in appendices:
+        if result and result[ -1 ].strip( ): result.append( '\n' )
+        result.append( appendix )
+    text = ''.join( result )
+    if not _verify_edit( content, text, patch ): return None
+    return text
+
+
+def _contains_header( rendered: str ) -> bool:
+    return any(
+        line.startswith( '[' ) for line in rendered.splitlines( ) )
+
+
+def _locate_insertion( lines: list[ str ], section: _Section ) -> int:
+    ''' Locates index after last content line of section. '''
+    for index in range( section.end - 1, section.header, -1 ):
+        stripped = lines[ index ].strip( )
+        if stripped and not stripped.startswith( '#' ): return index + 1
+    return section.header + 1
+
+
+def _nest(
+    path: tuple[ str, ... ], value: __.typx.Any
+) -> dict[ str, __.typx.Any ]:
+    nested: dict[ str, __.typx.Any ] = { path[ -1 ]: value }
+    for key in reversed( path[ : -1 ] ): nested = { key: nested }
+    return nested
+
+
+def _parse_header( line: str ) -> __.typx.Optional[ tuple[ str, ... ] ]:
+    ''' Parses key path of standard table header line.
+
+        Returns None for array-of-tables headers or unparseable lines.
+    '''
+    try: document = __.tomli.loads( line )
+    except __.tomli.TOMLDecodeError: return None
+    path: list[ str ] = [ ]
+    node: __.typx.Any = document
+    while isinstance( node, dict ) and node:
+        table = __.typx.cast( dict[ str, __.typx.Any ], node )
+        if len( table ) != 1: return None
+        key, node = next( iter( table.items( ) ) )
+        path.append( key )
+    if not isinstance( node, dict ): return None
+    return tuple( path )
+
+
+def _survey_sections(
+    lines: list[ str ]
+) -> __.typx.Optional[ dict[ tuple[ str, ... ], _Section ] ]:
+    ''' Surveys spans of standard tables, including the root table.
+
+        Array-of-tables sections are recognized as boundaries but are not
+        addressable. Returns None if a header cannot be interpreted.
+    '''
+    boundaries: list[ tuple[ int, __.typx.Optional[ tuple[ str, ... ] ] ] ]
+    boundaries = [ ( -1, ( ) ) ]
+    for index, line in enumerate( lines ):
+        stripped = line.lstrip( )
+        if stripped.startswith( '[[' ):
+            boundaries.append( ( index, None ) )
+        elif stripped.startswith( '[' ):
+            path = _parse_header( stripped )
+            if path is None: return None
+            boundaries.append( ( index, path ) )
+    sections: dict[ tuple[ str, ... ], _Section ] = { }
+    for ( header, path ), ( end, _ ) in zip(
+        boundaries, [ *boundaries[ 1: ], ( len( lines ), None ) ],
+        strict = True
+    ):
+        if path is None: continue
+        sections[ path ] = _Section( path = path, header = header, end = end )
+    return sections
+
+
+def _verify_edit(
+    original: str, edited: str, patch: _patches.SettingsPatch
+) -> bool:
+    ''' Verifies edited text parses to original settings plus patch. '''
+    expected: dict[ str, __.typx.Any ] = __.tomli.loads( original )
+    _patches.apply_settings_patch( expected, patch )
+    try: actual = __.tomli.loads( edited )
+    except __.tomli.TOMLDecodeError: return False
+    return actual == expected
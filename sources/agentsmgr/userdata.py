@@ -27,17 +27,23 @@
 
 
 import json as _json
+import stat as _stat
 
-import toml as _toml
 
 from . import __
+from . import events as _events
 from . import exceptions as _exceptions
+from . import patches as _patches
 from . import resolver as _resolver
+from . import timings as _timings
 
 
 _scribe = __.provide_scribe( __name__ )
 
 
+_COMPARISON_CHUNK_SIZE = 65536
+
+
 def _is_json_dict(
     value: __.typx.Any
 ) -> __.typx.TypeGuard[ dict[ str, __.typx.Any ] ]:
@@ -111,43 +117,137 @@ def _copy_file_directly(
 ) -> bool:
     ''' Copies file directly from source to target location.
 
-        Creates target directory if needed. Returns True if file was
-        updated (or would be updated in simulation mode).
+        Creates target directory if needed. Leaves target untouched if it
+        already matches source. Returns True if file was updated (or would
+        be updated in simulation mode).
+    '''
+    mode = _stat.S_IMODE( source.stat( ).st_mode )
+    return _install_file( source, target, mode, simulate )
+
+
+def _install_file(
+    source: __.Path, target: __.Path, mode: int, simulate: bool
+) -> bool:
+    ''' Installs file with permission bits unless target is identical.
+
+        Copies source to a temporary file beside target and renames it
+        over target, so that a running script never observes a partially
+        written file. Returns True if file was installed (or would be
+        installed in simulation mode).
     '''
+    if _is_installation_current( source, target, mode ):
+        _timings.count( 'files-skipped' )
+        _events.emit(
+            _events.SkippedEvent, location = target, simulated = simulate,
+            reason = 'current' )
+        return False
     if simulate:
+        _scribe.info( f"Would install {target}" )
+        _events.emit_written(
+            target, size = source.stat( ).st_size, simulated = True )
         return True
-    target.parent.mkdir( parents = True, exist_ok = True )
-    try: __.shutil.copy2( source, target )
+    def produce( temporary: __.Path ) -> None:
+        __.shutil.copy2( source, temporary )
+        temporary.chmod( mode )
+    try: _replace_file( target, produce )
     except ( OSError, IOError ) as exception:
         raise _exceptions.GlobalsPopulationFailure(
             source, target
         ) from exception
+    _timings.count( 'files-written' )
+    _events.emit_written( target, size = target.stat( ).st_size )
     return True
 
 
+def _replace_file(
+    target: __.Path, produce: __.cabc.Callable[ [ __.Path ], None ]
+) -> None:
+    ''' Replaces target with file produced beside it.
+
+        Produces file at a temporary path in the target directory and
+        renames it over target, so that readers never observe a partially
+        written file. Removes the temporary file on failure.
+    '''
+    target.parent.mkdir( parents = True, exist_ok = True )
+    descriptor, name = __.tempfile.mkstemp(
+        dir = target.parent, prefix = f".{target.name}.", suffix = '.tmp' )
+    __.os.close( descriptor )
+    temporary = __.Path( name )
+    try:
+        produce( temporary )
+        __.os.replace( temporary, target )
+    except BaseException:
+        temporary.unlink( missing_ok = True )
+        raise
+
+
+def _is_installation_current(
+    source: __.Path, target: __.Path, mode: int
+) -> bool:
+    ''' Checks whether target matches source content and mode. '''
+    try:
+        status = target.stat( )
+        if _stat.S_IMODE( status.st_mode ) != mode: return False
+        if status.st_size != source.stat( ).st_size: return False
+        with source.open( 'rb' ) as new, target.open( 'rb' ) as current:
+            while True:
+                chunk = new.read( _COMPARISON_CHUNK_SIZE )
+                if chunk != current.read( _COMPARISON_CHUNK_SIZE ):
+                    return False
+                if not chunk: return True
+    except OSError: return False
+
+
 def _merge_settings_file(
     source: __.Path, target: __.Path, simulate: bool
 ) -> bool:
     ''' Merges JSON or TOML settings file preserving user values.
 
-        Loads both source template and target user settings, performs deep
-        merge adding missing keys from template while preserving all user
-        values. Creates backup before writing merged result. Returns True
-        if file was updated (or would be updated in simulation mode).
+        Loads both source template and target user settings and calculates
+        a patch of keys missing from user settings. Writes only when the
+        patch is non-empty. TOML and JSONC documents are edited by
+        inserting only the missing keys and tables, preserving comments
+        and formatting, and need no backup; otherwise, the patch is
+        applied to user settings in place and the file is rewritten after
+        creating a backup. In simulation mode, reports the patch instead.
+        Returns True if file was updated (or would be updated in
+        simulation mode).
     '''
-    if source.suffix == '.toml':
-        template = _load_toml_file( source, target )
-        user_settings: dict[ str, __.typx.Any ] = (
-            _load_toml_file( target, target ) if target.exists( )
-            else { } )
-        merged = _deep_merge_settings( user_settings, template )
-        if simulate:
+    is_toml = source.suffix == '.toml'
+    load = _load_toml_file if is_toml else _load_json_file
+    template = load( source, target )
+    user_settings: dict[ str, __.typx.Any ] = (
+        load( target, target ) if target.exists( ) else { } )
+    patch = _patches.calculate_settings_patch( user_settings, template )
+    if not patch: return False
+    if simulate:
+        _scribe.info( f"Would merge settings into {target}:" )
+        for line in patch.render_as_markdown( ):
+            _scribe.info( f"  {line}" )
+        return True
+    if not is_toml:
+        if target.suffix == '.jsonc' and target.exists( ):
+            content = target.read_text( encoding = 'utf-8' )
+            edited = _edit_settings_text( target, content, patch )
+            if edited is not None:
+                _write_edited_settings( target, edited )
+                return True
+            _scribe.warning(
+                "JSONC settings merge rewrites '%s' and may drop comments. "
+                "A backup will be written to '%s.backup'.",
+                target,
+                target,
+            )
+        _patches.apply_settings_patch( user_settings, patch )
+        _write_merged_settings( target, user_settings )
+        return True
+    if target.exists( ):
+        content = target.read_text( encoding = 'utf-8' )
+        edited = _edit_settings_text( target, content, patch )
+        if edited is not None:
+            _write_edited_settings( target, edited )
             return True
-        if merged == user_settings:
-            return False
-        if target.exists( ) and _toml_content_contains_comments(
-            target.read_text( encoding = 'utf-8' )
-        ):
+        if _toml_content_contains_comments( content ):
             backup_path = target.with_suffix( '.toml.backup' )
             _scribe.warning(
                 "TOML settings merge rewrites '%s' and may drop comments. "
@@ -155,34 +255,59 @@ def _merge_settings_file(
                 target,
                 backup_path,
             )
-        _write_merged_toml_settings( target, merged )
-    else:
-        template = _load_json_file( source, target )
-        user_settings = (
-            _load_json_file( target, target ) if target.exists( )
-            else { } )
-        merged = _deep_merge_settings( user_settings, template )
-        if simulate:
-            return True
-        if merged == user_settings:
-            return False
-        _write_merged_settings( target, merged )
+    _patches.apply_settings_patch( user_settings, patch )
+    _write_merged_toml_settings( target, user_settings )
     return True
 
 
+def _edit_settings_text(
+    target: __.Path, content: str, patch: _patches.SettingsPatch
+) -> __.typx.Optional[ str ]:
+    ''' Applies patch to TOML or JSONC text by insertion, if possible.
+
+        Editors are imported on demand, since only user population merges
+        settings.
+    '''
+    if target.suffix == '.toml':
+        from . import tomledits as _tomledits
+        return _tomledits.apply_patch_to_toml_text( content, patch )
+    from . import jsonc as _jsonc
+    return _jsonc.apply_patch_to_jsonc_text( content, patch )
+
+
+def _write_edited_settings( target: __.Path, content: str ) -> None:
+    ''' Writes settings edited by insertion only, without backup.
+
+        Existing content is preserved verbatim by the edit, so no backup
+        is needed. Target is replaced atomically and keeps its permission
+        bits.
+    '''
+    def produce( temporary: __.Path ) -> None:
+        temporary.write_text( content, encoding = 'utf-8' )
+        __.shutil.copymode( target, temporary )
+    try: _replace_file( target, produce )
+    except ( OSError, IOError ) as exception:
+        raise _exceptions.GlobalsPopulationFailure(
+            target, target
+        ) from exception
+
+
 def _load_json_file(
     filepath: __.Path, target_context: __.Path
 ) -> dict[ str, __.typx.Any ]:
-    ''' Loads JSON file with error handling.
+    ''' Loads JSON or JSONC file with error handling.
 
-        Raises GlobalsPopulationFailure with source context on any error.
+        Comments and trailing commas are tolerated, since coders such as
+        OpenCode accept them in their settings files. Raises
+        GlobalsPopulationFailure with source context on any error.
     '''
     try: content = filepath.read_text( encoding = 'utf-8' )
     except ( OSError, IOError ) as exception:
         raise _exceptions.GlobalsPopulationFailure(
             filepath, target_context ) from exception
+    from . import jsonc as _jsonc
     try:
-        loaded: __.typx.Any = _json.loads( content )
+        loaded: __.typx.Any = _jsonc.loads( content )
     except ValueError as exception:
         raise _exceptions.GlobalsPopulationFailure(
             filepath, target_context ) from exception
@@ -201,7 +326,7 @@ def _write_merged_settings(
     '''
     target.parent.mkdir( parents = True, exist_ok = True )
     if target.exists( ):
-        backup_path = target.with_suffix( '.json.backup' )
+        backup_path = target.with_suffix( f"{target.suffix}.backup" )
         try: __.shutil.copy2( target, backup_path )
         except ( OSError, IOError ) as exception:
             raise _exceptions.GlobalsPopulationFailure(
@@ -243,6 +368,7 @@ def _write_merged_toml_settings(
         Creates target directory if needed. Backs up existing file before
         writing merged result.
     '''
+    import toml as _toml
     target.parent.mkdir( parents = True, exist_ok = True )
     if target.exists( ):
         backup_path = target.with_suffix( '.toml.backup' )
@@ -281,8 +407,10 @@ def populate_user_wrappers(
     ''' Installs wrapper scripts to user bin directory.
 
         Copies wrapper scripts from data source to ~/.local/bin,
-        making them executable. Returns tuple of (files_attempted,
-        files_installed) counts.
+        making them executable. Scripts already installed with identical
+        content and mode are left untouched. Returns tuple of
+        (files_attempted, files_installed) counts; the remainder were
+        already up to date.
     '''
     wrappers_dir = data_location / 'per-user' / 'general'
     user_bin = __.Path.home( ) / '.local' / 'bin'
@@ -294,41 +422,7 @@ def populate_user_wrappers(
         if not script.is_file( ):
             continue
         files_attempted += 1
-        target = user_bin / script.name
-        if not simulate:
-            user_bin.mkdir( parents = True, exist_ok = True )
-            try: __.shutil.copy2( script, target )
-            except ( OSError, IOError ) as exception:
-                raise _exceptions.GlobalsPopulationFailure(
-                    script, target
-                ) from exception
-            try: target.chmod( target.stat( ).st_mode | 0o111 )
-            except ( OSError, IOError ) as exception:
-                raise _exceptions.GlobalsPopulationFailure(
-                    script, target
-                ) from exception
-        files_installed += 1
+        mode = _stat.S_IMODE( script.stat( ).st_mode ) | 0o111
+        if _install_file( script, user_bin / script.name, mode, simulate ):
+            files_installed += 1
     return ( files_attempted, files_installed )
-
-
-def _deep_merge_settings(
-    target: dict[ str, __.typx.Any ], source: dict[ str, __.typx.Any ]
-) -> dict[ str, __.typx.Any ]:
-    ''' Recursively merges source into target preserving target values.
-
-        Implements additive merge: adds keys from source that are missing
-        in target. When both contain same key with dict values, recursively
-        merges nested dicts. For conflicting scalar values, target value
-        wins (user preferences preserved).
-    '''
-    result = target.copy( )
-    for key, source_value in source.items( ):
-        if key not in result:
-            result[ key ] = source_value
-        elif (
-            _is_json_dict( result[ key ] )
-            and _is_json_dict( source_value )
-        ):
-            result[ key ] = _deep_merge_settings(
-                result[ key ], source_value )
-    return result
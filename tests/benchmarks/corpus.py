@@ -0,0 +1,315 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Seeded synthesis of components/ trees and skill packages.
+
+    Produces 3-tier pipeline sources (configurations, contents, templates)
+    shaped like those shipped in ``components/``, at arbitrary scale:
+    contexts carry allowed-tools lists which mix semantic names, shell
+    commands, and MCP tools, as well as categories, argument hints, and
+    per-coder agent settings. Some items carry OpenCode content while
+    others rely on the Claude fallback. Skill packages, which are direct
+    distribution artifacts, are synthesized with assets of configurable
+    size. Equal seeds produce identical trees.
+
+    Run from the repository root::
+
+        python tests/benchmarks/corpus.py TARGET --commands 1700 --agents 200
+'''
+
+
+import argparse
+import json
+import random
+
+from dataclasses import dataclass
+from pathlib import Path
+
+
+_SEMANTIC_TOOLS = (
+    'edit', 'glob', 'grep', 'list-directory', 'read', 'todo-write',
+    'web-fetch', 'web-search', 'write',
+)
+_SHELL_COMMANDS = (
+    'git status', 'git diff', 'git log', 'git add', 'git commit',
+    'hatch run', 'hatch --env develop run', 'pytest', 'ruff check',
+    'pyright', 'isort', 'rg', 'ls', 'find', 'towncrier build',
+)
+_MCP_TOOLS = (
+    ( 'pyright', 'definition' ), ( 'pyright', 'diagnostics' ),
+    ( 'pyright', 'hover' ), ( 'pyright', 'references' ),
+    ( 'librovore', 'query-inventory' ), ( 'librovore', 'query-content' ),
+    ( 'context7', 'resolve-library-id' ), ( 'context7', 'get-library-docs' ),
+)
+_CATEGORIES = ( 'python', 'release', 'review', 'documentation' )
+_COLORS = ( 'blue', 'green', 'orange', 'pink', 'purple', 'red', 'yellow' )
+_PERMISSIONS = ( 'read', 'write', 'execute' )
+_WORDS = (
+    'analyze', 'annotation', 'changes', 'code', 'commit', 'configuration',
+    'conform', 'coverage', 'dependency', 'design', 'documentation', 'ensure',
+    'follow', 'function', 'implementation', 'interface', 'module', 'package',
+    'pattern', 'practices', 'project', 'release', 'repository', 'review',
+    'standards', 'structure', 'test', 'type', 'update', 'validate',
+)
+_TEMPLATES = {
+    ( 'commands', 'claude' ): '''\
+---
+{%- if context.allowed_tools is defined and context.allowed_tools %}
+allowed-tools: {{ context.allowed_tools | join(', ') }}
+{%- endif %}
+description: {{ context.description }}
+{%- if coder.model is defined %}
+model: {{ coder.model }}
+{%- endif %}
+{%- if context.argument_hint is defined %}
+argument-hint: "{{ context.argument_hint }}"
+{%- endif %}
+---
+
+{{ content }}
+''',
+    ( 'agents', 'claude' ): '''\
+---
+name: {{ context.name }}
+description: |
+{{ context.description | indent(2, True) }}
+{%- if context.allowed_tools is defined and context.allowed_tools %}
+tools: {{ context.allowed_tools | join(', ') }}
+{%- endif %}
+{%- if coder.model is defined %}
+model: {{ coder.model }}
+{%- endif %}
+{%- if context.color is defined %}
+color: {{ context.color }}
+{%- endif %}
+---
+
+{{ content }}
+''',
+    ( 'agents', 'opencode' ): '''\
+---
+description: |
+{{ context.description | indent(2, True) }}
+{%- if coder.mode is defined %}
+mode: {{ coder.mode }}
+{%- endif %}
+{%- if coder.model is defined %}
+model: {{ coder.model }}
+{%- endif %}
+---
+
+{{ content }}
+''',
+}
+
+
+@dataclass( frozen = True )
+class CorpusSpecification:
+    ''' Sizes and seed of synthetic corpus. '''
+
+    commands: int = 17
+    agents: int = 2
+    skills: int = 6
+    assets: int = 2
+    asset_size: int = 4096
+    seed: int = 0
+    opencode_ratio: float = 0.25
+    category_ratio: float = 0.25
+
+
+def synthesize_components(
+    target: Path, specification: CorpusSpecification
+) -> tuple[ str, ... ]:
+    ''' Writes configurations, contents, and templates under target.
+
+        Returns names of synthesized items.
+    '''
+    randomizer = random.Random( specification.seed )  # noqa: S311
+    for ( item_type, flavor ), template in _TEMPLATES.items( ):
+        _write( target / 'templates' / item_type / f"{flavor}.md.jinja",
+                template )
+    names: list[ str ] = [ ]
+    for item_type, count in (
+        ( 'commands', specification.commands ),
+        ( 'agents', specification.agents ),
+    ):
+        for index in range( count ):
+            name = f"cs-synthetic-{item_type[ :-1 ]}-{index:05}"
+            names.append( name )
+            _synthesize_item(
+                target, item_type, name, randomizer, specification )
+    return tuple( names )
+
+
+def synthesize_skills(
+    target: Path, specification: CorpusSpecification
+) -> tuple[ str, ... ]:
+    ''' Writes skill packages under per-project/general/skills of target.
+
+        Each package has ``SKILL.md`` plus references and binary assets
+        of the specified size. Returns names of synthesized skills.
+    '''
+    randomizer = random.Random( specification.seed + 1 )  # noqa: S311
+    skills = target / 'per-project' / 'general' / 'skills'
+    names: list[ str ] = [ ]
+    for index in range( specification.skills ):
+        name = f"synthetic-skill-{index:05}"
+        names.append( name )
+        package = skills / name
+        _write( package / 'SKILL.md', (
+            f"---\nname: {name}\n"
+            f"description: {_produce_sentence( randomizer )}\n---\n\n"
+            f"{_produce_markdown( randomizer, 3 )}" ) )
+        _write( package / 'references' / 'guide.md',
+                _produce_markdown( randomizer, 2 ) )
+        _write( package / 'scripts' / 'run.sh',
+                f"#!/bin/sh\necho {name}\n" ).chmod( 0o755 )
+        ( package / 'assets' ).mkdir( )
+        for asset in range( specification.assets ):
+            location = package / 'assets' / f"asset-{asset:02}.bin"
+            location.write_bytes(
+                randomizer.randbytes( specification.asset_size ) )
+    return tuple( names )
+
+
+def _produce_markdown( randomizer: random.Random, sections: int ) -> str:
+    parts: list[ str ] = [ ]
+    for _ in range( sections ):
+        parts.append( f"## {_produce_sentence( randomizer ).rstrip( '.' )}" )
+        parts.extend(
+            ' '.join(
+                _produce_sentence( randomizer )
+                for _ in range( randomizer.randint( 3, 8 ) ) )
+            for _ in range( randomizer.randint( 2, 5 ) ) )
+        parts.extend(
+            f"- {_produce_sentence( randomizer )}"
+            for _ in range( randomizer.randint( 2, 6 ) ) )
+    return '\n\n'.join( parts ) + '\n'
+
+
+def _produce_sentence( randomizer: random.Random ) -> str:
+    words = randomizer.choices( _WORDS, k = randomizer.randint( 5, 14 ) )
+    return ' '.join( words ).capitalize( ) + '.'
+
+
+def _produce_tools( randomizer: random.Random ) -> list[ str ]:
+    ''' Produces TOML lines of mixed allowed-tools specifications. '''
+    lines = [ "    # Built-in tools (semantic names)" ]
+    lines.extend(
+        f"    '{tool}',"
+        for tool in sorted( randomizer.sample(
+            _SEMANTIC_TOOLS, randomizer.randint( 2, 6 ) ) ) )
+    lines.append( "    # Shell commands" )
+    for command in randomizer.sample(
+        _SHELL_COMMANDS, randomizer.randint( 0, 6 ) ):
+        extra = (
+            ', allow-extra-arguments = true'
+            if randomizer.random( ) < 0.7 else '' )
+        lines.append(
+            f"    {{ tool = 'shell', arguments = '{command}'{extra} }}," )
+    lines.append( "    # MCP tools" )
+    lines.extend(
+        f"    {{ server = '{server}', tool = '{tool}' }},"
+        for server, tool in randomizer.sample(
+            _MCP_TOOLS, randomizer.randint( 0, 4 ) ) )
+    return lines
+
+
+def _produce_configuration(
+    item_type: str,
+    name: str,
+    randomizer: random.Random,
+    specification: CorpusSpecification,
+) -> str:
+    lines = [
+        '[context]',
+        f"name = '{name}'",
+        f"description = '{_produce_sentence( randomizer )}'",
+    ]
+    if item_type == 'commands' and randomizer.random( ) < 0.3:
+        lines.append( "argument-hint = 'target'" )
+    if randomizer.random( ) < specification.category_ratio:
+        lines.append(
+            f"category = '{randomizer.choice( _CATEGORIES )}'" )
+    lines.append( 'allowed-tools = [' )
+    lines.extend( _produce_tools( randomizer ) )
+    lines.append( ']' )
+    permissions = _PERMISSIONS[ : randomizer.randint( 1, 3 ) ]
+    lines.append( f"permissions = {json.dumps( list( permissions ) )}" )
+    if item_type == 'agents':
+        lines.extend( (
+            f"color = '{randomizer.choice( _COLORS )}'",
+            '',
+            '[[coders]]',
+            "name = 'claude'",
+            "model = 'claude-sonnet-4-5'",
+            '',
+            '[[coders]]',
+            "name = 'opencode'",
+            "mode = 'subagent'",
+            "model = 'anthropic/claude-sonnet-4-5'",
+        ) )
+    return '\n'.join( lines ) + '\n'
+
+
+def _synthesize_item(
+    target: Path,
+    item_type: str,
+    name: str,
+    randomizer: random.Random,
+    specification: CorpusSpecification,
+) -> None:
+    _write(
+        target / 'configurations' / item_type / f"{name}.toml",
+        _produce_configuration( item_type, name, randomizer, specification ) )
+    sections = randomizer.randint( 2, 8 )
+    _write(
+        target / 'contents' / item_type / 'claude' / f"{name}.md",
+        _produce_markdown( randomizer, sections ) )
+    if randomizer.random( ) < specification.opencode_ratio:
+        _write(
+            target / 'contents' / item_type / 'opencode' / f"{name}.md",
+            _produce_markdown( randomizer, sections ) )
+
+
+def _write( location: Path, content: str ) -> Path:
+    location.parent.mkdir( parents = True, exist_ok = True )
+    location.write_text( content, encoding = 'utf-8' )
+    return location
+
+
+def main( ) -> None:
+    ''' Synthesizes corpus into target directory. '''
+    parser = argparse.ArgumentParser(
+        description = __doc__.split( '\n' )[ 0 ] )
+    parser.add_argument( 'target', type = Path )
+    defaults = CorpusSpecification( )
+    for field, value in vars( defaults ).items( ):
+        parser.add_argument(
+            f"--{field.replace( '_', '-' )}", type = type( value ),
+            default = value )
+    arguments = parser.parse_args( )
+    specification = CorpusSpecification( **{
+        field: getattr( arguments, field ) for field in vars( defaults ) } )
+    synthesize_components( arguments.target / 'components', specification )
+    synthesize_skills( arguments.target / 'distribution', specification )
+
+
+if '__main__' == __name__: main( )
@@ -0,0 +1,404 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Offline startup and hot-path benchmarks for agentsmgr.
+
+    Run from the repository root::
+
+        python tests/benchmarks/run.py [--select NAME] [--compare BASELINE]
+
+    Scaled benchmarks run against corpora synthesized by the sibling
+    ``corpus`` module. Each benchmark is timed over several repetitions
+    and the samples are written as JSON to
+    ``.auxiliary/artifacts/benchmarks/<commit>.json``, so that results
+    of different commits can be compared with ``--compare``. No
+    benchmark touches the network: Git sources are resolved against a
+    local bare repository fixture.
+'''
+
+
+import argparse
+import dataclasses
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+import corpus
+
+
+_REPOSITORY = Path( __file__ ).resolve( ).parents[ 2 ]
+_ARTIFACTS = _REPOSITORY / '.auxiliary' / 'artifacts' / 'benchmarks'
+_COMPONENTS = _REPOSITORY / 'components'
+_DISTRIBUTION = _REPOSITORY / 'distribution'
+_STATUSLINE = (
+    _DISTRIBUTION / 'per-user' / 'coders' / 'claude' / 'statusline.py' )
+_CORPUS_BASIS = corpus.CorpusSpecification( )
+_IMPORTS = ( 'agentsmgr', 'agentsmgr.cli' )
+_SUBCOMMANDS = (
+    ( '--version', ),
+    ( 'detect', '--help' ),
+    ( 'generate', '--help' ),
+    ( 'populate', 'project', '--help' ),
+    ( 'populate', 'projects', '--help' ),
+    ( 'populate', 'user', '--help' ),
+    ( 'populate', 'all', '--help' ),
+)
+_ANSWERS = '''\
+project_name: benchmark
+coders:
+- claude
+- codex
+- opencode
+languages:
+- python
+provide_instructions: true
+instructions_target: .auxiliary/agents/standards
+'''
+_STATUSLINE_INPUT = json.dumps( {
+    'model': { 'display_name': 'Opus' },
+    'context_window': { 'used_percentage': 42.5 },
+} )
+
+
+Benchmark = Callable[ [ Path ], None ]
+
+
+class _Suite:
+    ''' Registry of named benchmarks and their timing samples. '''
+
+    def __init__( self, selections: Sequence[ str ], repetitions: int ):
+        self.selections = tuple( selections )
+        self.repetitions = repetitions
+        self.results: dict[ str, dict[ str, object ] ] = { }
+
+    def selects( self, name: str ) -> bool:
+        ''' Does any benchmark with name prefix match selections? '''
+        return not self.selections or any(
+            selection in name or name in selection
+            for selection in self.selections )
+
+    def measure(
+        self,
+        name: str,
+        benchmark: Benchmark,
+        workspace: Path,
+        prepare: Callable[ [ Path ], None ] | None = None,
+    ) -> None:
+        ''' Times benchmark, running optional preparation before each. '''
+        if self.selections and not any(
+            selection in name for selection in self.selections
+        ): return
+        samples: list[ float ] = [ ]
+        for _ in range( self.repetitions ):
+            if prepare is not None: prepare( workspace )
+            start = time.perf_counter( )
+            benchmark( workspace )
+            samples.append( time.perf_counter( ) - start )
+        self.results[ name ] = {
+            'samples': samples,
+            'minimum': min( samples ),
+            'median': statistics.median( samples ),
+            'mean': statistics.fmean( samples ),
+        }
+        print(
+            f"{name:<40} {statistics.median( samples ) * 1000:10.1f} ms",
+            file = sys.stderr )
+
+
+def _run( arguments: Sequence[ str ], cwd: Path, stdin: str = '' ) -> None:
+    subprocess.run(  # noqa: S603
+        arguments, cwd = cwd, input = stdin, text = True, check = True,
+        stdout = subprocess.DEVNULL, stderr = subprocess.DEVNULL )
+
+
+def _run_agentsmgr( arguments: Sequence[ str ], cwd: Path ) -> None:
+    _run( ( sys.executable, '-m', 'agentsmgr', *arguments ), cwd )
+
+
+def _specify_corpus( scale: int ) -> corpus.CorpusSpecification:
+    ''' Specifies synthetic corpus at multiple of shipped item counts. '''
+    return dataclasses.replace(
+        _CORPUS_BASIS,
+        commands = _CORPUS_BASIS.commands * scale,
+        agents = _CORPUS_BASIS.agents * scale,
+        skills = _CORPUS_BASIS.skills * scale,
+        seed = scale )
+
+
+def _synthesize_components( workspace: Path, scale: int ) -> Path:
+    components = workspace / f"components-{scale}x"
+    if not components.exists( ):
+        corpus.synthesize_components( components, _specify_corpus( scale ) )
+    return components
+
+
+def _benchmark_imports( suite: _Suite, workspace: Path ) -> None:
+    ''' Times package imports in fresh interpreters.
+
+        Complements the import tests, which only check that costly
+        modules stay deferred, with timings compared across commits.
+    '''
+    for module in _IMPORTS:
+        suite.measure(
+            f"import:{module}",
+            lambda cwd, module = module: _run(
+                ( sys.executable, '-c', f"import {module}" ), cwd ),
+            workspace )
+
+
+def _benchmark_cold_starts( suite: _Suite, workspace: Path ) -> None:
+    for arguments in _SUBCOMMANDS:
+        name = 'startup:' + ' '.join(
+            argument for argument in arguments if argument != '--help' )
+        suite.measure(
+            name,
+            lambda cwd, arguments = arguments: _run_agentsmgr(
+                arguments, cwd ),
+            workspace )
+
+
+def _benchmark_generation(
+    suite: _Suite, workspace: Path, scales: Sequence[ int ]
+) -> None:
+    for scale in scales:
+        if not suite.selects( f"generate:{scale}x" ): continue
+        components = _synthesize_components( workspace, scale )
+        output = workspace / f"distribution-{scale}x"
+        generate = (
+            'generate', '--source', str( components ),
+            '--output', str( output ) )
+
+        def clean( _: Path, output: Path = output ) -> None:
+            shutil.rmtree( output, ignore_errors = True )
+
+        suite.measure(
+            f"generate:{scale}x",
+            lambda cwd, arguments = generate: _run_agentsmgr( arguments, cwd ),
+            workspace, prepare = clean )
+        if not output.exists( ): _run_agentsmgr( generate, workspace )
+        suite.measure(
+            f"generate-check:{scale}x",
+            lambda cwd, arguments = generate: _run_agentsmgr(
+                ( *arguments, '--check' ), cwd ),
+            workspace )
+
+
+def _prepare_project( location: Path ) -> None:
+    shutil.rmtree( location, ignore_errors = True )
+    ( location / '.git' / 'info' ).mkdir( parents = True )
+    ( location / '.copier-answers.yml' ).write_text(
+        _ANSWERS, encoding = 'utf-8' )
+    ( location / '.auxiliary' / 'agents' ).mkdir( parents = True )
+    ( location / '.auxiliary' / 'agents' / 'agents.md' ).write_text(
+        '# Benchmark\n', encoding = 'utf-8' )
+
+
+def _benchmark_population( suite: _Suite, workspace: Path ) -> None:
+    if not suite.selects( 'populate-project' ): return
+    project = workspace / 'project'
+    populate = (
+        'populate', 'project', str( _DISTRIBUTION ), str( project ),
+        '--profile', str( project / '.copier-answers.yml' ) )
+    suite.measure(
+        'populate-project:cold',
+        lambda cwd: _run_agentsmgr( populate, cwd ),
+        workspace, prepare = lambda _: _prepare_project( project ) )
+    _prepare_project( project )
+    _run_agentsmgr( populate, workspace )
+    suite.measure(
+        'populate-project:warm',
+        lambda cwd: _run_agentsmgr( populate, cwd ), workspace )
+
+
+def _benchmark_scaled_population(
+    suite: _Suite, workspace: Path, scales: Sequence[ int ]
+) -> None:
+    for scale in scales:
+        name = f"populate-project:{scale}x"
+        if not suite.selects( name ): continue
+        distribution = workspace / f"populated-{scale}x"
+        if not distribution.exists( ):
+            components = _synthesize_components( workspace, scale )
+            _run_agentsmgr(
+                ( 'generate', '--source', str( components ),
+                  '--output', str( distribution ) ),
+                workspace )
+            corpus.synthesize_skills( distribution, _specify_corpus( scale ) )
+        project = workspace / f"project-{scale}x"
+        populate = (
+            'populate', 'project', str( distribution ), str( project ),
+            '--profile', str( project / '.copier-answers.yml' ) )
+        suite.measure(
+            name,
+            lambda cwd, arguments = populate: _run_agentsmgr( arguments, cwd ),
+            workspace,
+            prepare = lambda _, location = project: _prepare_project(
+                location ) )
+
+
+def _create_bare_repository( workspace: Path ) -> Path:
+    ''' Creates bare repository with tagged distribution commit. '''
+    from dulwich import porcelain
+    working = workspace / 'origin'
+    shutil.copytree( _DISTRIBUTION, working / 'distribution' )
+    porcelain.init( str( working ) )
+    porcelain.add(
+        str( working ), paths = [ str( working / 'distribution' ) ] )
+    porcelain.commit(
+        str( working ), message = b'Distribution.',
+        author = b'Benchmark <benchmark@example.com>',
+        committer = b'Benchmark <benchmark@example.com>' )
+    porcelain.tag_create( str( working ), b'agents-1' )
+    bare = workspace / 'origin.git'
+    with open( os.devnull, 'wb' ) as devnull:
+        porcelain.clone(
+            str( working ), str( bare ), bare = True, errstream = devnull )
+    return bare
+
+
+def _benchmark_git_resolution( suite: _Suite, workspace: Path ) -> None:
+    if not suite.selects( 'git-resolve' ): return
+    from agentsmgr.sources import git
+    bare = _create_bare_repository( workspace )
+    handler = git.GitSourceHandler( )
+
+    def resolve( _: Path, specification: str ) -> None:
+        location = handler.resolve( specification )
+        shutil.rmtree(
+            location.parent if location.name == 'distribution'
+            else location )
+
+    suite.measure(
+        'git-resolve:latest-tag',
+        lambda cwd: resolve( cwd, f"{bare}#distribution" ), workspace )
+    suite.measure(
+        'git-resolve:explicit-ref',
+        lambda cwd: resolve( cwd, f"{bare}@agents-1#distribution" ),
+        workspace )
+
+
+def _benchmark_statusline( suite: _Suite, workspace: Path ) -> None:
+    if not suite.selects( 'statusline' ): return
+    ( workspace / 'status' / '.git' ).mkdir( parents = True )
+    ( workspace / 'status' / '.git' / 'HEAD' ).write_text(
+        'ref: refs/heads/master\n', encoding = 'utf-8' )
+    text = json.dumps( {
+        **json.loads( _STATUSLINE_INPUT ),
+        'cwd': str( workspace / 'status' ) } )
+    suite.measure(
+        'statusline:script',
+        lambda cwd: _run( ( sys.executable, str( _STATUSLINE ) ), cwd, text ),
+        workspace )
+
+
+def _describe_revision( ) -> dict[ str, object ]:
+    def git( *arguments: str ) -> str:
+        return subprocess.run(  # noqa: S603
+            ( 'git', *arguments ), cwd = _REPOSITORY, text = True,  # noqa: S607
+            capture_output = True, check = False ).stdout.strip( )
+
+    return {
+        'commit': git( 'rev-parse', 'HEAD' ) or 'unknown',
+        'dirty': bool(
+            git( 'status', '--porcelain', '--untracked-files=no' ) ),
+        'python': platform.python_version( ),
+        'platform': platform.platform( ),
+        'timestamp': time.strftime( '%Y-%m-%dT%H:%M:%SZ', time.gmtime( ) ),
+    }
+
+
+def _compare(
+    results: dict[ str, dict[ str, object ] ], baseline: Path, threshold: float
+) -> int:
+    ''' Reports median ratios against baseline; counts regressions. '''
+    previous = json.loads( baseline.read_text( encoding = 'utf-8' ) )
+    regressions = 0
+    for name, result in results.items( ):
+        reference = previous[ 'results' ].get( name )
+        if reference is None: continue
+        ratio = (
+            float( result[ 'median' ] )  # pyright: ignore
+            / float( reference[ 'median' ] ) )
+        marker = ''
+        if ratio > threshold:
+            regressions += 1
+            marker = '  REGRESSION'
+        print( f"{name:<40} {ratio:8.2f}x{marker}", file = sys.stderr )
+    return regressions
+
+
+def _parse_arguments( ) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description = __doc__.split( '\n' )[ 0 ] )
+    parser.add_argument(
+        '--select', action = 'append', default = [ ],
+        help = "Run only benchmarks whose names contain this text." )
+    parser.add_argument( '--repetitions', type = int, default = 5 )
+    parser.add_argument(
+        '--scales', type = int, nargs = '+', default = [ 1, 10, 100 ],
+        help = "Multiples of shipped item counts to synthesize." )
+    parser.add_argument(
+        '--output', type = Path,
+        help = "Results file. Defaults to artifacts path by commit." )
+    parser.add_argument(
+        '--compare', type = Path, help = "Baseline results file." )
+    parser.add_argument(
+        '--threshold', type = float, default = 1.10,
+        help = "Median ratio above which a regression is reported." )
+    return parser.parse_args( )
+
+
+def main( ) -> int:
+    ''' Runs selected benchmarks, saves results, and compares to baseline. '''
+    arguments = _parse_arguments( )
+    suite = _Suite( arguments.select, arguments.repetitions )
+    with tempfile.TemporaryDirectory( prefix = 'agentsmgr-bench-' ) as temp:
+        workspace = Path( temp )
+        _benchmark_imports( suite, workspace )
+        _benchmark_cold_starts( suite, workspace )
+        _benchmark_generation( suite, workspace, arguments.scales )
+        _benchmark_population( suite, workspace )
+        _benchmark_scaled_population( suite, workspace, arguments.scales )
+        _benchmark_git_resolution( suite, workspace )
+        _benchmark_statusline( suite, workspace )
+    metadata = _describe_revision( )
+    output = arguments.output or (
+        _ARTIFACTS / f"{str( metadata[ 'commit' ] )[ :12 ]}.json" )
+    output.parent.mkdir( parents = True, exist_ok = True )
+    output.write_text(
+        json.dumps(
+            { 'metadata': metadata, 'results': suite.results }, indent = 2 ),
+        encoding = 'utf-8' )
+    print( f"Results written to {output}", file = sys.stderr )
+    if arguments.compare is None: return 0
+    return 1 if _compare(
+        suite.results, arguments.compare, arguments.threshold ) else 0
+
+
+if '__main__' == __name__: raise SystemExit( main( ) )
@@ -21,8 +21,13 @@
 ''' Test formatting of results objects. '''
 
 
+import asyncio
+import contextlib
+import json
 import pathlib
 
+from agentsmgr import core as _core
+from agentsmgr import exceptions as _exceptions
 from agentsmgr import results as _results
 
 
@@ -56,3 +61,81 @@ def test_200_configuration_detection_result_render( ):
     assert " * Languages: python" in lines
     assert " * Project: myproj" in lines
     assert any( line.startswith( " * Target Directory: " ) for line in lines )
+
+
+def test_300_results_render_as_json( ):
+    ''' Results render as JSON-serializable records with kinds. '''
+    generation = _results.ContentGenerationResult(
+        source_location = pathlib.Path( "/src" ),
+        target_location = pathlib.Path( "/dst" ),
+        coders = ( "coder1", ),
+        simulated = True,
+        items_generated = 3
+    )
+    record = json.loads( json.dumps( generation.render_as_json( ) ) )
+    assert record[ 'kind' ] == 'content-generation'
+    assert record[ 'source' ] == '/src'
+    assert record[ 'coders' ] == [ 'coder1' ]
+    assert record[ 'simulated' ] is True
+    assert record[ 'items_generated' ] == 3
+    fleet = _results.FleetPopulationResult(
+        source_location = pathlib.Path( "/src" ),
+        simulated = False,
+        outcomes = (
+            _results.ProjectPopulationOutcome(
+                target = pathlib.Path( "/a" ), items_generated = 2 ),
+            _results.ProjectPopulationOutcome(
+                target = pathlib.Path( "/b" ), error = "broken" ),
+        )
+    )
+    record = json.loads( json.dumps( fleet.render_as_json( ) ) )
+    assert record[ 'kind' ] == 'fleet-population'
+    assert record[ 'failures' ] == 1
+    assert record[ 'outcomes' ][ 1 ] == {
+        'target': '/b', 'items_generated': 0, 'error': 'broken',
+        'skipped': None }
+
+
+def test_400_exceptions_render_as_json( ):
+    ''' Exceptions render as error records with structured details. '''
+    error = _exceptions.CoderAbsence( 'nobody' )
+    assert error.render_as_json( ) == {
+        'kind': 'error',
+        'error': 'CoderAbsence',
+        'message': 'Coder not found in registry: nobody',
+    }
+    error = _exceptions.DataSourceInvalidity(
+        pathlib.Path( "/src" ), ( 'per-user', ) )
+    record = error.render_as_json( )
+    assert record[ 'error' ] == 'DataSourceInvalidity'
+    assert record[ 'location' ] == '/src'
+    assert record[ 'missing_directories' ] == [ 'per-user' ]
+
+
+async def _render_results( results, display ) -> None:
+    async with contextlib.AsyncExitStack( ) as exits:
+        await _core.render_and_print_results( results, display, exits )
+
+
+def test_500_several_results_render_as_one_json_document( tmp_path ):
+    ''' Several results render as one parseable JSON document. '''
+    results = tuple(
+        _results.ContentGenerationResult(
+            source_location = pathlib.Path( "/src" ),
+            target_location = pathlib.Path( target ),
+            coders = ( "coder", ),
+            simulated = True,
+        ) for target in ( "/project", "/home" ) )
+    for presentation in _core.Presentations:
+        location = tmp_path / f"output.{presentation.value}"
+        display = _core.DisplayOptions(
+            presentation = presentation, target_file = location )
+        asyncio.run( _render_results( results, display ) )
+        text = location.read_text( encoding = 'utf-8' )
+        if presentation is _core.Presentations.Json:
+            data = json.loads( text )
+            assert [ record[ 'target' ] for record in data[ 'results' ] ] == [
+                "/project", "/home" ]
+        elif presentation is _core.Presentations.Ndjson:
+            assert len( text.splitlines( ) ) == 2
+        else: assert text.count( "Generated 0 items" ) == 2
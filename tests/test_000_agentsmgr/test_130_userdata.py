@@ -21,6 +21,9 @@
 ''' Assert correct behavior of user settings population helpers. '''
 
 
+import pytest
+import tomli
+
 from . import __
 
 
@@ -61,6 +64,188 @@ def test_130_merge_settings_file_toml_preserves_user_values( tmp_path ):
     assert 'model_reasoning_effort = "high"' in merged
     assert 'hide_rate_limit_model_nudge = false' in merged
 
-    # Ensure backup exists when overwriting an existing TOML settings file.
+    # Insertion-only edits preserve existing text and need no backup.
+    assert not target.with_suffix( '.toml.backup' ).exists( )
+
+
+
+def test_140_settings_patch_records_only_additions( ):
+    patches = __.cache_import_module( 'agentsmgr.patches' )
+    settings = {
+        'model': 'user',
+        'permissions': { 'allow': [ 'a' ] },
+        'hooks': 'scalar',
+    }
+    template = {
+        'model': 'template',
+        'permissions': { 'allow': [ 'b' ], 'deny': [ 'c' ] },
+        'hooks': { 'pre': [ ] },
+        'theme': 'dark',
+    }
+    patch = patches.calculate_settings_patch( settings, template )
+    assert tuple( addition.path for addition in patch.additions ) == (
+        ( 'permissions', 'deny' ), ( 'theme', ) )
+    allow = settings[ 'permissions' ][ 'allow' ]
+    patches.apply_settings_patch( settings, patch )
+    assert settings[ 'permissions' ] == { 'allow': [ 'a' ], 'deny': [ 'c' ] }
+    assert settings[ 'permissions' ][ 'allow' ] is allow
+    assert settings[ 'theme' ] == 'dark'
+    assert not patches.calculate_settings_patch( settings, template )
+
+
+def test_150_merge_settings_file_json_writes_only_changes( tmp_path ):
+    userdata = __.cache_import_module( 'agentsmgr.userdata' )
+    source = tmp_path / 'settings.json'
+    target = tmp_path / 'user' / 'settings.json'
+    source.write_text( '{"theme": "dark"}', encoding = 'utf-8' )
+    target.parent.mkdir( )
+    target.write_text( '{"model": "user"}', encoding = 'utf-8' )
+    assert userdata._merge_settings_file( source, target, simulate = True )
+    assert target.read_text( encoding = 'utf-8' ) == '{"model": "user"}'
+    assert userdata._merge_settings_file( source, target, simulate = False )
+    assert target.with_suffix( '.json.backup' ).exists( )
+    content = target.read_text( encoding = 'utf-8' )
+    assert not userdata._merge_settings_file(
+        source, target, simulate = False )
+    assert target.read_text( encoding = 'utf-8' ) == content
+
+
+def test_160_merge_settings_file_toml_preserves_comments( tmp_path ):
+    userdata = __.cache_import_module( 'agentsmgr.userdata' )
+    source = tmp_path / 'config.toml'
+    target = tmp_path / 'user-config.toml'
+    source.write_text(
+        'model = "gpt-5.2"\n'
+        'effort = "high"\n'
+        '\n'
+        '[notice]\n'
+        'nudge = true\n'
+        'hint = false\n'
+        '\n'
+        '[notice.migrations]\n'
+        '"gpt-5.1" = "gpt-5.2"\n',
+        encoding = 'utf-8' )
+    original = (
+        '# My settings.\n'
+        'model = "gpt-4.1"  # pinned\n'
+        '\n'
+        '[notice]\n'
+        'nudge = false\n'
+        '\n'
+        '# Trailing remarks.\n' )
+    target.write_text( original, encoding = 'utf-8' )
+    assert userdata._merge_settings_file( source, target, simulate = False )
+    merged = target.read_text( encoding = 'utf-8' )
+    assert merged.startswith(
+        '# My settings.\n'
+        'model = "gpt-4.1"  # pinned\n'
+        'effort = "high"\n'
+        '\n'
+        '[notice]\n'
+        'nudge = false\n'
+        'hint = false\n'
+        '\n'
+        '# Trailing remarks.\n' )
+    assert '[notice.migrations]' in merged
+    assert not target.with_suffix( '.toml.backup' ).exists( )
+
+
+def test_170_merge_settings_file_toml_falls_back_to_rewrite( tmp_path ):
+    userdata = __.cache_import_module( 'agentsmgr.userdata' )
+    source = tmp_path / 'config.toml'
+    target = tmp_path / 'user-config.toml'
+    source.write_text( '[notice]\nhint = false\n', encoding = 'utf-8' )
+    target.write_text(
+        '# Inline table.\nnotice = { nudge = true }\n', encoding = 'utf-8' )
+    assert userdata._merge_settings_file( source, target, simulate = False )
+    merged = tomli.loads(
+        target.read_text( encoding = 'utf-8' ) )
+    assert merged == { 'notice': { 'nudge': True, 'hint': False } }
     assert target.with_suffix( '.toml.backup' ).exists( )
 
+
+def test_180_merge_settings_file_jsonc_preserves_comments( tmp_path ):
+    userdata = __.cache_import_module( 'agentsmgr.userdata' )
+    source = tmp_path / 'opencode.jsonc'
+    target = tmp_path / 'user' / 'opencode.jsonc'
+    source.write_text(
+        '{\n'
+        '  // Template.\n'
+        '  "theme": "dark",\n'
+        '  "mcp": { "remote": { "enabled": true } },\n'
+        '  "tools": { "bash": true },\n'
+        '}\n',
+        encoding = 'utf-8' )
+    target.parent.mkdir( )
+    target.write_text(
+        '{\n'
+        '  /* My settings. */\n'
+        '  "mcp": {\n'
+        '    "local": { "enabled": false },\n'
+        '  },\n'
+        '  "theme": "light" // pinned\n'
+        '}\n',
+        encoding = 'utf-8' )
+    target.chmod( 0o600 )
+    assert userdata._merge_settings_file( source, target, simulate = False )
+    assert target.read_text( encoding = 'utf-8' ) == (
+        '{\n'
+        '  /* My settings. */\n'
+        '  "mcp": {\n'
+        '    "local": { "enabled": false },\n'
+        '    "remote": {\n'
+        '      "enabled": true\n'
+        '    },\n'
+        '  },\n'
+        '  "theme": "light", // pinned\n'
+        '  "tools": {\n'
+        '    "bash": true\n'
+        '  }\n'
+        '}\n' )
+    assert [ path.name for path in target.parent.iterdir( ) ] == [
+        'opencode.jsonc' ]
+    assert target.stat( ).st_mode & 0o777 == 0o600
+    assert not userdata._merge_settings_file(
+        source, target, simulate = False )
+
+
+def test_190_jsonc_loads_tolerates_comments_and_commas( ):
+    exceptions = __.cache_import_module( 'agentsmgr.exceptions' )
+    jsonc = __.cache_import_module( 'agentsmgr.jsonc' )
+    assert jsonc.loads(
+        '// Leading.\n{ "a": [ 1, 2.5, -3e2, ], /* b */ "b": null, }\n'
+    ) == { 'a': [ 1, 2.5, -300.0 ], 'b': None }
+    assert jsonc.loads( '{ "url": "http://example.com/*x*/" }' ) == {
+        'url': 'http://example.com/*x*/' }
+    with pytest.raises( exceptions.JsoncInvalidity ):
+        jsonc.loads( '{ "a": 1 /* unterminated }' )
+    with pytest.raises( exceptions.JsoncInvalidity ):
+        jsonc.loads( '{ "a": 1 } extra' )
+
+
+def test_200_populate_user_wrappers_skips_identical( tmp_path, monkeypatch ):
+    userdata = __.cache_import_module( 'agentsmgr.userdata' )
+    monkeypatch.setenv( 'HOME', str( tmp_path / 'home' ) )
+    general = tmp_path / 'data' / 'per-user' / 'general'
+    general.mkdir( parents = True )
+    script = general / 'claude-zai'
+    script.write_text( '#!/bin/sh\necho zai\n', encoding = 'utf-8' )
+    script.chmod( 0o644 )
+    data = tmp_path / 'data'
+    assert userdata.populate_user_wrappers( data, simulate = True ) == (
+        1, 1 )
+    assert userdata.populate_user_wrappers( data ) == ( 1, 1 )
+    target = tmp_path / 'home' / '.local' / 'bin' / 'claude-zai'
+    assert target.read_text( encoding = 'utf-8' ) == '#!/bin/sh\necho zai\n'
+    assert target.stat( ).st_mode & 0o777 == 0o755
+    inode = target.stat( ).st_ino
+    assert userdata.populate_user_wrappers( data ) == ( 1, 0 )
+    assert target.stat( ).st_ino == inode
+    target.chmod( 0o700 )
+    assert userdata.populate_user_wrappers( data ) == ( 1, 1 )
+    assert target.stat( ).st_mode & 0o777 == 0o755
+    script.write_text( '#!/bin/sh\necho ds\n', encoding = 'utf-8' )
+    assert userdata.populate_user_wrappers( data ) == ( 1, 1 )
+    assert target.read_text( encoding = 'utf-8' ) == '#!/bin/sh\necho ds\n'
+    assert [ entry.name for entry in target.parent.iterdir( ) ] == [
+        'claude-zai' ]
@@ -0,0 +1,101 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Assert correct behavior of Git control directory discovery. '''
+
+
+from . import __
+
+
+def _create_control_directory( location: __.Path ) -> None:
+    location.mkdir( parents = True )
+    ( location / 'HEAD' ).write_text(
+        'ref: refs/heads/main\n', encoding = 'utf-8' )
+
+
+def test_100_discovers_ordinary_repository_from_subdirectory( tmp_path ):
+    module = __.cache_import_module( 'agentsmgr.gitdirs' )
+    project = tmp_path / 'project'
+    _create_control_directory( project / '.git' )
+    nested = project / 'alpha' / 'beta'
+    nested.mkdir( parents = True )
+    directories = module.discover_git_directories( nested )
+    assert directories is not None
+    assert directories.worktree == project
+    assert directories.control == project / '.git'
+    assert directories.common == project / '.git'
+
+
+def test_200_discovers_worktree_with_common_directory( tmp_path ):
+    module = __.cache_import_module( 'agentsmgr.gitdirs' )
+    main = tmp_path / 'main'
+    _create_control_directory( main / '.git' )
+    control = main / '.git' / 'worktrees' / 'feature'
+    _create_control_directory( control )
+    ( control / 'commondir' ).write_text( '../..\n', encoding = 'utf-8' )
+    worktree = tmp_path / 'feature'
+    worktree.mkdir( )
+    ( worktree / '.git' ).write_text(
+        'gitdir: ../main/.git/worktrees/feature\n', encoding = 'utf-8' )
+    directories = module.discover_git_directories( worktree )
+    assert directories is not None
+    assert directories.worktree == worktree
+    assert directories.control == control
+    assert directories.common == main / '.git'
+
+
+def test_300_returns_none_outside_repository( tmp_path ):
+    module = __.cache_import_module( 'agentsmgr.gitdirs' )
+    outside = tmp_path / 'outside'
+    outside.mkdir( )
+    ( outside / '.git' ).write_text( 'garbage\n', encoding = 'utf-8' )
+    assert module.discover_git_directories( outside ) is None
+
+
+def test_310_forgets_memoized_discoveries( tmp_path ):
+    module = __.cache_import_module( 'agentsmgr.gitdirs' )
+    project = tmp_path / 'project'
+    project.mkdir( )
+    assert module.discover_git_directories( project ) is None
+    _create_control_directory( project / '.git' )
+    assert module.discover_git_directories( project ) is None
+    module.forget_git_directories( )
+    directories = module.discover_git_directories( project )
+    assert directories is not None
+    assert directories.worktree == project
+
+
+def test_400_resolves_head_commit_from_packed_references( tmp_path ):
+    module = __.cache_import_module( 'agentsmgr.gitdirs' )
+    project = tmp_path / 'project'
+    control = project / '.git'
+    _create_control_directory( control )
+    commit = '0123456789abcdef0123456789abcdef01234567'
+    ( control / 'packed-refs' ).write_text(
+        f"# pack-refs with: peeled\n{commit} refs/heads/main\n",
+        encoding = 'utf-8' )
+    directories = module.discover_git_directories( project )
+    assert directories is not None
+    assert module.resolve_head_commit( directories ) == commit
+    ( control / 'refs' / 'heads' ).mkdir( parents = True )
+    loose = 'fedcba9876543210fedcba9876543210fedcba98'
+    ( control / 'refs' / 'heads' / 'main' ).write_text(
+        f"{loose}\n", encoding = 'utf-8' )
+    assert module.resolve_head_commit( directories ) == loose
@@ -0,0 +1,82 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Assert correct behavior of batched symlink planning. '''
+
+
+from . import __
+
+
+def test_100_plans_create_retain_update_and_conflict( tmp_path ):
+    module = __.cache_import_module( 'agentsmgr.symlinks' )
+    source = tmp_path / 'source'
+    source.mkdir( )
+    ( tmp_path / 'retained' ).symlink_to( 'source' )
+    ( tmp_path / 'stale' ).symlink_to( 'elsewhere' )
+    ( tmp_path / 'occupied' ).mkdir( )
+    intentions = tuple(
+        module.SymlinkIntention( source = source, link = tmp_path / name )
+        for name in ( 'fresh', 'retained', 'stale', 'occupied' ) )
+    plan = module.survey_symlinks( intentions )
+    kinds = tuple( action.kind for action in plan.actions )
+    assert kinds == (
+        module.SymlinkActions.Create,
+        module.SymlinkActions.Retain,
+        module.SymlinkActions.Update,
+        module.SymlinkActions.Conflict,
+    )
+    assert len( plan.changes ) == 2
+    assert len( plan.render_as_markdown( ) ) == 4
+
+
+def test_200_simulated_plan_leaves_filesystem_untouched( tmp_path ):
+    module = __.cache_import_module( 'agentsmgr.symlinks' )
+    source = tmp_path / 'source'
+    source.mkdir( )
+    link = tmp_path / 'nested' / 'link'
+    plan = module.survey_symlinks( (
+        module.SymlinkIntention( source = source, link = link ), ) )
+    assert module.apply_symlink_plan( plan, simulate = True ) == 1
+    assert not link.parent.exists( )
+
+
+def test_300_applies_changes_and_replaces_when_permitted( tmp_path ):
+    module = __.cache_import_module( 'agentsmgr.symlinks' )
+    source = tmp_path / 'source'
+    source.mkdir( )
+    ( tmp_path / 'stale' ).symlink_to( 'elsewhere' )
+    legacy = tmp_path / 'legacy'
+    legacy.mkdir( )
+    ( legacy / 'file.md' ).write_text( 'legacy\n', encoding = 'utf-8' )
+    intentions = (
+        module.SymlinkIntention(
+            source = source, link = tmp_path / 'nested' / 'fresh' ),
+        module.SymlinkIntention( source = source, link = tmp_path / 'stale' ),
+        module.SymlinkIntention(
+            source = source, link = legacy, replace_existing = True ),
+    )
+    plan = module.survey_symlinks( intentions )
+    assert module.apply_symlink_plan( plan ) == 3
+    for intention in intentions:
+        assert intention.link.is_symlink( )
+        assert intention.link.resolve( ) == source.resolve( )
+    replan = module.survey_symlinks( intentions )
+    assert not replan.changes
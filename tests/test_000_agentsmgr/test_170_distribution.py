@@ -513,6 +513,7 @@ def test_800_provide_instructions_false_disables_copy( tmp_path ):
     ''' When provide_instructions is false, _manage_project_auxiliaries
         should not copy instruction files or produce instruction exclude
         entries. '''
+    import asyncio as _asyncio
     population_module = __.cache_import_module( 'agentsmgr.population' )
     location = _distribution_location( )
     target = tmp_path / 'project'
@@ -528,8 +529,8 @@ def test_800_provide_instructions_false_disables_copy( tmp_path ):
         'languages': [ 'python' ],
         'provide_instructions': False,
     }
-    population_module._manage_project_auxiliaries(
-        configuration, location, target, ( ), simulate = False )
+    _asyncio.run( population_module._manage_project_auxiliaries(
+        configuration, location, target, simulate = False ) )
     # Verify no instruction files were copied
     target_standards = target / '.auxiliary' / 'agents' / 'standards'
     assert not target_standards.exists( ) or \
@@ -539,6 +540,7 @@ def test_800_provide_instructions_false_disables_copy( tmp_path ):
 def test_900_instructions_sources_not_consulted( tmp_path ):
     ''' Populate should use distribution/ for instructions, not
         instructions_sources configuration. '''
+    import asyncio as _asyncio
     population_module = __.cache_import_module( 'agentsmgr.population' )
     location = _distribution_location( )
     target = tmp_path / 'project'
@@ -558,8 +560,8 @@ def test_900_instructions_sources_not_consulted( tmp_path ):
             { 'source': 'github:emcd/python-project-common@docs-1' }
         ],
     }
-    population_module._manage_project_auxiliaries(
-        configuration, location, target, ( ), simulate = False )
+    _asyncio.run( population_module._manage_project_auxiliaries(
+        configuration, location, target, simulate = False ) )
     # Verify instructions were copied from distribution/ (local), not network
     target_standards = target / '.auxiliary' / 'agents' / 'standards'
     assert target_standards.exists( )
@@ -569,7 +571,8 @@ def test_900_instructions_sources_not_consulted( tmp_path ):
     source_instructions = (
         location / 'per-project' / 'general' / 'instructions' )
     source_files = list( source_instructions.glob( '*.rst' ) )
-    assert len( copied_files ) == len( source_files )
+    assert { file.name for file in copied_files } == (
+        { file.name for file in source_files } - { 'practices-rust.rst' } )
 
 
 def _init_git_repo( path: Path ) -> bool:
@@ -653,3 +656,172 @@ def test_500_populate_uses_explicit_target( tmp_path ):
     assert any(
         entry.endswith( 'agents/skills' ) or '/skills/' in entry
         for entry in exclude_entries )
+
+
+def test_950_populate_projects_records_per_target_outcomes( tmp_path ):
+    ''' Fleet populate should expand globs, populate each configured
+        project, and record failures without aborting other projects. '''
+    import asyncio as _asyncio
+    population_module = __.cache_import_module( 'agentsmgr.population' )
+    location = _distribution_location( )
+    configured = tuple(
+        tmp_path / f'project-{index}' for index in range( 2 ) )
+    for target in configured:
+        target.mkdir( )
+        _init_git_repo( target )
+        _create_agents_answers_file( target )
+    unconfigured = tmp_path / 'project-x'
+    unconfigured.mkdir( )
+    targets = population_module._expand_population_targets(
+        ( str( tmp_path / 'project-*' ), str( configured[ 0 ] ) ) )
+    assert targets == ( *configured, unconfigured )
+    outcomes = _asyncio.run( population_module._populate_projects(
+        location, targets, simulate = False, jobs = 2 ) )
+    assert tuple( outcome.target for outcome in outcomes ) == targets
+    for outcome in outcomes[ : 2 ]:
+        assert outcome.error is None
+        assert outcome.items_generated > 0
+        assert ( outcome.target / '.claude' ).is_symlink( )
+    assert outcomes[ 2 ].error is not None
+
+
+def test_955_populate_projects_skips_projects_without_coders( tmp_path ):
+    ''' Fleet populate should skip, not fail, projects without
+        per-project default coders. '''
+    import asyncio as _asyncio
+    population_module = __.cache_import_module( 'agentsmgr.population' )
+    target = tmp_path / 'project'
+    target.mkdir( )
+    _init_git_repo( target )
+    _create_agents_answers_file( target )
+    answers = (
+        target / '.auxiliary' / 'configuration'
+        / 'copier-answers--agents.yaml' )
+    answers.write_text(
+        answers.read_text( encoding = 'utf-8' )
+        .replace( '- claude\n- opencode\n', '- unknown\n' ),
+        encoding = 'utf-8' )
+    outcomes = _asyncio.run( population_module._populate_projects(
+        _distribution_location( ), ( target, ),
+        simulate = False, jobs = 1 ) )
+    assert outcomes[ 0 ].error is None
+    assert outcomes[ 0 ].skipped == 'no per-project default coders'
+    assert not ( target / '.claude' ).exists( )
+
+
+def test_960_populate_all_resolves_source_once( tmp_path, monkeypatch ):
+    ''' populate all should resolve the data source once and validate
+        per-project and per-user structure before populating. '''
+    import asyncio as _asyncio
+    import contextlib as _contextlib
+    cli_module = __.cache_import_module( 'agentsmgr.cli' )
+    cmdbase_module = __.cache_import_module( 'agentsmgr.cmdbase' )
+    resolve_original = cmdbase_module.retrieve_data_location
+    resolutions: list[ str ] = [ ]
+    def resolve( source_spec, *posargs, **nomargs ):
+        resolutions.append( source_spec )
+        return resolve_original( source_spec, *posargs, **nomargs )
+    monkeypatch.setattr( cmdbase_module, 'retrieve_data_location', resolve )
+    target = tmp_path / 'project'
+    target.mkdir( )
+    _init_git_repo( target )
+    _create_agents_answers_file( target )
+    distribution = _distribution_location( )
+    async def run_application( ) -> None:
+        application = tyro.cli(
+            cli_module.Application,
+            args = [
+                '--display.no-colorize',
+                'populate', 'all', str( distribution ), str( target ),
+            ],
+        )
+        async with _contextlib.AsyncExitStack( ) as exits:
+            auxdata = await application.prepare( exits )
+            await application.execute( auxdata )
+    _asyncio.run( run_application( ) )
+    assert resolutions == [ str( distribution ) ]
+    assert ( target / '.claude' ).is_symlink( )
+
+
+def test_970_instructions_filtered_by_languages( tmp_path ):
+    ''' Instruction copy should keep only language-relevant files and
+        remove previously copied irrelevant ones. '''
+    population_module = __.cache_import_module( 'agentsmgr.population' )
+    location = _distribution_location( )
+    target = tmp_path / 'project'
+    standards = target / '.auxiliary' / 'agents' / 'standards'
+    def copy( languages ):
+        return population_module._copy_instructions_from_distribution(
+            location, target, '.auxiliary/agents/standards',
+            simulate = False, languages = languages )
+    copy( ( 'python', 'rust' ) )
+    assert ( standards / 'practices-rust.rst' ).exists( )
+    _, _, entries = copy( ( 'rust', ) )
+    assert not ( standards / 'practices-python.rst' ).exists( )
+    assert not ( standards / 'python-autoformat.rst' ).exists( )
+    assert ( standards / 'practices-rust.rst' ).exists( )
+    assert ( standards / 'practices-toml.rst' ).exists( )
+    assert ( standards / 'practices.rst' ).exists( )
+    assert not ( standards / 'languages.toml' ).exists( )
+    assert '.auxiliary/agents/standards/practices-python.rst' not in entries
+
+
+def test_980_populate_stages_overlap_under_timings( tmp_path ):
+    ''' Populate stages should run in worker threads and record spans
+        beneath the span open where they were offloaded. '''
+    import asyncio as _asyncio
+    population_module = __.cache_import_module( 'agentsmgr.population' )
+    timings = __.cache_import_module( 'agentsmgr.timings' )
+    target = tmp_path / 'project'
+    target.mkdir( )
+    _init_git_repo( target )
+    _create_agents_answers_file( target )
+    configuration = {
+        'coders': [ 'claude' ],
+        'languages': [ 'python' ],
+        'provide_instructions': True,
+    }
+    with timings.recording( ) as recorder, timings.span( 'populate' ):
+        items = _asyncio.run( population_module._populate_project_content(
+            _distribution_location( ), target, configuration, False ) )
+    assert items > 0
+    assert ( target / '.claude' ).is_symlink( )
+    paths = { record.path for record in recorder.records }
+    assert {
+        ( 'populate', 'copy-distribution', 'claude' ),
+        ( 'populate', 'copy-distribution', 'copy-skills' ),
+        ( 'populate', 'project-auxiliaries', 'instructions' ),
+        ( 'populate', 'project-auxiliaries', 'symlinks' ),
+        ( 'populate', 'project-auxiliaries', 'git-exclude-discovery' ),
+        ( 'populate', 'git-exclude' ),
+    } <= paths
+    main = next(
+        record for record in recorder.records
+        if record.path == ( 'populate', ) )
+    assert any( record.thread != main.thread for record in recorder.records )
+
+
+def test_990_populate_stage_failure_awaits_siblings(
+    tmp_path, monkeypatch
+):
+    ''' A failing populate stage should propagate only after sibling
+        stages finish, leaving no work running in the background. '''
+    import asyncio as _asyncio
+    population_module = __.cache_import_module( 'agentsmgr.population' )
+    target = tmp_path / 'project'
+    target.mkdir( )
+    def fail( *posargs, **nomargs ):
+        raise OSError( 'symlinks unavailable' )
+    monkeypatch.setattr( population_module, '_create_all_symlinks', fail )
+    configuration = {
+        'coders': [ 'claude' ],
+        'languages': [ 'python' ],
+        'provide_instructions': True,
+    }
+    with pytest.raises( OSError, match = 'symlinks unavailable' ):
+        _asyncio.run( population_module._populate_project_content(
+            _distribution_location( ), target, configuration, False ) )
+    assert ( target / '.auxiliary' / 'agents' / 'standards' ).is_dir( )
+    assert any(
+        ( target / '.auxiliary' / 'configuration' / 'coders' / 'claude' )
+        .rglob( '*.md' ) )
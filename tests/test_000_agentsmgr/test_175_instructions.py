@@ -0,0 +1,175 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Assert correct behavior of instruction population from sources. '''
+
+
+import asyncio
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from . import __
+
+
+def _create_source( location: __.Path, files: dict[ str, str ] ) -> None:
+    location.mkdir( parents = True )
+    for name, content in files.items( ):
+        ( location / name ).write_text( content, encoding = 'utf-8' )
+
+
+def test_100_later_sources_take_precedence( tmp_path ):
+    module = __.cache_import_module( 'agentsmgr.instructions' )
+    first = tmp_path / 'first'
+    second = tmp_path / 'second'
+    _create_source( first, { 'a.rst': 'first a\n', 'b.rst': 'first b\n' } )
+    _create_source( second, { 'a.rst': 'second a\n' } )
+    target = tmp_path / 'target'
+    configuration = (
+        { 'source': str( first ) },
+        { 'source': str( tmp_path / 'absent' ) },
+        { 'source': str( second ) },
+    )
+    attempted, written = asyncio.run( module.populate_instructions(
+        configuration, target, concurrency = 2 ) )
+    assert ( attempted, written ) == ( 3, 3 )
+    assert ( target / 'a.rst' ).read_text( encoding = 'utf-8' ) == (
+        'second a\n' )
+    assert ( target / 'b.rst' ).read_text( encoding = 'utf-8' ) == (
+        'first b\n' )
+
+
+def test_200_missing_source_field_is_rejected( tmp_path ):
+    module = __.cache_import_module( 'agentsmgr.instructions' )
+    exceptions = __.cache_import_module( 'agentsmgr.exceptions' )
+    with pytest.raises( exceptions.InstructionSourceFieldAbsence ):
+        asyncio.run( module.populate_instructions(
+            ( { 'files': { } }, ), tmp_path ) )
+
+
+def test_300_overlapping_patterns_use_last_match( tmp_path ):
+    module = __.cache_import_module( 'agentsmgr.instructions' )
+    source = tmp_path / 'source'
+    _create_source( source, { 'a.rst': 'header\nbody\n' } )
+    target = tmp_path / 'target'
+    files = { '*.rst': { }, 'a.*': { 'strip_header_lines': 1 } }
+    attempted, written = asyncio.run( module.populate_instructions(
+        ( { 'source': str( source ), 'files': files }, ), target ) )
+    assert ( attempted, written ) == ( 1, 1 )
+    assert ( target / 'a.rst' ).read_text( encoding = 'utf-8' ) == 'body\n'
+
+
+def test_400_reruns_skip_current_targets( tmp_path, monkeypatch ):
+    module = __.cache_import_module( 'agentsmgr.instructions' )
+    productions: list[ str ] = [ ]
+    produce = module._produce_instruction_file
+    def produce_recorded( context, destination, configuration ):
+        productions.append( context.source_file.name )
+        return produce( context, destination, configuration )
+    monkeypatch.setattr(
+        module, '_produce_instruction_file', produce_recorded )
+    source = tmp_path / 'source'
+    _create_source( source, { 'a.rst': 'alpha\n', 'b.rst': 'beta\n' } )
+    target = tmp_path / 'target'
+    cache_location = tmp_path / 'cache'
+    configuration = ( { 'source': str( source ) }, )
+    def populate( ) -> tuple[ int, int ]:
+        return asyncio.run( module.populate_instructions(
+            configuration, target, cache_location = cache_location ) )
+    assert populate( ) == ( 2, 2 )
+    assert any( cache_location.rglob( '*' ) )
+    assert sorted( productions ) == [ 'a.rst', 'b.rst' ]
+    productions.clear( )
+    assert populate( ) == ( 2, 0 )
+    assert not productions
+    ( source / 'b.rst' ).write_text( 'beta revised\n', encoding = 'utf-8' )
+    assert populate( ) == ( 2, 1 )
+    assert productions == [ 'b.rst' ]
+    assert ( target / 'b.rst' ).read_text( encoding = 'utf-8' ) == (
+        'beta revised\n' )
+
+
+def _git( location: __.Path, *arguments: str ) -> None:
+    environment = {
+        **os.environ,
+        'GIT_AUTHOR_NAME': 'Test', 'GIT_AUTHOR_EMAIL': 'test@example.com',
+        'GIT_COMMITTER_NAME': 'Test',
+        'GIT_COMMITTER_EMAIL': 'test@example.com',
+    }
+    subprocess.run(  # noqa: S603
+        [ 'git', '-C', str( location ), *arguments ],  # noqa: S607
+        check = True, capture_output = True, env = environment )
+
+
+@pytest.mark.skipif( shutil.which( 'git' ) is None, reason = 'needs git' )
+def test_410_uncommitted_edits_bypass_cache( tmp_path ):
+    module = __.cache_import_module( 'agentsmgr.instructions' )
+    source = tmp_path / 'source'
+    _create_source( source, { 'a.rst': 'alpha\n', 'b.rst': 'beta\n' } )
+    _git( source, 'init', '--quiet' )
+    _git( source, 'add', '.' )
+    _git( source, 'commit', '--quiet', '--message', 'Initial.' )
+    target = tmp_path / 'target'
+    configuration = ( {
+        'source': str( source ),
+        'files': { '*.rst': { 'strip_header_lines': 0 } } }, )
+    def populate( ) -> tuple[ int, int ]:
+        return asyncio.run( module.populate_instructions(
+            configuration, target, cache_location = tmp_path / 'cache' ) )
+    assert populate( ) == ( 2, 2 )
+    ( source / 'a.rst' ).write_text( 'alpha revised\n', encoding = 'utf-8' )
+    ( source / 'c.txt' ).write_text( 'other\n', encoding = 'utf-8' )
+    _git( source, 'add', 'c.txt' )
+    _git( source, 'status', '--porcelain' )
+    assert populate( ) == ( 2, 1 )
+    assert ( target / 'a.rst' ).read_text( encoding = 'utf-8' ) == (
+        'alpha revised\n' )
+
+
+def test_420_cache_defaults_to_source_data_cache( tmp_path ):
+    module = __.cache_import_module( 'agentsmgr.instructions' )
+    sources = __.cache_import_module( 'agentsmgr.sources' )
+    source = tmp_path / 'source'
+    _create_source( source, { 'a.rst': 'alpha\n' } )
+    configuration = ( { 'source': str( source ) }, )
+    with sources.caching( tmp_path / 'cache' ):
+        asyncio.run( module.populate_instructions(
+            configuration, tmp_path / 'target' ) )
+    assert any( ( tmp_path / 'cache' / 'instructions' ).rglob( '*' ) )
+
+
+def test_310_recursive_patterns_match_source_root( tmp_path ):
+    module = __.cache_import_module( 'agentsmgr.instructions' )
+    source = tmp_path / 'source'
+    _create_source( source, { 'top.rst': 'top\n', 'top.txt': 'text\n' } )
+    ( source / 'nested' ).mkdir( )
+    ( source / 'nested' / 'deep.rst' ).write_text(
+        'deep\n', encoding = 'utf-8' )
+    target = tmp_path / 'target'
+    files = { '**/*.rst': { } }
+    attempted, written = asyncio.run( module.populate_instructions(
+        ( { 'source': str( source ), 'files': files }, ), target ) )
+    assert ( attempted, written ) == ( 2, 2 )
+    assert ( target / 'top.rst' ).is_file( )
+    assert ( target / 'deep.rst' ).is_file( )
+    assert not ( target / 'top.txt' ).exists( )
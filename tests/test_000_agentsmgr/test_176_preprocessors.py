@@ -0,0 +1,83 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Assert correct behavior of streaming instruction preprocessing. '''
+
+
+from . import __
+
+
+def _preprocess( tmp_path, lines, configuration ):
+    module = __.cache_import_module( 'agentsmgr.preprocessors' )
+    context = module.PreprocessingContext(
+        source_file = tmp_path / 'main.rst', source_root = tmp_path )
+    return ''.join( module.preprocess_lines(
+        iter( lines ), configuration, context ) )
+
+
+def test_100_strips_header_lines( tmp_path ):
+    lines = [ 'one\n', 'two\n', 'three\n' ]
+    assert _preprocess(
+        tmp_path, lines, { 'strip_header_lines': 2 } ) == 'three\n'
+    assert _preprocess(
+        tmp_path, lines, { 'strip_header_lines': 5 } ) == ''
+    assert _preprocess(
+        tmp_path, lines, { 'strip_header_lines': 'x' } ) == ''.join( lines )
+
+
+def test_200_expands_includes_within_source( tmp_path ):
+    ( tmp_path / 'part.rst' ).write_text( 'included\n', encoding = 'utf-8' )
+    lines = [
+        'before\n', '.. include:: part.rst\n',
+        '.. include:: ../outside.rst\n', 'after\n' ]
+    assert _preprocess( tmp_path, lines, { 'expand_includes': True } ) == (
+        'before\nincluded\n.. include:: ../outside.rst\nafter\n' )
+
+
+def test_300_filters_language_blocks( tmp_path ):
+    lines = [
+        'common\n',
+        '.. language: python\n', 'python only\n', '.. language: end\n',
+        '.. language: rust\n', 'rust only\n', '.. language: end\n',
+        'tail\n' ]
+    assert _preprocess(
+        tmp_path, lines, { 'filter_languages': [ 'python' ] } ) == (
+        'common\npython only\ntail\n' )
+    for setting in ( True, 3, [ 'python', 1 ] ):
+        assert _preprocess(
+            tmp_path, lines, { 'filter_languages': setting } ) == (
+            ''.join( lines ) )
+
+
+def test_400_normalizes_whitespace( tmp_path ):
+    lines = [ '\n', 'alpha  \n', '\n', ' \n', 'beta\t\n', '\n', 'gamma' ]
+    assert _preprocess(
+        tmp_path, lines, { 'normalize_whitespace': True } ) == (
+        'alpha\n\nbeta\n\ngamma\n' )
+
+
+def test_500_stages_chain_in_registration_order( tmp_path ):
+    module = __.cache_import_module( 'agentsmgr.preprocessors' )
+    assert tuple( module.PREPROCESSORS )[ : 4 ] == (
+        'strip_header_lines', 'expand_includes',
+        'filter_languages', 'normalize_whitespace' )
+    assert not module.is_hermetic( { 'expand_includes': True } )
+    assert module.is_hermetic( { 'strip_header_lines': 1 } )
@@ -30,6 +30,9 @@
 
 import asyncio
 import contextlib
+import hashlib
+import importlib.util
+import json
 import shutil
 import subprocess
 from pathlib import Path
@@ -64,6 +67,17 @@ def _profile_path( name: str ) -> Path:
         / 'tests' / 'data' / 'profiles' / f'answers-{name}.yaml' )
 
 
+def _load_corpus( ):
+    location = (
+        Path( __file__ ).resolve( ).parents[ 1 ] / 'benchmarks' / 'corpus.py' )
+    specification = importlib.util.spec_from_file_location(
+        'corpus', location )
+    assert specification is not None and specification.loader is not None
+    module = importlib.util.module_from_spec( specification )
+    specification.loader.exec_module( module )
+    return module
+
+
 # --- Public option names ---
 
 
@@ -102,6 +116,75 @@ def test_200_default_mode_renders_to_explicit_output( tmp_path ):
     assert any( target.rglob( '*.md' ) )
 
 
+def test_300_ndjson_presentation_streams_item_records( tmp_path ):
+    ''' NDJSON presentation writes one record per written item, then
+        the result record, all to the same target file. '''
+    target = tmp_path / 'distribution'
+    records_file = tmp_path / 'records.ndjson'
+    application = tyro.cli(
+        _cli.Application,
+        args = [
+            '--display.presentation', 'ndjson',
+            '--display.target-file', str( records_file ),
+            'generate',
+            '--source', str( _components_location( ) ),
+            '--output', str( target ),
+        ],
+        config = ( tyro.conf.EnumChoicesFromValues, ) )
+    async def run( ) -> None:
+        async with contextlib.AsyncExitStack( ) as exits:
+            auxdata = await application.prepare( exits )
+            await application.execute( auxdata )
+    asyncio.run( run( ) )
+    records = [
+        json.loads( line ) for line in
+        records_file.read_text( encoding = 'utf-8' ).splitlines( ) ]
+    items = [
+        record for record in records
+        if record[ 'kind' ] == 'item' and record[ 'action' ] == 'written' ]
+    assert items
+    assert records[ -1 ][ 'kind' ] == 'content-generation'
+    assert records[ -1 ][ 'items_generated' ] == len( items )
+    item = items[ 0 ]
+    assert not item[ 'simulated' ]
+    content = Path( item[ 'path' ] ).read_bytes( )
+    assert item[ 'bytes' ] == len( content )
+    digest = hashlib.sha256( content ).hexdigest( )
+    assert item[ 'hash' ] == f"sha256:{digest}"
+
+
+def test_310_check_presents_staleness_result( tmp_path ):
+    ''' generate --check renders staleness as a result, so that JSON
+        presentation carries the diffs rather than raw lines. '''
+    target = tmp_path / 'distribution'
+    _run_application( [
+        '--source', str( _components_location( ) ),
+        '--output', str( target ) ] )
+    ( target / 'per-project' / 'coders' / 'claude' / 'commands'
+      / 'cs-code-python.md' ).unlink( )
+    output = tmp_path / 'check.json'
+    application = tyro.cli(
+        _cli.Application,
+        args = [
+            '--display.presentation', 'json',
+            '--display.target-file', str( output ),
+            'generate',
+            '--source', str( _components_location( ) ),
+            '--output', str( target ),
+            '--check',
+        ],
+        config = ( tyro.conf.EnumChoicesFromValues, ) )
+    async def run( ) -> None:
+        async with contextlib.AsyncExitStack( ) as exits:
+            auxdata = await application.prepare( exits )
+            await application.execute( auxdata )
+    with pytest.raises( SystemExit ): asyncio.run( run( ) )
+    data = json.loads( output.read_text( encoding = 'utf-8' ) )
+    assert data[ 'kind' ] == 'distribution-staleness'
+    assert not data[ 'current' ]
+    assert any( 'missing' in diff for diff in data[ 'diffs' ] )
+
+
 # --- Answers-file mode ---
 
 
@@ -152,3 +235,36 @@ def test_430_answers_file_requires_output( tmp_path ):
     assert isinstance(
         info.value.__context__, _exceptions.ConfigurationInvalidity )
     assert 'requires' in str( info.value.__context__ ).lower()
+
+
+# --- Synthetic corpus ---
+
+
+def test_500_synthetic_corpus_renders_reproducibly( tmp_path ):
+    ''' Synthesized components render and check as current, and equal
+        seeds synthesize identical trees. '''
+    corpus = _load_corpus( )
+    specification = corpus.CorpusSpecification(
+        commands = 12, agents = 3, skills = 2, asset_size = 64, seed = 7 )
+    names = corpus.synthesize_components(
+        tmp_path / 'first', specification )
+    corpus.synthesize_components( tmp_path / 'second', specification )
+    def survey( root: Path ) -> dict[ Path, bytes ]:
+        return {
+            path.relative_to( root ): path.read_bytes( )
+            for path in root.rglob( '*' ) if path.is_file( ) }
+    assert survey( tmp_path / 'first' ) == survey( tmp_path / 'second' )
+    assert len( names ) == 15
+    target = tmp_path / 'distribution'
+    _run_application( [
+        '--source', str( tmp_path / 'first' ), '--output', str( target ) ] )
+    _run_application( [
+        '--source', str( tmp_path / 'first' ), '--output', str( target ),
+        '--check' ] )
+    rendered = { path.stem for path in target.rglob( '*.md' ) }
+    assert set( names ) <= rendered
+    skills = corpus.synthesize_skills( target, specification )
+    asset = (
+        target / 'per-project' / 'general' / 'skills' / skills[ 0 ]
+        / 'assets' / 'asset-00.bin' )
+    assert asset.stat( ).st_size == 64
@@ -0,0 +1,204 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Assert correct behavior of Claude statusline script. '''
+
+
+import importlib.util
+import os
+
+from pathlib import Path
+
+import pytest
+
+
+def _load_statusline( ):
+    location = (
+        Path( __file__ ).resolve( ).parents[ 2 ] / 'distribution'
+        / 'per-user' / 'coders' / 'claude' / 'statusline.py' )
+    specification = importlib.util.spec_from_file_location(
+        'statusline', location )
+    assert specification is not None and specification.loader is not None
+    module = importlib.util.module_from_spec( specification )
+    specification.loader.exec_module( module )
+    return module
+
+
+def _make_repository( location: Path, branch: str ) -> Path:
+    git_directory = location / '.git'
+    git_directory.mkdir( parents = True )
+    ( git_directory / 'HEAD' ).write_text(
+        f"ref: refs/heads/{branch}\n", encoding = 'utf-8' )
+    return git_directory
+
+
+def test_100_git_cache_serves_and_invalidates( tmp_path, monkeypatch ):
+    statusline = _load_statusline( )
+    monkeypatch.setenv( 'XDG_RUNTIME_DIR', str( tmp_path / 'runtime' ) )
+    ( tmp_path / 'runtime' ).mkdir( )
+    git_directory = _make_repository( tmp_path / 'repo', 'main' )
+    cwd = tmp_path / 'repo' / 'sub'
+    cwd.mkdir( )
+    assert statusline._detect_git_branch( str( cwd ) ) == 'main'
+    cache_file = tmp_path / 'runtime' / 'agentsmgr' / 'statusline-git.json'
+    assert cache_file.exists( )
+    surveys: list[ str ] = [ ]
+    survey = statusline._survey_git_branch
+    def survey_counted( cwd_: str ):
+        surveys.append( cwd_ )
+        return survey( cwd_ )
+    monkeypatch.setattr( statusline, '_survey_git_branch', survey_counted )
+    assert statusline._detect_git_branch( str( cwd ) ) == 'main'
+    assert not surveys
+    head = git_directory / 'HEAD'
+    head.write_text( 'ref: refs/heads/feature\n', encoding = 'utf-8' )
+    status = head.stat( )
+    os.utime(
+        head, ns = ( status.st_atime_ns, status.st_mtime_ns + 1_000_000 ) )
+    assert statusline._detect_git_branch( str( cwd ) ) == 'feature'
+    assert surveys == [ str( cwd ) ]
+
+
+def test_110_git_cache_ignores_foreign_directory( tmp_path, monkeypatch ):
+    statusline = _load_statusline( )
+    monkeypatch.setenv( 'XDG_RUNTIME_DIR', str( tmp_path / 'runtime' ) )
+    ( tmp_path / 'runtime' / 'agentsmgr' ).mkdir( parents = True )
+    monkeypatch.setattr( statusline._os, 'getuid', lambda: -1 )
+    assert statusline._locate_git_cache_file( ) is None
+    _make_repository( tmp_path / 'repo', 'main' )
+    assert statusline._detect_git_branch( str( tmp_path / 'repo' ) ) == 'main'
+
+
+def test_120_git_cache_remembers_directories_outside_repository(
+    tmp_path, monkeypatch
+):
+    statusline = _load_statusline( )
+    monkeypatch.setenv( 'XDG_RUNTIME_DIR', str( tmp_path / 'runtime' ) )
+    ( tmp_path / 'runtime' ).mkdir( )
+    project = tmp_path / 'project'
+    cwd = project / 'sub'
+    cwd.mkdir( parents = True )
+    assert statusline._detect_git_branch( str( cwd ) ) is None
+    surveys: list[ str ] = [ ]
+    survey = statusline._survey_git_branch
+    def survey_counted( cwd_: str ):
+        surveys.append( cwd_ )
+        return survey( cwd_ )
+    monkeypatch.setattr( statusline, '_survey_git_branch', survey_counted )
+    assert statusline._detect_git_branch( str( cwd ) ) is None
+    assert not surveys
+    _make_repository( project, 'main' )
+    status = project.stat( )
+    os.utime(
+        project, ns = ( status.st_atime_ns, status.st_mtime_ns + 1_000_000 ) )
+    assert statusline._detect_git_branch( str( cwd ) ) == 'main'
+    assert surveys == [ str( cwd ) ]
+
+
+def test_200_parse_json_matches_standard_decoder( ):
+    import json
+    statusline = _load_statusline( )
+    text = (
+        ' {"cwd": "/tmp/\\u00e9", "context_window": {"used_percentage": '
+        '41.5, "tokens": [1, -2e3, null, true, false]}, "model": {}} \n' )
+    assert statusline._parse_json( text ) == json.loads( text )
+    with pytest.raises( ValueError ):
+        statusline._parse_json( 'x' )
+
+
+def test_205_render_json_round_trips( ):
+    import json
+    statusline = _load_statusline( )
+    value = {
+        '/work/"quoted"\\é\udcff\n': {
+            'ancestors': [ [ '/work', 12 ] ], 'branch': None },
+        '/repo': { 'branch': 'main', 'head_mtime': -3 },
+    }
+    text = statusline._render_json( value )
+    assert json.loads( text ) == value
+    assert statusline._parse_json( text ) == value
+    with pytest.raises( TypeError ):
+        statusline._render_json( 1.5 )
+
+
+def test_210_startup_imports_are_minimal( tmp_path ):
+    import subprocess
+    import sys
+    location = (
+        Path( __file__ ).resolve( ).parents[ 2 ] / 'distribution'
+        / 'per-user' / 'coders' / 'claude' / 'statusline.py' )
+    environment = dict(
+        os.environ, PYTHONIOENCODING = 'utf-8',
+        XDG_RUNTIME_DIR = str( tmp_path ) )
+    repository = tmp_path / 'repo'
+    _make_repository( repository, 'main' )
+    # Cache misses, in and out of repository, write the cache file.
+    for cwd in ( tmp_path, repository ):
+        completion = subprocess.run(  # noqa: S603
+            [ sys.executable, '-S', '-X', 'importtime', str( location ) ],
+            input = f'{{"cwd": "{cwd}"}}', capture_output = True,
+            text = True, env = environment, check = True )
+        assert completion.stdout.startswith( '📁 ' )
+        imported = {
+            line.rsplit( '|', 1 )[ -1 ].strip( )
+            for line in completion.stderr.splitlines( )
+            if line.startswith( 'import time:' ) }
+        assert not imported & { 'json', 'pathlib', 're', 'typing' }
+    assert ( tmp_path / 'agentsmgr' / 'statusline-git.json' ).exists( )
+
+
+def test_300_daemon_answers_forwarded_requests( tmp_path, monkeypatch ):
+    import subprocess
+    import sys
+    import time
+    statusline = _load_statusline( )
+    monkeypatch.setenv( 'XDG_RUNTIME_DIR', str( tmp_path ) )
+    request = '{"cwd": "/", "context_window": {"used_percentage": 40}}'
+    assert statusline._request_status( request ) is None
+    location = (
+        Path( __file__ ).resolve( ).parents[ 2 ] / 'distribution'
+        / 'per-user' / 'coders' / 'claude' / 'statusline.py' )
+    environment = dict( os.environ, PYTHONIOENCODING = 'utf-8' )
+    daemon = subprocess.Popen(  # noqa: S603
+        [ sys.executable, str( location ), '--serve' ], env = environment )
+    try:
+        socket_path = tmp_path / 'agentsmgr' / 'statusline.sock'
+        for _ in range( 100 ):
+            if socket_path.exists( ): break
+            time.sleep( 0.05 )
+        monkeypatch.setenv( 'CLAUDE_AUTOCOMPACT_PCT_OVERRIDE', '50' )
+        assert statusline._request_status( request ) == '📁 / | 🔴 80%'
+        assert statusline._request_status( 'x' ).startswith( '⚠️' )
+    finally:
+        daemon.terminate( )
+        daemon.wait( timeout = 5 )
+    assert not socket_path.exists( )
+
+
+def test_310_platforms_without_unix_sockets( tmp_path, monkeypatch ):
+    import _socket
+    import socket
+    statusline = _load_statusline( )
+    monkeypatch.setenv( 'XDG_RUNTIME_DIR', str( tmp_path ) )
+    monkeypatch.delattr( _socket, 'AF_UNIX', raising = False )
+    monkeypatch.delattr( socket, 'AF_UNIX', raising = False )
+    assert statusline._request_status( '{}' ) is None
+    with pytest.raises( RuntimeError, match = 'unsupported on this platform' ):
+        statusline._serve( )
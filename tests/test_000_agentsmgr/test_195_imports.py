@@ -0,0 +1,99 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and      #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Assert that costly dependencies are imported only when needed.
+
+    Agentsmgr runs from hooks and scripts, where cold start dominates the
+    wall time of no-op runs.
+'''
+
+
+import subprocess
+import sys
+
+import pytest
+
+from . import __
+
+
+_DEFERRED_MODULES = frozenset( ( 'dulwich', 'jinja2', 'toml', 'yaml' ) )
+_DEFERRED_PACKAGE_MODULES = frozenset( (
+    'agentsmgr.jsonc',
+    'agentsmgr.server',
+    'agentsmgr.sources.git',
+    'agentsmgr.sources.webapi',
+    'agentsmgr.tomledits',
+) )
+_PACKAGE_DEFERRED_MODULES = frozenset( (
+    'agentsmgr.server', 'dulwich', 'http.client', 'jinja2', 'tomli_w' ) )
+
+
+def _survey_imports( program: str ) -> dict[ str, int ]:
+    ''' Runs program in fresh interpreter; returns self times of imports. '''
+    result = subprocess.run(  # noqa: S603
+        [ sys.executable, '-X', 'importtime', '-c', program ],
+        capture_output = True, text = True, check = True )
+    times: dict[ str, int ] = { }
+    for line in result.stderr.splitlines( ):
+        if not line.startswith( 'import time:' ): continue
+        fields = line[ len( 'import time:' ): ].split( '|' )
+        if not fields[ 0 ].strip( ).isdigit( ): continue
+        times[ fields[ 2 ].strip( ) ] = int( fields[ 0 ] )
+    return times
+
+
+def test_100_cli_import_defers_costly_dependencies( ):
+    times = _survey_imports( 'import agentsmgr.cli' )
+    assert 'agentsmgr.cli' in times
+    roots = { name.split( '.', 1 )[ 0 ] for name in times }
+    assert not roots & _DEFERRED_MODULES
+    assert not _DEFERRED_PACKAGE_MODULES & times.keys( )
+    assert 'http.client' not in times
+
+
+def test_105_package_import_defers_costly_dependencies( ):
+    program = (
+        'import sys, agentsmgr; '
+        f'print( *sorted( {sorted( _PACKAGE_DEFERRED_MODULES )!r} '
+        '& sys.modules.keys( ) ) )' )
+    result = subprocess.run(  # noqa: S603
+        [ sys.executable, '-c', program ],
+        capture_output = True, text = True, check = True )
+    assert not result.stdout.strip( )
+
+
+def test_110_local_source_resolution_skips_git_handler( tmp_path ):
+    times = _survey_imports(
+        'import agentsmgr.sources as sources; '
+        f'sources.resolve_source_location( {str( tmp_path )!r} )' )
+    assert 'agentsmgr.sources.local' in times
+    assert 'agentsmgr.sources.git' not in times
+    assert not any( name.startswith( 'dulwich' ) for name in times )
+
+
+def test_120_git_source_scheme_loads_handler_on_demand( ):
+    sources = __.cache_import_module( 'agentsmgr.sources' )
+    base = __.cache_import_module( 'agentsmgr.sources.base' )
+    handler = base._access_source_handler( 'github' )
+    git = __.cache_import_module( 'agentsmgr.sources.git' )
+    assert isinstance( handler, git.GitSourceHandler )
+    assert base._access_source_handler( 'unknown' ) is None
+    with pytest.raises( base.__.DataSourceNoSupport ):
+        sources.resolve_source_location( 'unknown://example' )
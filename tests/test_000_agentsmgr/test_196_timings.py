@@ -0,0 +1,128 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and      #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Assert correct behavior of phase timing spans and counters. '''
+
+
+import asyncio
+import contextlib
+import contextvars
+import json
+import threading
+
+from pathlib import Path
+
+import tyro
+
+from . import __
+
+
+def test_100_spans_and_counters_inactive_without_recording( ):
+    timings = __.cache_import_module( 'agentsmgr.timings' )
+    with timings.span( 'outside' ): timings.count( 'bytes-read', 10 )
+    with timings.recording( ) as recorder: pass
+    assert not recorder.records
+    assert not recorder.counters
+
+
+def test_110_spans_nest_and_accumulate_counters( ):
+    timings = __.cache_import_module( 'agentsmgr.timings' )
+    with timings.recording( ) as recorder, timings.span( 'outer' ):
+        timings.count( 'files-skipped' )
+        for _ in range( 3 ):
+            with timings.span( 'inner' ): timings.count( 'bytes-read', 5 )
+    paths = sorted( record.path for record in recorder.records )
+    assert paths == [
+        ( 'outer', ), ( 'outer', 'inner' ), ( 'outer', 'inner' ),
+        ( 'outer', 'inner' ) ]
+    outer = next(
+        record for record in recorder.records if record.path == ( 'outer', ) )
+    assert dict( outer.counters ) == { 'bytes-read': 15, 'files-skipped': 1 }
+    assert recorder.counters == { 'bytes-read': 15, 'files-skipped': 1 }
+    lines = recorder.render_as_text( )
+    assert lines[ 0 ].startswith( 'outer' )
+    assert lines[ 1 ].startswith( '  inner (x3)' )
+    assert 'bytes-read=15' in lines[ 1 ]
+
+
+def test_120_spans_nest_per_thread( ):
+    timings = __.cache_import_module( 'agentsmgr.timings' )
+    def work( ) -> None:
+        with timings.span( 'worker' ): pass
+    with timings.recording( ) as recorder, timings.span( 'main' ):
+        context = contextvars.copy_context( )
+        worker = threading.Thread( target = context.run, args = ( work, ) )
+        worker.start( )
+        worker.join( )
+    assert sorted( record.path for record in recorder.records ) == [
+        ( 'main', ), ( 'worker', ) ]
+
+
+def test_200_timings_exports( ):
+    timings = __.cache_import_module( 'agentsmgr.timings' )
+    with timings.recording( ) as recorder, timings.span( 'phase' ):
+        timings.count( 'cache-hits' )
+    data = json.loads( json.dumps( recorder.render_as_json( ) ) )
+    assert data[ 'counters' ] == { 'cache-hits': 1 }
+    assert data[ 'spans' ][ 0 ][ 'name' ] == 'phase'
+    trace = recorder.render_as_chrome_trace( )
+    event = trace[ 'traceEvents' ][ 0 ]
+    assert event[ 'ph' ] == 'X'
+    assert event[ 'name' ] == 'phase'
+    assert event[ 'args' ] == { 'cache-hits': 1 }
+
+
+def test_300_cli_writes_timings_file( tmp_path: Path ):
+    cli = __.cache_import_module( 'agentsmgr.cli' )
+    components = Path( __file__ ).resolve( ).parents[ 2 ] / 'components'
+    timings_file = tmp_path / 'timings.json'
+    application = tyro.cli( cli.Application, args = [
+        '--timings-file', str( timings_file ),
+        '--display.no-colorize', 'generate',
+        '--source', str( components ), '--output', str( tmp_path / 'out' ),
+    ] )
+    async def run( ) -> None:
+        async with contextlib.AsyncExitStack( ) as exits:
+            auxdata = await application.prepare( exits )
+            await application.execute( auxdata )
+    asyncio.run( run( ) )
+    data = json.loads( timings_file.read_text( encoding = 'utf-8' ) )
+    names = { span[ 'name' ] for span in data[ 'spans' ] }
+    assert { 'command', 'command/generate' } <= names
+    assert 'command/generate/claude/commands/render' in names
+    assert data[ 'counters' ][ 'files-written' ] > 0
+
+
+def test_130_adopted_path_nests_worker_spans( ):
+    timings = __.cache_import_module( 'agentsmgr.timings' )
+    assert timings.locate( ) == ( )
+    def work( path: tuple[ str, ... ] ) -> None:
+        with timings.adopting( path ), timings.span( 'worker' ): pass
+        with timings.span( 'after' ): pass
+    with timings.recording( ) as recorder, timings.span( 'main' ):
+        assert timings.locate( ) == ( 'main', )
+        context = contextvars.copy_context( )
+        worker = threading.Thread(
+            target = context.run, args = ( work, timings.locate( ) ) )
+        worker.start( )
+        worker.join( )
+    assert sorted( record.path for record in recorder.records ) == [
+        ( 'after', ), ( 'main', ), ( 'main', 'worker' ) ]
@@ -0,0 +1,80 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and      #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Assert correct behavior of built-in command profiling. '''
+
+
+import asyncio
+import contextlib
+import logging
+import pstats
+
+from pathlib import Path
+
+import pytest
+import tyro
+
+from . import __
+
+
+@pytest.fixture
+def detaching_log_handlers( ):
+    # Application preparation attaches a root handler to the current
+    # standard error, which capsys closes after the test.
+    root = logging.getLogger( )
+    handlers = tuple( root.handlers )
+    try: yield
+    finally:
+        for handler in tuple( root.handlers ):
+            if handler not in handlers: root.removeHandler( handler )
+
+
+def test_100_profiling_writes_statistics_and_summary( tmp_path, capsys ):
+    profiling = __.cache_import_module( 'agentsmgr.profiling' )
+    location = tmp_path / 'sample.prof'
+    with profiling.profiling( location, entries = 3 ):
+        sorted( range( 1000 ), key = str )
+    captured = capsys.readouterr( )
+    assert 'cumulative' in captured.err
+    assert f"Profile written to {location}" in captured.err
+    assert pstats.Stats( str( location ) ).total_calls > 0
+
+
+def test_200_cli_cprofile_option_profiles_command(
+    tmp_path, capsys, detaching_log_handlers
+):
+    cli = __.cache_import_module( 'agentsmgr.cli' )
+    components = Path( __file__ ).resolve( ).parents[ 2 ] / 'components'
+    location = tmp_path / 'generate.prof'
+    application = tyro.cli( cli.Application, args = [
+        '--cprofile', str( location ), '--cprofile-entries', '5',
+        '--display.no-colorize', 'generate',
+        '--source', str( components ), '--output', str( tmp_path / 'out' ),
+    ] )
+    async def run( ) -> None:
+        async with contextlib.AsyncExitStack( ) as exits:
+            auxdata = await application.prepare( exits )
+            await application.execute( auxdata )
+    asyncio.run( run( ) )
+    statistics = pstats.Stats( str( location ) )
+    functions = { function for _, _, function in statistics.stats }
+    assert 'generate_distribution' in functions
+    assert 'List reduced' in capsys.readouterr( ).err
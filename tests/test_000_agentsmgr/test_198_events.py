@@ -0,0 +1,140 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and      #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Assert correct behavior of typed events and their receivers. '''
+
+
+import asyncio
+import contextlib
+import hashlib
+import io
+import json
+
+from pathlib import Path
+
+import tyro
+
+from . import __
+
+
+def test_100_emission_inert_without_receivers( ):
+    events = __.cache_import_module( 'agentsmgr.events' )
+    # Event is not constructed, so missing fields go unnoticed.
+    events.emit( events.WarningEvent )
+    events.emit_written( Path( 'absent' ), b'content' )
+
+
+def test_110_receivers_nest( ):
+    events = __.cache_import_module( 'agentsmgr.events' )
+    outer: list[ object ] = [ ]
+    inner: list[ object ] = [ ]
+    with events.receiving( outer.append ):
+        events.emit( events.WarningEvent, message = 'first' )
+        with events.receiving( inner.append ):
+            events.emit( events.WarningEvent, message = 'second' )
+    events.emit( events.WarningEvent, message = 'third' )
+    assert [ event.message for event in outer ] == [ 'first', 'second' ]
+    assert [ event.message for event in inner ] == [ 'second' ]
+
+
+def test_120_written_event_measures_content( ):
+    events = __.cache_import_module( 'agentsmgr.events' )
+    received: list[ object ] = [ ]
+    with events.receiving( received.append ):
+        events.emit_written( Path( 'item.md' ), b'content' )
+    record = received[ 0 ].render_as_json( )
+    digest = hashlib.sha256( b'content' ).hexdigest( )
+    assert record == {
+        'kind': 'item', 'action': 'written', 'path': 'item.md',
+        'simulated': False, 'bytes': 7, 'hash': f"sha256:{digest}",
+    }
+
+
+def test_200_manifest_totals_items_and_warnings( ):
+    events = __.cache_import_module( 'agentsmgr.events' )
+    manifest = events.Manifest( )
+    with events.receiving( manifest ):
+        events.emit(
+            events.RenderedEvent, location = Path( 'b.md' ),
+            item_type = 'commands', item_name = 'b', coder = 'claude' )
+        events.emit_written( Path( 'b.md' ), b'b' )
+        events.emit(
+            events.SkippedEvent, location = Path( 'a.md' ),
+            reason = 'current' )
+        events.emit( events.WarningEvent, message = 'careful' )
+    data = manifest.render_as_json( )
+    assert [ item[ 'path' ] for item in data[ 'items' ] ] == [
+        'a.md', 'b.md' ]
+    assert data[ 'totals' ] == { 'skipped': 1, 'written': 1 }
+    assert data[ 'warnings' ] == [ 'careful' ]
+
+
+def test_300_symlink_plan_emits_linked_and_warning_events( tmp_path ):
+    events = __.cache_import_module( 'agentsmgr.events' )
+    symlinks = __.cache_import_module( 'agentsmgr.symlinks' )
+    source = tmp_path / 'source'
+    source.mkdir( )
+    ( tmp_path / 'occupied' ).mkdir( )
+    plan = symlinks.survey_symlinks( tuple(
+        symlinks.SymlinkIntention( source = source, link = tmp_path / name )
+        for name in ( 'fresh', 'occupied' ) ) )
+    received: list[ object ] = [ ]
+    with events.receiving( received.append ):
+        symlinks.apply_symlink_plan( plan, simulate = True )
+    kinds = [ type( event ).__name__ for event in received ]
+    assert kinds == [ 'WarningEvent', 'LinkedEvent' ]
+    assert received[ 1 ].location == tmp_path / 'fresh'
+    assert received[ 1 ].simulated
+
+
+def test_310_progress_display_counts_and_clears( ):
+    core = __.cache_import_module( 'agentsmgr.core' )
+    events = __.cache_import_module( 'agentsmgr.events' )
+    stream = io.StringIO( )
+    display = core.ProgressDisplay( stream, interval = 0.0 )
+    with events.receiving( display ):
+        events.emit_written( Path( 'first.md' ), b'1' )
+        events.emit_written( Path( 'second.md' ), b'2' )
+        events.emit( events.WarningEvent, message = 'ignored' )
+    display.conclude( )
+    assert display.counts == { 'written': 2 }
+    assert 'written 2: second.md' in stream.getvalue( )
+    assert stream.getvalue( ).endswith( '\r\x1b[K' )
+
+
+def test_400_cli_writes_manifest( tmp_path: Path ):
+    cli = __.cache_import_module( 'agentsmgr.cli' )
+    components = Path( __file__ ).resolve( ).parents[ 2 ] / 'components'
+    manifest_file = tmp_path / 'manifest.json'
+    application = tyro.cli( cli.Application, args = [
+        '--manifest', str( manifest_file ), '--progress',
+        '--display.no-colorize', 'generate',
+        '--source', str( components ), '--output', str( tmp_path / 'out' ),
+    ] )
+    async def run( ) -> None:
+        async with contextlib.AsyncExitStack( ) as exits:
+            auxdata = await application.prepare( exits )
+            await application.execute( auxdata )
+    asyncio.run( run( ) )
+    data = json.loads( manifest_file.read_text( encoding = 'utf-8' ) )
+    assert data[ 'totals' ][ 'written' ] == len( data[ 'items' ] )
+    for item in data[ 'items' ]:
+        assert Path( item[ 'path' ] ).stat( ).st_size == item[ 'bytes' ]
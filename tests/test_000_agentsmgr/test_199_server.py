@@ -0,0 +1,160 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and      #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Assert correct behavior of server mode and its warm caches. '''
+
+
+import asyncio
+import json
+import os
+import shutil
+
+from pathlib import Path
+
+from . import __
+
+
+_COMPONENTS = Path( __file__ ).resolve( ).parents[ 2 ] / 'components'
+
+
+def _produce_server( ):
+    server = __.cache_import_module( 'agentsmgr.server' )
+    return server.Server( server.ServerState( { } ) )
+
+
+async def _request( server, method, identifier = 1, **params ):
+    line = json.dumps( {
+        'jsonrpc': '2.0', 'id': identifier,
+        'method': method, 'params': params } )
+    return json.loads( await server.respond( line ) )
+
+
+def test_100_check_reuses_result_until_files_change( tmp_path, monkeypatch ):
+    operations = __.cache_import_module( 'agentsmgr.operations' )
+    components = tmp_path / 'components'
+    shutil.copytree( _COMPONENTS, components )
+    distribution = tmp_path / 'distribution'
+    checks: list[ Path ] = [ ]
+    check = operations.check_distribution_staleness
+    def check_( generator, target ):
+        checks.append( target )
+        return check( generator, target )
+    monkeypatch.setattr( operations, 'check_distribution_staleness', check_ )
+    server = _produce_server( )
+    async def run( ):
+        generated = await _request(
+            server, 'generate',
+            source = str( components ), output = str( distribution ) )
+        assert generated[ 'result' ][ 'items_generated' ] > 0
+        params = dict(
+            source = str( components ), output = str( distribution ) )
+        first = await _request( server, 'check', **params )
+        second = await _request( server, 'check', **params )
+        assert first == second
+        assert first[ 'result' ][ 'current' ]
+        assert len( checks ) == 1
+        artifact = next( distribution.rglob( '*.md' ) )
+        artifact.write_text( 'tampered\n', encoding = 'utf-8' )
+        third = await _request( server, 'check', **params )
+        assert not third[ 'result' ][ 'current' ]
+        assert len( checks ) == 2
+    asyncio.run( run( ) )
+
+
+def test_200_reports_protocol_and_application_errors( tmp_path ):
+    server = _produce_server( )
+    async def run( ):
+        response = json.loads( await server.respond( '{' ) )
+        assert response[ 'error' ][ 'code' ] == -32700
+        response = await _request( server, 'absent' )
+        assert response[ 'error' ][ 'code' ] == -32601
+        response = await _request( server, 'check', bogus = True )
+        assert response[ 'error' ][ 'code' ] == -32602
+        response = await _request(
+            server, 'check', source = str( tmp_path ) )
+        assert response[ 'error' ][ 'code' ] == -32000
+        assert response[ 'error' ][ 'data' ][ 'error' ] == (
+            'DataSourceInvalidity' )
+        notification = json.dumps( { 'jsonrpc': '2.0', 'method': 'absent' } )
+        assert await server.respond( notification ) is None
+    asyncio.run( run( ) )
+
+
+def test_205_rejects_requests_without_string_methods( ):
+    server = _produce_server( )
+    async def run( ):
+        for method in ( [ ], { }, 3, None ):
+            response = await _request( server, method )
+            assert response[ 'error' ][ 'code' ] == -32600
+        response = await _request( server, 'absent' )
+        assert response[ 'error' ][ 'code' ] == -32601
+    asyncio.run( run( ) )
+
+
+def test_206_survives_failures_while_serving( monkeypatch ):
+    server = _produce_server( )
+    def fail( *posargs, **nomargs ):
+        raise RuntimeError( 'unexpected' )
+    monkeypatch.setattr( server, '_validate_request', fail )
+    async def run( ):
+        response = await _request( server, 'check' )
+        assert response[ 'error' ][ 'code' ] == -32603
+        assert response[ 'error' ][ 'message' ] == 'unexpected'
+    asyncio.run( run( ) )
+
+
+def test_210_forgets_git_directories_per_request( tmp_path, monkeypatch ):
+    gitdirs = __.cache_import_module( 'agentsmgr.gitdirs' )
+    forgettings: list[ None ] = [ ]
+    monkeypatch.setattr(
+        gitdirs, 'forget_git_directories',
+        lambda: forgettings.append( None ) )
+    server = _produce_server( )
+    async def run( ):
+        for _ in range( 2 ):
+            await _request( server, 'check', source = str( tmp_path ) )
+    asyncio.run( run( ) )
+    assert len( forgettings ) == 2
+
+
+def test_300_serves_unix_socket_until_shutdown( tmp_path ):
+    server = _produce_server( )
+    # Unix socket paths are limited to about 100 bytes.
+    location = Path( f"/tmp/agentsmgr-test-{os.getpid( )}.socket" )  # noqa: S108
+    async def run( ):
+        serving = asyncio.create_task( server.serve_socket( location ) )
+        while not location.exists( ): await asyncio.sleep( 0.01 )
+        reader, writer = await asyncio.open_unix_connection( str( location ) )
+        writer.write( json.dumps( {
+            'jsonrpc': '2.0', 'id': 7, 'method': 'detect',
+            'params': { 'target': str( tmp_path ) } } ).encode( ) + b'\n' )
+        writer.write( b'{"jsonrpc": "2.0", "id": 8, "method": "shutdown"}\n' )
+        await writer.drain( )
+        detection = json.loads( await reader.readline( ) )
+        shutdown = json.loads( await reader.readline( ) )
+        writer.close( )
+        await asyncio.wait_for( serving, timeout = 5 )
+        return detection, shutdown
+    detection, shutdown = asyncio.run( run( ) )
+    assert detection[ 'id' ] == 7
+    assert detection[ 'error' ][ 'data' ][ 'error' ] == 'ConfigurationAbsence'
+    assert shutdown == { 'jsonrpc': '2.0', 'id': 8, 'result': None }
+    assert not location.exists( )